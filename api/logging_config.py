@@ -6,31 +6,71 @@ Implements:
 - structlog JSON output for production
 - Correlation ID middleware for request tracing
 - Context enrichment for all log messages
+- Optional background writer thread for log output
 
 Spec: P2 Polish - Task 2
 """
 
-import uuid
+import atexit
+import functools
+import json
+import logging
+import logging.handlers
+import queue
+import secrets
 import structlog
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # =============================================================================
 # Structlog Configuration
 # =============================================================================
 
 
-def configure_structured_logging():
+def _orjson_dumps(obj, default=None, **_kwargs) -> str:
+    """
+    Serializer for JSONRenderer, backed by orjson.
+
+    Output is decoded to str because the stdlib logging sink expects text.
+    Non-string dict keys are stringified, as json.dumps does. Unlike
+    json.dumps, NaN/Infinity render as null and datetimes as ISO strings.
+    Events orjson rejects (e.g. ints wider than 64 bits) fall back to
+    json.dumps.
+    """
+    try:
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, default=default)
+
+
+def configure_structured_logging(level: str = "INFO"):
     """
     Configure structlog for production-grade JSON logging.
 
+    Events below level are dropped by the bound logger itself, before any
+    event dict is built or processor runs. The threshold is fixed here:
+    lowering a stdlib logger's level later does not re-enable them, so
+    call this again to change it.
+
+    Args:
+        level: Minimum level name (e.g. "INFO"), usually the LOG_LEVEL setting
+
     Processors:
     - Filter by level
     - Add logger name and log level
     - ISO timestamp
     - Stack traces and exception info
-    - JSON output (machine-readable)
+    - JSON output (machine-readable), serialized with orjson when installed
     """
     structlog.configure(
         processors=[
@@ -42,13 +82,93 @@ def configure_structured_logging():
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),  # JSON for production
+            # JSON for production
+            structlog.processors.JSONRenderer(
+                serializer=_orjson_dumps if ORJSON_AVAILABLE else json.dumps
+            ),
         ],
         context_class=dict,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, level.upper())
+        ),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
+    # Loggers cached under the previous configuration must not outlive it
+    _cached_logger.cache_clear()
+
+
+# =============================================================================
+# Background Log Writer
+# =============================================================================
+
+# Records buffered before the oldest start being dropped
+LOG_QUEUE_MAXSIZE = 10_000
+
+
+def _put_dropping_oldest(log_queue: queue.Queue, item) -> None:
+    """Put item on log_queue, evicting the oldest entry if it is full."""
+    try:
+        log_queue.put_nowait(item)
+    except queue.Full:
+        try:
+            log_queue.get_nowait()
+            log_queue.put_nowait(item)
+        except (queue.Empty, queue.Full):
+            # Another thread won the race; losing this item is fine
+            pass
+
+
+class _DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that evicts the oldest record instead of blocking when full."""
+
+    def enqueue(self, record):
+        _put_dropping_oldest(self.queue, record)
+
+
+class _DropOldestQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() still works when the queue is full."""
+
+    def enqueue_sentinel(self):
+        # The stock put_nowait raises queue.Full, so stop() would never
+        # join the thread and every buffered record would be lost
+        _put_dropping_oldest(self.queue, self._sentinel)
+
+
+def start_background_log_writer(maxsize: int = LOG_QUEUE_MAXSIZE):
+    """
+    Move the root logger's handlers onto a background writer thread.
+
+    structlog renders through stdlib logging, so by default every log line
+    is formatted and written (one write syscall) on the request thread.
+    After this call request threads only enqueue records; a QueueListener
+    thread hands them to the original handlers. When the queue is full the
+    oldest record is dropped, so logging never blocks a request. The queue
+    is drained at interpreter exit, even if it is full at that point.
+
+    Args:
+        maxsize: Maximum number of buffered records
+
+    Returns:
+        The started QueueListener, or None if there were no handlers to
+        move or the writer is already running
+    """
+    root = logging.getLogger()
+    if not root.handlers or any(
+        isinstance(h, logging.handlers.QueueHandler) for h in root.handlers
+    ):
+        return None
+
+    log_queue = queue.Queue(maxsize)
+    listener = _DropOldestQueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [_DropOldestQueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
 
 # =============================================================================
 # Correlation ID Middleware
@@ -63,7 +183,7 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
     1. Extract correlation_id from X-Correlation-ID header (or generate new)
     2. Bind to structlog context (available in all subsequent logs)
     3. Add to response headers
-    4. Clear context after request completes
+    4. Reset the correlation_id binding after request completes
 
     Usage:
         app.add_middleware(CorrelationIDMiddleware)
@@ -80,14 +200,17 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
         Returns:
             Response with X-Correlation-ID header
         """
-        # Get or generate correlation ID
-        correlation_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
+        # Get or generate correlation ID. Callers may send any string, so the
+        # ID is opaque: 128 random bits, hex-encoded, without UUID formatting
+        correlation_id = request.headers.get("X-Correlation-ID")
+        if not correlation_id:
+            correlation_id = secrets.token_hex(16)
 
         # Add to request state (accessible in endpoints)
         request.state.correlation_id = correlation_id
 
         # Bind to structlog context (available in all logs)
-        structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
+        tokens = structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
 
         try:
             # Process request
@@ -98,8 +221,9 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
 
             return response
         finally:
-            # Clean up context after request completes
-            structlog.contextvars.clear_contextvars()
+            # Restore only what this middleware bound; bindings made by
+            # outer layers survive the request
+            structlog.contextvars.reset_contextvars(**tokens)
 
 
 # =============================================================================
@@ -121,4 +245,10 @@ def get_logger(name: str):
         logger = get_logger(__name__)
         logger.info("user_login", user_id=123, correlation_id=request.state.correlation_id)
     """
+    return _cached_logger(name)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_logger(name: str):
+    """One logger proxy per name; per-request state lives in contextvars."""
     return structlog.get_logger(name)
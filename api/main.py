@@ -43,11 +43,10 @@ try:
     from logging_config import (
         configure_structured_logging,
         CorrelationIDMiddleware,
+        start_background_log_writer,
     )
 
-    configure_structured_logging()
     LOGGING_CONFIGURED = True
-    logging.info("✅ Structured logging (structlog) configured successfully")
 except ImportError as e:
     LOGGING_CONFIGURED = False
     logging.warning(f"⚠️ Structured logging not available: {e}")
@@ -131,12 +130,24 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 # Wasserstein Distance Configuration (spec-010)
 WASSERSTEIN_SHIFT_THRESHOLD = float(os.getenv("WASSERSTEIN_SHIFT_THRESHOLD", "0.10"))
 
-# Setup logging
+# Setup logging. force=True: the logging.info calls above already made
+# the root logger fall back to a default WARNING handler
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL.upper()),
     format="%(asctime)s [%(levelname)s] %(message)s",
+    force=True,
 )
 
+# Configured after .env is loaded so structlog and stdlib share LOG_LEVEL
+if LOGGING_CONFIGURED:
+    configure_structured_logging(LOG_LEVEL)
+    logging.info("✅ Structured logging (structlog) configured successfully")
+
+# Write log output from a background thread (opt-in: records still queued at
+# a hard kill are lost)
+if LOGGING_CONFIGURED and os.getenv("LOG_ASYNC_WRITER", "false").lower() == "true":
+    start_background_log_writer()
+
 
 # T064a: Config validation
 def validate_config():
@@ -198,6 +198,19 @@ class BaselineCalculator:
         self.blocks.append({"height": height, "transactions": transactions})
         self.last_block_height = height
 
+    def add_blocks(self, blocks: List[Tuple[List[Tuple[float, float]], int]]):
+        """Add several (transactions, height) blocks to the rolling window.
+
+        Same result as calling add_block for each block in order, with a
+        single deque update.
+        """
+        self.blocks.extend(
+            {"height": height, "transactions": transactions}
+            for transactions, height in blocks
+        )
+        if blocks:
+            self.last_block_height = blocks[-1][1]
+
     def _get_bin_index(self, amount_btc: float) -> int:
         """Find histogram bin index for given BTC amount."""
         if amount_btc <= 0:
@@ -6,14 +6,25 @@ Now implementing to make all 8 tests pass.
 Based on UTXOracle.py Steps 5-11.
 """
 
+import bisect
+import heapq
+import logging
+import random
 import time
 from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
-
-from live.shared.models import ProcessedTransaction, MempoolState, calculate_confidence
+from typing import Dict, List, Optional, Tuple
+
+from live.shared.models import (
+    ProcessedTransaction,
+    MempoolState,
+    TransactionPoint,
+    calculate_confidence,
+)
 from live.backend.baseline_calculator import BaselineResult
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class TransactionRecord:
@@ -43,8 +54,13 @@ class MempoolAnalyzer:
 
         # Transaction tracking
         self.transactions: Dict[str, TransactionRecord] = {}
+        # Min-heap of (timestamp, txid) so cleanup only touches expired
+        # entries; entries for removed/re-added txids are skipped lazily
+        self.expiry_heap: List[Tuple[float, str]] = []
         self.total_received = 0
         self.start_time = time.time()
+        # Uptime uses the monotonic clock so NTP adjustments can't skew it
+        self.start_monotonic = time.monotonic()
 
         # Transaction history for visualization (T067 - User Story 2)
         # Stores (timestamp, price) tuples for Canvas scatter plot
@@ -73,15 +89,8 @@ class MempoolAnalyzer:
         if amount_btc >= self.histogram_bins[-1]:
             return len(self.histogram_bins) - 1
 
-        # Binary search
-        left, right = 0, len(self.histogram_bins) - 1
-        while left < right:
-            mid = (left + right) // 2
-            if self.histogram_bins[mid] < amount_btc:
-                left = mid + 1
-            else:
-                right = mid
-        return left
+        # Binary search (first bin edge >= amount)
+        return bisect.bisect_left(self.histogram_bins, amount_btc)
 
     def add_transaction(self, tx: ProcessedTransaction) -> None:
         """Add transaction to histogram (Step 6)"""
@@ -100,30 +109,24 @@ class MempoolAnalyzer:
             timestamp=tx.timestamp,
             bin_indices=bin_indices,
         )
+        heapq.heappush(self.expiry_heap, (tx.timestamp, tx.txid))
         self.total_received += 1
 
         # T067: Add to transaction history for visualization
         # BUGFIX 2025-10-23: Simple scatter ±8% for mempool visualization
         # (Gemini's round USD heuristic caused clustering - replaced with visible scatter)
-        import random
-
         for amount in tx.amounts:
             if self.last_price_estimate > 0:
                 # Random scatter ±8% around baseline price for visible distribution
                 scatter_factor = 0.92 + random.random() * 0.16  # 0.92-1.08 range
                 tx_price = self.last_price_estimate * scatter_factor
 
-                from live.shared.models import TransactionPoint
-
                 point = TransactionPoint(
                     timestamp=tx.timestamp, price=tx_price, btc_amount=amount
                 )
                 self.transaction_history.append(point)
 
                 # DEBUG: Log scatter price generation
-                import logging
-
-                logger = logging.getLogger(__name__)
                 if len(self.transaction_history) % 100 == 0:  # Log every 100 points
                     logger.debug(
                         f"TX scatter: baseline=${self.last_price_estimate:.0f}, generated=${tx_price:.0f} (factor={scatter_factor:.3f})"
@@ -150,14 +153,15 @@ class MempoolAnalyzer:
             int: Number of transactions removed
         """
         cutoff_time = current_time - self.window_seconds
-        old_txids = [
-            txid
-            for txid, record in self.transactions.items()
-            if record.timestamp < cutoff_time
-        ]
-        for txid in old_txids:
-            self.remove_transaction(txid)
-        return len(old_txids)
+        removed = 0
+        while self.expiry_heap and self.expiry_heap[0][0] < cutoff_time:
+            _, txid = heapq.heappop(self.expiry_heap)
+            record = self.transactions.get(txid)
+            # Skip stale entries (already removed, or re-added later)
+            if record is not None and record.timestamp < cutoff_time:
+                self.remove_transaction(txid)
+                removed += 1
+        return removed
 
     def get_transaction_count(self) -> int:
         """Get number of active transactions"""
@@ -225,9 +229,11 @@ class MempoolAnalyzer:
             stencil[idx] = weight
         return stencil
 
-    def estimate_price(self) -> float:
+    def estimate_price(self, current_time: Optional[float] = None) -> float:
         """Estimate BTC/USD price (Steps 9-11)"""
-        self.cleanup_old_transactions(time.time())
+        if current_time is None:
+            current_time = time.time()
+        self.cleanup_old_transactions(current_time)
 
         if len(self.transactions) < 10:
             # T104: Use baseline price if available
@@ -243,9 +249,6 @@ class MempoolAnalyzer:
             median_price = sorted(recent_prices)[len(recent_prices) // 2]
 
             # DEBUG: Log estimate
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.debug(
                 f"Mempool estimate: median=${median_price:.0f}, scatter_count={len(self.transaction_history)}"
             )
@@ -324,13 +327,11 @@ class MempoolAnalyzer:
 
     def get_state(self) -> MempoolState:
         """Get current mempool state"""
-        current_time = time.time()
-        self.cleanup_old_transactions(current_time)
-
-        price = self.estimate_price()
+        # estimate_price expires old transactions before estimating
+        price = self.estimate_price(time.time())
         active_count = len(self.transactions)
         confidence = calculate_confidence(active_count)
-        uptime = current_time - self.start_time
+        uptime = time.monotonic() - self.start_monotonic
 
         return MempoolState(
             price=price,
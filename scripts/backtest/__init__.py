@@ -41,6 +41,7 @@ from scripts.backtest.metrics import (
 # Data loading
 from scripts.backtest.data_loader import (
     PricePoint,
+    PriceSeries,
     HistoricalData,
     load_historical_data,
     load_from_duckdb,
@@ -74,6 +75,7 @@ __all__ = [
     "calculate_returns",
     # Data
     "PricePoint",
+    "PriceSeries",
     "HistoricalData",
     "load_historical_data",
     "load_from_duckdb",
@@ -4,13 +4,15 @@ Loads historical price and signal data from DuckDB and HTML fallback.
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PricePoint:
     """Single price observation."""
 
@@ -21,6 +23,106 @@ class PricePoint:
     signal_value: Optional[float] = None  # Combined/fusion signal
 
 
+def _none_if_nan(value: float) -> Optional[float]:
+    return None if value != value else value
+
+
+@dataclass(frozen=True, slots=True)
+class PriceSeries:
+    """Time series of price observations as parallel arrays.
+
+    Column-oriented (structure of arrays) counterpart of list[PricePoint].
+    Optional PricePoint fields store None as NaN. Indexing with an int
+    returns a PricePoint; slicing returns a PriceSeries.
+    """
+
+    timestamps: np.ndarray  # object array of datetime
+    utxoracle_price: np.ndarray
+    exchange_price: np.ndarray
+    confidence: np.ndarray
+    signal_value: np.ndarray
+
+    @classmethod
+    def from_pricepoints(cls, prices, dtype=np.float64) -> "PriceSeries":
+        """Build a series from a sequence of PricePoint objects.
+
+        Args:
+            prices: Sequence of PricePoint objects
+            dtype: Float dtype of the value columns (np.float32 halves
+                memory; backtest equity is always accumulated in float64)
+        """
+        timestamps = np.empty(len(prices), dtype=object)
+        timestamps[:] = [p.timestamp for p in prices]
+
+        def column(values: list) -> np.ndarray:
+            return np.array([np.nan if v is None else v for v in values], dtype=dtype)
+
+        return cls(
+            timestamps=timestamps,
+            utxoracle_price=column([p.utxoracle_price for p in prices]),
+            exchange_price=column([p.exchange_price for p in prices]),
+            confidence=column([p.confidence for p in prices]),
+            signal_value=column([p.signal_value for p in prices]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+
+        return PricePoint(
+            timestamp=self.timestamps[index],
+            utxoracle_price=float(self.utxoracle_price[index]),
+            exchange_price=_none_if_nan(float(self.exchange_price[index])),
+            confidence=float(self.confidence[index]),
+            signal_value=_none_if_nan(float(self.signal_value[index])),
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def take(self, indices: np.ndarray) -> "PriceSeries":
+        """Return the rows at the given indices as a new series."""
+        return PriceSeries(
+            timestamps=self.timestamps[indices],
+            utxoracle_price=self.utxoracle_price[indices],
+            exchange_price=self.exchange_price[indices],
+            confidence=self.confidence[indices],
+            signal_value=self.signal_value[indices],
+        )
+
+    def sorted(self) -> "PriceSeries":
+        """Return the series in timestamp order (stable for equal times)."""
+        if np.all(self.timestamps[1:] >= self.timestamps[:-1]):
+            return self
+        order = np.argsort(self.timestamps, kind="stable")
+        return self.take(order)
+
+    def with_signal(self, values, fill: Optional[float] = None) -> "PriceSeries":
+        """Return a copy with a new signal column (price columns are shared).
+
+        Row i takes values[i] (None means no signal). Rows past the end of
+        values keep their current signal, or take fill if given.
+        """
+        if fill is None:
+            signal_value = self.signal_value.copy()
+        else:
+            signal_value = np.full(len(self), fill, dtype=self.signal_value.dtype)
+
+        n = min(len(values), len(self))
+        signal_value[:n] = np.asarray(values[:n], dtype=signal_value.dtype)
+        return replace(self, signal_value=signal_value)
+
+
+def as_price_series(prices) -> PriceSeries:
+    """Return prices as a PriceSeries, converting a PricePoint list if needed."""
+    if isinstance(prices, PriceSeries):
+        return prices
+    return PriceSeries.from_pricepoints(prices)
+
+
 @dataclass
 class HistoricalData:
     """Container for loaded historical data."""
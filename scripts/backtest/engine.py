@@ -8,11 +8,20 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 if TYPE_CHECKING:
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BacktestConfig:
     """Configuration for a backtest run."""
 
@@ -26,7 +35,7 @@ class BacktestConfig:
     initial_capital: float = 10000.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Trade:
     """Single executed trade."""
 
@@ -189,19 +198,145 @@ def calculate_pnl(
     return total_return, equity_curve
 
 
+def _backtest_loop(
+    prices,
+    signals,
+    buy_threshold,
+    sell_threshold,
+    position_size,
+    transaction_cost,
+    initial_capital,
+    entry_idx,
+    exit_idx,
+    direction,
+    pnl_pct,
+    pnl,
+    equity_after,
+):
+    # Bar-by-bar position accounting behind run_backtest. Same rules and
+    # float operation order as get_signal_action/execute_trade; NaN signals
+    # are HOLD. Writes one row per trade into the output buffers (sized to
+    # the number of bars) and returns the trade count.
+    n_bars = len(prices)
+    n_trades = 0
+    equity = initial_capital
+    position = 0  # +1 LONG, -1 SHORT, 0 flat
+    entry = 0
+
+    for i in range(n_bars):
+        signal = signals[i]
+        if signal >= buy_threshold:
+            action = 1
+        elif signal <= sell_threshold:
+            action = -1
+        else:
+            action = 0
+
+        # Close on an opposite signal, or at the end of the backtest
+        if position != 0 and (action == -position or i == n_bars - 1):
+            entry_price = prices[entry]
+            if entry_price <= 0:
+                trade_pct = 0.0
+                trade_pnl = 0.0
+            else:
+                if position == 1:
+                    trade_pct = (prices[i] - entry_price) / entry_price
+                else:
+                    trade_pct = (entry_price - prices[i]) / entry_price
+                trade_pct -= 2 * transaction_cost
+                trade_pnl = equity * position_size * trade_pct
+
+            equity += trade_pnl
+            entry_idx[n_trades] = entry
+            exit_idx[n_trades] = i
+            direction[n_trades] = position
+            pnl_pct[n_trades] = trade_pct
+            pnl[n_trades] = trade_pnl
+            equity_after[n_trades] = equity
+            n_trades += 1
+            position = 0
+
+        if position == 0 and action != 0:
+            position = action
+            entry = i
+
+    return n_trades
+
+
+if NUMBA_AVAILABLE:
+    _backtest_kernel = njit(cache=True)(_backtest_loop)
+else:
+    _backtest_kernel = _backtest_loop
+
+
+def _simulate(prices, config: BacktestConfig) -> tuple[list, ...]:
+    """Run the backtest loop over a time-ordered PriceSeries.
+
+    With numba the compiled kernel runs on the float64 columns; otherwise
+    the same loop runs on plain lists.
+
+    Returns:
+        Tuple of per-trade lists (entry_idx, exit_idx, direction, pnl_pct,
+        pnl, equity_after)
+    """
+    n_bars = len(prices)
+
+    if NUMBA_AVAILABLE:
+        inputs = (prices.utxoracle_price, prices.signal_value)
+        outputs = (
+            np.empty(n_bars, dtype=np.int64),
+            np.empty(n_bars, dtype=np.int64),
+            np.empty(n_bars, dtype=np.int64),
+            np.empty(n_bars, dtype=np.float64),
+            np.empty(n_bars, dtype=np.float64),
+            np.empty(n_bars, dtype=np.float64),
+        )
+    else:
+        inputs = (prices.utxoracle_price.tolist(), prices.signal_value.tolist())
+        outputs = tuple([0] * n_bars for _ in range(6))
+
+    n_trades = _backtest_kernel(
+        *inputs,
+        float(config.buy_threshold),
+        float(config.sell_threshold),
+        float(config.position_size),
+        float(config.transaction_cost),
+        float(config.initial_capital),
+        *outputs,
+    )
+
+    if NUMBA_AVAILABLE:
+        return tuple(out[:n_trades].tolist() for out in outputs)
+    return tuple(out[:n_trades] for out in outputs)
+
+
+def _is_inert(signals: np.ndarray, config: BacktestConfig) -> bool:
+    """True when no signal reaches either threshold, so nothing can trade.
+
+    NaN signals are HOLD and are ignored by fmax/fmin. The extremes are
+    compared as float64, like the backtest loop does.
+    """
+    highest = float(np.fmax.reduce(signals, initial=-np.inf))
+    lowest = float(np.fmin.reduce(signals, initial=np.inf))
+    return highest < config.buy_threshold and lowest > config.sell_threshold
+
+
 def run_backtest(
     config: BacktestConfig,
-    prices: Optional[list] = None,  # List[PricePoint]
+    prices: Optional[list] = None,  # List[PricePoint] or PriceSeries
 ) -> BacktestResult:
     """Execute backtest simulation.
 
     Args:
         config: Backtest configuration
-        prices: Optional list of PricePoint objects. If None, loads from data sources.
+        prices: Optional list of PricePoint objects or a PriceSeries.
+            If None, loads from data sources.
 
     Returns:
         BacktestResult with trades, metrics, and equity curve
     """
+    from scripts.backtest.data_loader import as_price_series
+
     # Load prices if not provided
     if prices is None:
         from scripts.backtest.data_loader import load_historical_data
@@ -209,69 +344,40 @@ def run_backtest(
         data = load_historical_data(config.start_date, config.end_date)
         prices = data.prices
 
-    if not prices:
+    if not len(prices):
         return BacktestResult(config=config)
 
     # Sort prices by timestamp
-    prices = sorted(prices, key=lambda p: p.timestamp)
+    series = as_price_series(prices).sorted()
 
-    trades = []
-    equity = config.initial_capital
-    timestamps = []
-    equity_curve = [equity]
+    if _is_inert(series.signal_value, config):
+        # Provably zero trades: skip the bar loop entirely
+        entry_idx = exit_idx = direction = pnl_pct = pnl = equity_after = []
+    else:
+        entry_idx, exit_idx, direction, pnl_pct, pnl, equity_after = _simulate(
+            series, config
+        )
 
-    current_position: Optional[str] = None  # "LONG" | "SHORT" | None
-    entry_time: Optional[datetime] = None
-    entry_price: Optional[float] = None
-    entry_signal: Optional[float] = None
-
-    for i, price_point in enumerate(prices):
-        signal = price_point.signal_value
-        action = get_signal_action(signal, config.buy_threshold, config.sell_threshold)
-        current_price = price_point.utxoracle_price
-        timestamps.append(price_point.timestamp)
-
-        # Close existing position if signal changes
-        if current_position is not None:
-            should_close = False
-
-            if current_position == "LONG" and action == "SELL":
-                should_close = True
-            elif current_position == "SHORT" and action == "BUY":
-                should_close = True
-            elif action == "HOLD" and i == len(prices) - 1:
-                # Close at end of backtest
-                should_close = True
-            elif i == len(prices) - 1:
-                # Force close at end
-                should_close = True
-
-            if should_close and entry_time and entry_price is not None:
-                trade = execute_trade(
-                    entry_time=entry_time,
-                    entry_price=entry_price,
-                    exit_time=price_point.timestamp,
-                    exit_price=current_price,
-                    direction=current_position,
-                    position_size=config.position_size,
-                    transaction_cost=config.transaction_cost,
-                    capital=equity,
-                    signal_value=entry_signal or 0.0,
-                )
-                trades.append(trade)
-                equity += trade.pnl
-                equity_curve.append(equity)
-                current_position = None
-                entry_time = None
-                entry_price = None
-                entry_signal = None
-
-        # Open new position
-        if current_position is None and action in ("BUY", "SELL"):
-            current_position = "LONG" if action == "BUY" else "SHORT"
-            entry_time = price_point.timestamp
-            entry_price = current_price
-            entry_signal = signal
+    # Build Trade records only for the executed trades
+    timestamps = series.timestamps.tolist()
+    bar_prices = series.utxoracle_price.tolist()
+    bar_signals = series.signal_value.tolist()
+    trades = [
+        Trade(
+            entry_time=timestamps[entry],
+            exit_time=timestamps[exit_],
+            entry_price=bar_prices[entry],
+            exit_price=bar_prices[exit_],
+            direction="LONG" if side == 1 else "SHORT",
+            pnl=trade_pnl,
+            pnl_pct=trade_pct,
+            signal_value=bar_signals[entry] or 0.0,
+        )
+        for entry, exit_, side, trade_pct, trade_pnl in zip(
+            entry_idx, exit_idx, direction, pnl_pct, pnl
+        )
+    ]
+    equity_curve = [config.initial_capital, *equity_after]
 
     # Calculate metrics
     total_return, _ = calculate_pnl(trades, config.initial_capital)
@@ -315,7 +421,7 @@ def compare_signals(
 
     Args:
         signals: Dictionary of signal_name -> list of signal values
-        prices: List of PricePoint objects
+        prices: List of PricePoint objects or a PriceSeries
         start_date: Start date for backtest
         end_date: End date for backtest
         buy_threshold: Signal threshold for buy
@@ -327,26 +433,14 @@ def compare_signals(
         ComparisonResult with results for each signal, ranked by Sharpe
     """
     from scripts.backtest.metrics import calculate_returns, sharpe_ratio
-    from scripts.backtest.data_loader import PricePoint
+    from scripts.backtest.data_loader import as_price_series
 
     results: dict[str, BacktestResult] = {}
+    series = as_price_series(prices)
 
     for signal_name, signal_values in signals.items():
-        # Create price points with this signal's values
-        signal_prices = []
-        for i, price in enumerate(prices):
-            if i < len(signal_values):
-                signal_prices.append(
-                    PricePoint(
-                        timestamp=price.timestamp,
-                        utxoracle_price=price.utxoracle_price,
-                        exchange_price=price.exchange_price,
-                        confidence=price.confidence,
-                        signal_value=signal_values[i],
-                    )
-                )
-            else:
-                signal_prices.append(price)
+        # Swap in this signal's values (bars past its end keep their signal)
+        signal_prices = series.with_signal(signal_values)
 
         # Run backtest for this signal
         config = BacktestConfig(
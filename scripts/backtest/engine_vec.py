@@ -0,0 +1,268 @@
+"""Vectorized backtest engine for parameter sweeps.
+
+Runs many backtest configurations over bar arrays in one pass instead of
+calling run_backtest once per config. Trading rules are the same as
+run_backtest:
+
+- BUY/SELL/HOLD from the signal vs. thresholds (BUY wins ties)
+- a position opens on BUY (LONG) or SELL (SHORT) when flat
+- an opposite signal closes the position and opens the reverse one
+  on the same bar
+- any open position is closed on the last bar
+
+Under these rules the position on each bar is simply the last non-HOLD
+action seen so far, which vectorizes as a forward fill.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from scripts.backtest.metrics import sharpe_ratio
+from scripts.backtest.metrics_vec import calculate_returns_arr
+
+
+@dataclass
+class BacktestBatchResult:
+    """Results for a batch of backtest configs (structure of arrays).
+
+    Per-config arrays have shape (n_configs,). Per-trade arrays have shape
+    (n_trades_total,), ordered by config and then by entry bar;
+    trade_config maps each trade to its config row.
+    """
+
+    total_return: np.ndarray
+    final_equity: np.ndarray
+    num_trades: np.ndarray
+    win_rate: np.ndarray
+
+    trade_config: np.ndarray
+    entry_index: np.ndarray
+    exit_index: np.ndarray
+    direction: np.ndarray  # +1 LONG, -1 SHORT
+    pnl: np.ndarray
+    pnl_pct: np.ndarray
+
+
+@dataclass
+class ComparisonBatchResult:
+    """Array-mode multi-signal comparison results.
+
+    All arrays have one entry per signal row of the input matrix.
+    """
+
+    sharpe_ratio: np.ndarray
+    total_return: np.ndarray
+    num_trades: np.ndarray
+    win_rate: np.ndarray
+    ranking: np.ndarray  # Row indices, best Sharpe first
+
+
+def signal_actions(
+    signals: np.ndarray,
+    buy_thresholds: np.ndarray,
+    sell_thresholds: np.ndarray,
+) -> np.ndarray:
+    """Vectorized get_signal_action.
+
+    Args:
+        signals: Signal matrix of shape (n_configs, n_bars); NaN means no signal
+        buy_thresholds: Buy threshold per config, shape (n_configs,)
+        sell_thresholds: Sell threshold per config, shape (n_configs,)
+
+    Returns:
+        int8 matrix of actions: +1 BUY, -1 SELL, 0 HOLD
+    """
+    buy = signals >= buy_thresholds[:, None]
+    sell = ~buy & (signals <= sell_thresholds[:, None])
+    return buy.astype(np.int8) - sell.astype(np.int8)
+
+
+def run_backtest_batch(
+    prices: np.ndarray,
+    signals: np.ndarray,
+    buy_thresholds: np.ndarray,
+    sell_thresholds: np.ndarray,
+    position_size: np.ndarray = 1.0,
+    transaction_cost: np.ndarray = 0.001,
+    initial_capital: np.ndarray = 10000.0,
+) -> BacktestBatchResult:
+    """Execute many backtests over time-ordered bars at once.
+
+    prices and signals may be 1D (shared by every config) or 2D with one
+    row per config. Threshold and trade parameters may be scalars or
+    arrays with one value per config.
+
+    Args:
+        prices: Price per bar, shape (n_bars,) or (n_configs, n_bars)
+        signals: Signal per bar, same shapes as prices; NaN means no signal
+        buy_thresholds: Signal at or above this triggers BUY
+        sell_thresholds: Signal at or below this triggers SELL
+        position_size: Fraction of capital per trade
+        transaction_cost: Cost per trade side as fraction
+        initial_capital: Starting capital
+
+    Returns:
+        BacktestBatchResult with per-config metrics and per-trade arrays
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    signals = np.asarray(signals, dtype=np.float64)
+    params = [
+        np.asarray(p, dtype=np.float64)
+        for p in (
+            buy_thresholds,
+            sell_thresholds,
+            position_size,
+            transaction_cost,
+            initial_capital,
+        )
+    ]
+    (n_configs,) = np.broadcast_shapes(
+        prices.shape[:-1], signals.shape[:-1], *(p.shape for p in params)
+    ) or (1,)
+    n_bars = prices.shape[-1]
+
+    prices = np.broadcast_to(prices, (n_configs, n_bars))
+    signals = np.broadcast_to(signals, (n_configs, n_bars))
+    (
+        buy_thresholds,
+        sell_thresholds,
+        position_size,
+        transaction_cost,
+        initial_capital,
+    ) = (np.broadcast_to(p, (n_configs,)) for p in params)
+
+    actions = signal_actions(signals, buy_thresholds, sell_thresholds)
+
+    # Position held after each bar = last non-HOLD action (forward fill)
+    bar_index = np.arange(n_bars)
+    last_action_bar = np.maximum.accumulate(
+        np.where(actions != 0, bar_index, -1), axis=1
+    )
+    positions = np.where(
+        last_action_bar >= 0,
+        np.take_along_axis(actions, np.maximum(last_action_bar, 0), axis=1),
+        0,
+    )
+
+    # Entries: bars where the held position changes to a new direction.
+    # Each entry exits at the next entry (a reversal), or on the last bar.
+    # An entry on the last bar never exits and is not a trade.
+    previous = np.concatenate(
+        [np.zeros((n_configs, 1), dtype=positions.dtype), positions[:, :-1]], axis=1
+    )
+    entry_mask = (positions != 0) & (positions != previous)
+    entry_mask[:, n_bars - 1 :] = False
+    trade_config, entry_index = np.nonzero(entry_mask)
+
+    # First position change strictly after each bar (reversed running min)
+    change_bars = np.where(positions != previous, bar_index, n_bars)
+    next_change = np.minimum.accumulate(change_bars[:, ::-1], axis=1)[:, ::-1]
+    exit_bar = np.full((n_configs, n_bars), n_bars - 1)
+    exit_bar[:, :-1] = np.minimum(next_change[:, 1:], n_bars - 1)
+    exit_index = exit_bar[trade_config, entry_index]
+
+    direction = positions[trade_config, entry_index].astype(np.int8)
+    entry_price = prices[trade_config, entry_index]
+    exit_price = prices[trade_config, exit_index]
+
+    valid_entry = entry_price > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw_pct = direction * (exit_price - entry_price) / entry_price
+    pnl_pct = np.where(valid_entry, raw_pct - 2 * transaction_cost[trade_config], 0.0)
+
+    # Equity compounds trade by trade within each config
+    growth = 1.0 + position_size[trade_config] * pnl_pct
+    num_trades = np.bincount(trade_config, minlength=n_configs)
+    bounds = np.concatenate([[0], np.cumsum(num_trades)])
+
+    equity_before = np.empty_like(pnl_pct)
+    final_equity = initial_capital.copy()
+    for row in np.flatnonzero(num_trades):
+        start, stop = bounds[row], bounds[row + 1]
+        equity_after = initial_capital[row] * np.cumprod(growth[start:stop])
+        equity_before[start] = initial_capital[row]
+        equity_before[start + 1 : stop] = equity_after[:-1]
+        final_equity[row] = equity_after[-1]
+    # Same formula as execute_trade, so P&L signs match run_backtest exactly
+    pnl = equity_before * position_size[trade_config] * pnl_pct
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total_return = np.where(
+            initial_capital != 0,
+            (final_equity - initial_capital) / initial_capital,
+            0.0,
+        )
+        wins = np.bincount(trade_config, weights=pnl > 0, minlength=n_configs)
+        win_rate = np.where(num_trades > 0, wins / num_trades, 0.0)
+
+    return BacktestBatchResult(
+        total_return=total_return,
+        final_equity=final_equity,
+        num_trades=num_trades,
+        win_rate=win_rate,
+        trade_config=trade_config,
+        entry_index=entry_index,
+        exit_index=exit_index,
+        direction=direction,
+        pnl=pnl,
+        pnl_pct=pnl_pct,
+    )
+
+
+def compare_signals_arr(
+    sig_mat: np.ndarray,
+    prices: np.ndarray,
+    buy_threshold: float = 0.3,
+    sell_threshold: float = -0.3,
+    initial_capital: float = 10000.0,
+    transaction_cost: float = 0.001,
+) -> ComparisonBatchResult:
+    """Compare many signals over the same bars in one batch backtest.
+
+    Array-mode counterpart of compare_signals: every signal row runs
+    through run_backtest_batch together, and the Sharpe ratio of each row
+    is computed from its trade-by-trade equity curve, as compare_signals
+    does.
+
+    Args:
+        sig_mat: Signal matrix of shape (n_signals, n_bars); NaN means no signal
+        prices: Time-ordered price per bar, shape (n_bars,)
+        buy_threshold: Signal threshold for buy
+        sell_threshold: Signal threshold for sell
+        initial_capital: Starting capital
+        transaction_cost: Transaction cost per trade
+
+    Returns:
+        ComparisonBatchResult with per-signal metrics, ranked by Sharpe
+    """
+    sig_mat = np.atleast_2d(np.asarray(sig_mat, dtype=np.float64))
+    n_signals = sig_mat.shape[0]
+
+    batch = run_backtest_batch(
+        prices,
+        sig_mat,
+        buy_thresholds=np.full(n_signals, buy_threshold),
+        sell_thresholds=sell_threshold,
+        transaction_cost=transaction_cost,
+        initial_capital=initial_capital,
+    )
+
+    # Equity curve per row: trade P&L added to the initial capital in order
+    sharpe = np.zeros(n_signals)
+    bounds = np.concatenate([[0], np.cumsum(batch.num_trades)])
+    for row in range(n_signals):
+        pnl = batch.pnl[bounds[row] : bounds[row + 1]]
+        equity_curve = np.cumsum(np.concatenate([[initial_capital], pnl]))
+        sharpe[row] = sharpe_ratio(calculate_returns_arr(equity_curve))
+
+    # Stable sort keeps input order among ties, like sorted(..., reverse=True)
+    ranking = np.argsort(-sharpe, kind="stable")
+
+    return ComparisonBatchResult(
+        sharpe_ratio=sharpe,
+        total_return=batch.total_return,
+        num_trades=batch.num_trades,
+        win_rate=batch.win_rate,
+        ranking=ranking,
+    )
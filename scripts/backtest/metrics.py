@@ -4,13 +4,32 @@ Implements standard quantitative finance metrics for evaluating
 trading strategy performance.
 """
 
-import math
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from scripts.backtest.metrics_vec import (
+    max_drawdown_arr,
+    sharpe_ratio_arr,
+    sortino_ratio_arr,
+)
+
 if TYPE_CHECKING:
     pass
 
 
+def _as_float_array(values) -> np.ndarray:
+    """Convert numeric values to a float64 array.
+
+    Raises TypeError for None or non-numeric entries, as the sum() based
+    list arithmetic did (np.asarray would silently turn None into NaN).
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind not in "biuf":
+        raise TypeError(f"Expected numeric values, got dtype {arr.dtype}")
+    return arr.astype(np.float64, copy=False)
+
+
 def sharpe_ratio(
     returns: list[float],
     risk_free_rate: float = 0.0,
@@ -21,32 +40,16 @@ def sharpe_ratio(
     Sharpe = (mean(returns) - rf) / std(returns) * sqrt(annualization_factor)
 
     Args:
-        returns: List of period returns (e.g., daily)
+        returns: List or array of period returns (e.g., daily)
         risk_free_rate: Risk-free rate for the same period
         annualization_factor: Periods per year (252 for daily, 52 for weekly)
 
     Returns:
         Annualized Sharpe ratio
     """
-    if not returns or len(returns) < 2:
-        return 0.0
-
-    n = len(returns)
-    mean_return = sum(returns) / n
-    excess_return = mean_return - risk_free_rate
-
-    # Calculate standard deviation
-    variance = sum((r - mean_return) ** 2 for r in returns) / (n - 1)
-    std_return = math.sqrt(variance) if variance > 0 else 0.0
-
-    if std_return == 0:
-        return 0.0
-
-    # Guard against negative annualization factor (sqrt of negative)
-    if annualization_factor < 0:
-        return float("nan")
-
-    return (excess_return / std_return) * math.sqrt(annualization_factor)
+    return sharpe_ratio_arr(
+        _as_float_array(returns), risk_free_rate, annualization_factor
+    )
 
 
 def sortino_ratio(
@@ -62,35 +65,16 @@ def sortino_ratio(
     asymmetric return distributions.
 
     Args:
-        returns: List of period returns
+        returns: List or array of period returns
         risk_free_rate: Risk-free rate for the same period
         annualization_factor: Periods per year
 
     Returns:
         Annualized Sortino ratio
     """
-    if not returns or len(returns) < 2:
-        return 0.0
-
-    n = len(returns)
-    mean_return = sum(returns) / n
-    excess_return = mean_return - risk_free_rate
-
-    # Only consider negative returns (downside)
-    negative_returns = [r for r in returns if r < 0]
-
-    if not negative_returns:
-        # No downside returns - perfect performance
-        return float("inf") if excess_return > 0 else 0.0
-
-    # Downside deviation
-    downside_variance = sum(r**2 for r in negative_returns) / len(negative_returns)
-    downside_std = math.sqrt(downside_variance) if downside_variance > 0 else 0.0
-
-    if downside_std == 0:
-        return 0.0
-
-    return (excess_return / downside_std) * math.sqrt(annualization_factor)
+    return sortino_ratio_arr(
+        _as_float_array(returns), risk_free_rate, annualization_factor
+    )
 
 
 def max_drawdown(equity_curve: list[float]) -> float:
@@ -99,25 +83,12 @@ def max_drawdown(equity_curve: list[float]) -> float:
     Max drawdown is the largest peak-to-trough decline.
 
     Args:
-        equity_curve: List of equity values over time
+        equity_curve: List or array of equity values over time
 
     Returns:
         Maximum drawdown as a fraction (0.0 to 1.0)
     """
-    if not equity_curve or len(equity_curve) < 2:
-        return 0.0
-
-    max_dd = 0.0
-    peak = equity_curve[0]
-
-    for value in equity_curve:
-        if value > peak:
-            peak = value
-        else:
-            drawdown = (peak - value) / peak if peak > 0 else 0.0
-            max_dd = max(max_dd, drawdown)
-
-    return max_dd
+    return max_drawdown_arr(_as_float_array(equity_curve))
 
 
 def win_rate(trades: list) -> float:
@@ -0,0 +1,179 @@
+"""Array-oriented performance metrics for backtesting.
+
+NumPy counterparts of the metrics in scripts.backtest.metrics. They take
+flat float arrays (one value per trade or per period) instead of lists of
+Trade objects, so bulk callers avoid building per-trade dataclasses.
+
+sharpe_ratio, sortino_ratio and max_drawdown in scripts.backtest.metrics
+delegate to the functions here. The trade-based metrics keep their own
+loops, with the same edge-case behaviour (empty input, no losing trades).
+"""
+
+import math
+
+import numpy as np
+
+
+def sharpe_ratio_arr(
+    returns: np.ndarray,
+    risk_free_rate: float = 0.0,
+    annualization_factor: float = 252,
+) -> float:
+    """Calculate annualized Sharpe ratio from an array of returns.
+
+    Args:
+        returns: Array of period returns (e.g., daily)
+        risk_free_rate: Risk-free rate for the same period
+        annualization_factor: Periods per year (252 for daily, 52 for weekly)
+
+    Returns:
+        Annualized Sharpe ratio
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    if returns.size < 2:
+        return 0.0
+
+    # inf/NaN inputs propagate as NaN, as with plain float arithmetic
+    with np.errstate(invalid="ignore", over="ignore"):
+        mean_return = float(returns.mean())
+        variance = float(np.square(returns - mean_return).sum()) / (returns.size - 1)
+
+    # NaN variance counts as zero
+    std_return = math.sqrt(variance) if variance > 0 else 0.0
+    if std_return == 0:
+        return 0.0
+
+    # Guard against negative annualization factor (sqrt of negative)
+    if annualization_factor < 0:
+        return float("nan")
+
+    excess_return = mean_return - risk_free_rate
+    return excess_return / std_return * math.sqrt(annualization_factor)
+
+
+def sortino_ratio_arr(
+    returns: np.ndarray,
+    risk_free_rate: float = 0.0,
+    annualization_factor: float = 252,
+) -> float:
+    """Calculate annualized Sortino ratio from an array of returns.
+
+    Args:
+        returns: Array of period returns
+        risk_free_rate: Risk-free rate for the same period
+        annualization_factor: Periods per year
+
+    Returns:
+        Annualized Sortino ratio
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    if returns.size < 2:
+        return 0.0
+
+    negative_returns = returns[returns < 0]
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        excess_return = float(returns.mean()) - risk_free_rate
+        downside_sum = float(np.square(negative_returns).sum())
+
+    if negative_returns.size == 0:
+        return float("inf") if excess_return > 0 else 0.0
+
+    downside_variance = downside_sum / negative_returns.size
+    downside_std = math.sqrt(downside_variance) if downside_variance > 0 else 0.0
+    if downside_std == 0:
+        return 0.0
+
+    return excess_return / downside_std * math.sqrt(annualization_factor)
+
+
+def max_drawdown_arr(equity_curve: np.ndarray) -> float:
+    """Calculate maximum drawdown from an equity curve array.
+
+    Args:
+        equity_curve: Array of equity values over time
+
+    Returns:
+        Maximum drawdown as a fraction (0.0 to 1.0)
+    """
+    equity = np.asarray(equity_curve, dtype=np.float64)
+    if equity.size < 2:
+        return 0.0
+
+    # Running peak from the first value; later NaNs never become the peak
+    candidates = np.where(np.isnan(equity), -np.inf, equity)
+    candidates[0] = equity[0]
+    peaks = np.maximum.accumulate(candidates)
+
+    # Non-positive peaks contribute no drawdown
+    with np.errstate(invalid="ignore", over="ignore"):
+        drawdowns = np.divide(
+            peaks - equity,
+            peaks,
+            out=np.zeros_like(equity),
+            where=peaks > 0,
+        )
+
+    # fmax skips NaN drawdowns (NaN equity, or inf - inf at an infinite peak)
+    return float(np.fmax.reduce(drawdowns, initial=0.0))
+
+
+def win_rate_arr(pnl: np.ndarray) -> float:
+    """Calculate win rate from an array of per-trade P&L.
+
+    Args:
+        pnl: Array of trade profits/losses
+
+    Returns:
+        Win rate as a fraction (0.0 to 1.0)
+    """
+    pnl = np.asarray(pnl, dtype=np.float64)
+    if pnl.size == 0:
+        return 0.0
+
+    return float(np.count_nonzero(pnl > 0) / pnl.size)
+
+
+def profit_factor_arr(pnl: np.ndarray) -> float:
+    """Calculate profit factor from an array of per-trade P&L.
+
+    Args:
+        pnl: Array of trade profits/losses
+
+    Returns:
+        Profit factor (0.0 to inf, or 0.0 if no trades)
+    """
+    pnl = np.asarray(pnl, dtype=np.float64)
+    if pnl.size == 0:
+        return 0.0
+
+    gross_profit = float(pnl[pnl > 0].sum())
+    gross_loss = float(-pnl[pnl < 0].sum())
+
+    if gross_loss == 0:
+        return float("inf") if gross_profit > 0 else 0.0
+
+    return gross_profit / gross_loss
+
+
+def calculate_returns_arr(equity_curve: np.ndarray) -> np.ndarray:
+    """Calculate period returns from an equity curve array.
+
+    Args:
+        equity_curve: Array of equity values
+
+    Returns:
+        Array of period returns (one less than equity_curve length);
+        periods starting from zero equity have a return of 0.0
+    """
+    equity = np.asarray(equity_curve, dtype=np.float64)
+    if equity.size < 2:
+        return np.empty(0, dtype=np.float64)
+
+    previous = equity[:-1]
+    return np.divide(
+        equity[1:] - previous,
+        previous,
+        out=np.zeros_like(previous),
+        where=previous != 0,
+    )
@@ -1,14 +1,22 @@
 """Weight optimization for backtesting.
 
-Implements grid search and walk-forward validation for optimizing
-signal fusion weights.
+Implements grid search, SLSQP (optional, via scipy) and walk-forward
+validation for optimizing signal fusion weights.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from itertools import product
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from scripts.backtest.engine_vec import compare_signals_arr
+from scripts.backtest.optimizer_fast import (
+    combine_signal_grid,
+    combine_signal_matrix,
+    stack_signals,
+)
+
 if TYPE_CHECKING:
     pass
 
@@ -25,46 +33,60 @@ class OptimizationResult:
     weight_grid: list[dict] = field(default_factory=list)
 
 
-def generate_weight_grid(
-    signal_names: list[str],
-    step: float = 0.1,
-) -> list[dict[str, float]]:
-    """Generate all weight combinations that sum to 1.0.
+def generate_weight_grid_arr(n_signals: int, step: float = 0.1) -> np.ndarray:
+    """Generate all weight combinations that sum to 1.0 as a matrix.
+
+    The first n_signals - 1 weights take every value in {0, step, 2*step,
+    ...} up to 1.0; the last weight is 1.0 minus their sum, and rows where
+    it falls outside [0, 1] are dropped. Rows are in itertools.product order.
 
     Args:
-        signal_names: List of signal names
+        n_signals: Number of signals (columns)
         step: Step size for weights (e.g., 0.1 for 10% increments)
 
     Returns:
-        List of weight dictionaries
+        Array of shape (n_combinations, n_signals); each row sums to 1.0
     """
-    n_signals = len(signal_names)
     if n_signals == 0:
-        return []
+        return np.empty((0, 0))
 
     if n_signals == 1:
-        return [{signal_names[0]: 1.0}]
+        return np.ones((1, 1))
 
     # Guard against invalid step values
     if step <= 0:
-        return []
+        return np.empty((0, n_signals))
 
-    # Generate all combinations for n-1 signals
+    # Cartesian product of the step values for the first n-1 signals
     steps = int(1.0 / step) + 1
-    weight_values = [i * step for i in range(steps)]
+    free = n_signals - 1
+    indices = np.indices((steps,) * free).reshape(free, -1).T
+    combos = indices * step
+
+    # Last weight is determined by constraint: sum = 1.0
+    remaining = 1.0 - combos.sum(axis=1)
+    valid = (remaining >= 0) & (remaining <= 1.0)
+
+    return np.column_stack([combos[valid], remaining[valid]])
 
-    grid = []
-    for combo in product(weight_values, repeat=n_signals - 1):
-        # Last weight is determined by constraint: sum = 1.0
-        remaining = 1.0 - sum(combo)
-        if remaining >= 0 and remaining <= 1.0:
-            weights = {}
-            for i, name in enumerate(signal_names[:-1]):
-                weights[name] = combo[i]
-            weights[signal_names[-1]] = remaining
-            grid.append(weights)
 
-    return grid
+def generate_weight_grid(
+    signal_names: list[str],
+    step: float = 0.1,
+) -> list[dict[str, float]]:
+    """Generate all weight combinations that sum to 1.0.
+
+    Dict-per-combination view of generate_weight_grid_arr.
+
+    Args:
+        signal_names: List of signal names
+        step: Step size for weights (e.g., 0.1 for 10% increments)
+
+    Returns:
+        List of weight dictionaries
+    """
+    grid = generate_weight_grid_arr(len(signal_names), step)
+    return [dict(zip(signal_names, row)) for row in grid.tolist()]
 
 
 def combine_signals(
@@ -83,91 +105,190 @@ def combine_signals(
     if not signals:
         return []
 
-    # Find max length
-    max_len = max(len(v) for v in signals.values())
-    combined = []
+    sig_mat = stack_signals(signals)
+    weight_vec = [weights.get(name, 0.0) for name in signals]
 
-    for i in range(max_len):
-        weighted_sum = 0.0
-        for name, signal_values in signals.items():
-            if i < len(signal_values):
-                weight = weights.get(name, 0.0)
-                weighted_sum += signal_values[i] * weight
-        combined.append(weighted_sum)
+    return combine_signal_matrix(sig_mat, weight_vec).tolist()
 
-    return combined
+
+def solve_weights_slsqp(
+    signals: dict[str, list[float]],
+    prices: list,  # List[PricePoint] or PriceSeries
+) -> dict[str, float]:
+    """Solve for signal weights on the simplex with SLSQP.
+
+    The backtest Sharpe is piecewise constant in the weights (trades only
+    change when the combined signal crosses a threshold), so it has no
+    useful gradient. SLSQP instead maximizes a smooth surrogate: the
+    Sharpe of holding a position equal to the combined signal from each
+    bar to the next.
+
+    Requires scipy (optional dependency).
+
+    Args:
+        signals: Dictionary of signal_name -> signal_values
+        prices: List of PricePoint objects or a PriceSeries
+
+    Returns:
+        Weight dictionary; weights are non-negative and sum to 1.0
+    """
+    from scipy.optimize import minimize
+
+    from scripts.backtest.data_loader import as_price_series
+    from scripts.backtest.metrics_vec import sharpe_ratio_arr
+
+    signal_names = list(signals.keys())
+    n_signals = len(signal_names)
+    if n_signals == 0:
+        return {}
+
+    # Align signals with bars as optimize_weights does (index i -> prices[i],
+    # missing values are 0.0), then put the bars in time order
+    series = as_price_series(prices)
+    n_bars = len(series)
+    sig_mat = np.zeros((n_signals, n_bars))
+    stacked = stack_signals(signals)[:, :n_bars]
+    sig_mat[:, : stacked.shape[1]] = stacked
+
+    order = np.argsort(series.timestamps, kind="stable")
+    sig_mat = sig_mat[:, order]
+    price_arr = series.utxoracle_price[order]
+
+    bar_returns = np.divide(
+        np.diff(price_arr),
+        price_arr[:-1],
+        out=np.zeros(max(n_bars - 1, 0)),
+        where=price_arr[:-1] > 0,
+    )
+    exposures = sig_mat[:, :-1]
+
+    def negative_sharpe(weights: np.ndarray) -> float:
+        return -sharpe_ratio_arr(
+            combine_signal_matrix(exposures, weights) * bar_returns
+        )
+
+    solution = minimize(
+        negative_sharpe,
+        x0=np.full(n_signals, 1.0 / n_signals),
+        method="SLSQP",
+        bounds=[(0.0, 1.0)] * n_signals,
+        constraints={"type": "eq", "fun": lambda w: w.sum() - 1.0},
+    )
+
+    # Project solver round-off back onto the simplex
+    weights = np.clip(solution.x, 0.0, 1.0)
+    weights = weights / weights.sum()
+
+    return dict(zip(signal_names, weights.tolist()))
+
+
+# Upper bound on candidates x bars evaluated per batch backtest
+BATCH_CELLS = 1 << 22
+
+# optimize_weights precision -> dtype of the combined candidate signals
+PRECISION_DTYPES = {"fp64": np.float64, "fp32": np.float32}
+
+
+def _score_candidates(
+    candidate_signals: np.ndarray,
+    bar_prices: np.ndarray,
+    buy_threshold: float,
+    sell_threshold: float,
+) -> np.ndarray:
+    """Backtest Sharpe for each row of a (n_candidates, n_bars) signal matrix.
+
+    Rows are evaluated with compare_signals_arr in batches of at most
+    BATCH_CELLS matrix cells, so memory stays bounded for large grids.
+    """
+    n_candidates, n_bars = candidate_signals.shape
+    rows_per_batch = max(1, BATCH_CELLS // max(n_bars, 1))
+
+    sharpes = np.zeros(n_candidates)
+    for start in range(0, n_candidates, rows_per_batch):
+        stop = start + rows_per_batch
+        sharpes[start:stop] = compare_signals_arr(
+            candidate_signals[start:stop],
+            bar_prices,
+            buy_threshold=buy_threshold,
+            sell_threshold=sell_threshold,
+        ).sharpe_ratio
+    return sharpes
 
 
 def optimize_weights(
     signals: dict[str, list[float]],
-    prices: list,  # List[PricePoint]
+    prices: list,  # List[PricePoint] or PriceSeries
     start_date: datetime,
     end_date: datetime,
     step: float = 0.1,
     buy_threshold: float = 0.3,
     sell_threshold: float = -0.3,
+    method: str = "grid",
+    precision: str = "fp64",
 ) -> OptimizationResult:
-    """Optimize signal weights via grid search.
+    """Optimize signal weights via grid search or SLSQP.
+
+    method="grid" backtests every combination from generate_weight_grid.
+    method="scipy" backtests only the solve_weights_slsqp solution, which
+    scales to many signals where the grid explodes; step is ignored.
 
     Args:
         signals: Dictionary of signal_name -> signal_values
-        prices: List of PricePoint objects
+        prices: List of PricePoint objects or a PriceSeries
         start_date: Start date for backtest
         end_date: End date for backtest
         step: Weight step size (e.g., 0.1 for 10% increments)
         buy_threshold: Signal threshold for buy
         sell_threshold: Signal threshold for sell
+        method: "grid" (exhaustive) or "scipy" (requires scipy)
+        precision: "fp64", or "fp32" to combine candidate signals in
+            float32 (equity is still accumulated in float64)
 
     Returns:
         OptimizationResult with best weights and Sharpe
     """
     from scripts.backtest.engine import run_backtest, BacktestConfig
     from scripts.backtest.metrics import calculate_returns, sharpe_ratio
-    from scripts.backtest.data_loader import PricePoint
+    from scripts.backtest.data_loader import as_price_series
 
+    series = as_price_series(prices)
     signal_names = list(signals.keys())
-    weight_grid = generate_weight_grid(signal_names, step)
+    if method == "grid":
+        weight_grid = generate_weight_grid(signal_names, step)
+    elif method == "scipy":
+        weight_grid = [solve_weights_slsqp(signals, series)] if signal_names else []
+    else:
+        raise ValueError(f"Unknown optimization method: {method!r}")
+
+    if precision not in PRECISION_DTYPES:
+        raise ValueError(f"Unknown precision: {precision!r}")
+
+    # Combined signal of every candidate in one pass, aligned with the bars
+    # (0.0 past the end of the signals), then sorted into time order once
+    n_bars = len(series)
+    grid_arr = np.array(
+        [[weights[name] for name in signal_names] for weights in weight_grid]
+    ).reshape(len(weight_grid), len(signal_names))
+    dtype = PRECISION_DTYPES[precision]
+    combined_all = combine_signal_grid(stack_signals(signals), grid_arr, dtype)
+    combined_all = combined_all[:, :n_bars]
+    candidate_signals = np.zeros((len(weight_grid), n_bars), dtype=dtype)
+    candidate_signals[:, : combined_all.shape[1]] = combined_all
+
+    order = np.argsort(series.timestamps, kind="stable")
+    ordered = series.take(order)
+    candidate_signals = candidate_signals[:, order]
+
+    # Backtest every candidate in batches of rows
+    sharpes = _score_candidates(
+        candidate_signals, ordered.utxoracle_price, buy_threshold, sell_threshold
+    )
 
     best_weights = None
     best_sharpe = float("-inf")
     grid_results = []
 
-    for weights in weight_grid:
-        # Combine signals with these weights
-        combined = combine_signals(signals, weights)
-
-        # Create prices with combined signal
-        signal_prices = []
-        for i, price in enumerate(prices):
-            signal_value = combined[i] if i < len(combined) else 0.0
-            signal_prices.append(
-                PricePoint(
-                    timestamp=price.timestamp,
-                    utxoracle_price=price.utxoracle_price,
-                    exchange_price=price.exchange_price,
-                    confidence=price.confidence,
-                    signal_value=signal_value,
-                )
-            )
-
-        # Run backtest
-        config = BacktestConfig(
-            start_date=start_date,
-            end_date=end_date,
-            signal_source="optimized",
-            buy_threshold=buy_threshold,
-            sell_threshold=sell_threshold,
-        )
-
-        result = run_backtest(config, prices=signal_prices)
-
-        # Calculate Sharpe
-        if result.equity_curve:
-            returns = calculate_returns(result.equity_curve)
-            current_sharpe = sharpe_ratio(returns)
-        else:
-            current_sharpe = 0.0
-
+    for weights, current_sharpe in zip(weight_grid, sharpes.tolist()):
         grid_results.append(
             {
                 "weights": weights.copy(),
@@ -184,18 +305,7 @@ def optimize_weights(
     baseline_weights = {name: equal_weight for name in signal_names}
     baseline_combined = combine_signals(signals, baseline_weights)
 
-    baseline_prices = []
-    for i, price in enumerate(prices):
-        signal_value = baseline_combined[i] if i < len(baseline_combined) else 0.0
-        baseline_prices.append(
-            PricePoint(
-                timestamp=price.timestamp,
-                utxoracle_price=price.utxoracle_price,
-                exchange_price=price.exchange_price,
-                confidence=price.confidence,
-                signal_value=signal_value,
-            )
-        )
+    baseline_prices = series.with_signal(baseline_combined, fill=0.0)
 
     baseline_config = BacktestConfig(
         start_date=start_date,
@@ -231,7 +341,7 @@ def optimize_weights(
 def walk_forward_validate(
     weights: dict[str, float],
     signals: dict[str, list[float]],
-    prices: list,  # List[PricePoint]
+    prices: list,  # List[PricePoint] or PriceSeries
     train_ratio: float = 0.7,
     buy_threshold: float = 0.3,
     sell_threshold: float = -0.3,
@@ -243,7 +353,7 @@ def walk_forward_validate(
     Args:
         weights: Signal weights to validate
         signals: Dictionary of signal_name -> signal_values
-        prices: List of PricePoint objects
+        prices: List of PricePoint objects or a PriceSeries
         train_ratio: Fraction of data for training (e.g., 0.7 = 70%)
         buy_threshold: Signal threshold for buy
         sell_threshold: Signal threshold for sell
@@ -253,44 +363,31 @@ def walk_forward_validate(
     """
     from scripts.backtest.engine import run_backtest, BacktestConfig
     from scripts.backtest.metrics import calculate_returns, sharpe_ratio
-    from scripts.backtest.data_loader import PricePoint
+    from scripts.backtest.data_loader import as_price_series
 
-    if not prices:
+    if not len(prices):
         return {"train_sharpe": 0.0, "test_sharpe": 0.0}
 
     # Split data
-    split_idx = int(len(prices) * train_ratio)
-    train_prices = prices[:split_idx]
-    test_prices = prices[split_idx:]
+    series = as_price_series(prices)
+    split_idx = int(len(series) * train_ratio)
+    train_prices = series[:split_idx]
+    test_prices = series[split_idx:]
 
     # Combine signals
     combined = combine_signals(signals, weights)
 
     def run_with_combined(price_subset, combined_signals, start_idx):
-        signal_prices = []
-        for i, price in enumerate(price_subset):
-            signal_idx = start_idx + i
-            signal_value = (
-                combined_signals[signal_idx]
-                if signal_idx < len(combined_signals)
-                else 0.0
-            )
-            signal_prices.append(
-                PricePoint(
-                    timestamp=price.timestamp,
-                    utxoracle_price=price.utxoracle_price,
-                    exchange_price=price.exchange_price,
-                    confidence=price.confidence,
-                    signal_value=signal_value,
-                )
-            )
-
-        if not signal_prices:
+        signal_prices = price_subset.with_signal(
+            combined_signals[start_idx : start_idx + len(price_subset)], fill=0.0
+        )
+
+        if not len(signal_prices):
             return 0.0
 
         config = BacktestConfig(
-            start_date=signal_prices[0].timestamp,
-            end_date=signal_prices[-1].timestamp,
+            start_date=signal_prices.timestamps[0],
+            end_date=signal_prices.timestamps[-1],
             signal_source="walk_forward",
             buy_threshold=buy_threshold,
             sell_threshold=sell_threshold,
@@ -0,0 +1,100 @@
+"""Compiled kernels for signal weighting.
+
+The weighted signal sum is the inner loop of every grid-search candidate,
+so it runs on a dense (n_signals, length) matrix instead of a dict of
+lists. Numba is optional: when installed the kernel is JIT-compiled (and
+cached on disk, so the compile cost is paid once per environment);
+otherwise a NumPy reduction with the same summation order is used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _combine_loops(sig_mat: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    n_signals, length = sig_mat.shape
+    out = np.zeros(length)
+    for i in range(n_signals):
+        weight = weights[i]
+        for t in range(length):
+            out[t] += weight * sig_mat[i, t]
+    return out
+
+
+def _combine_numpy(sig_mat: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    # Reducing over axis 0 adds row by row, matching _combine_loops exactly
+    return (weights[:, None] * sig_mat).sum(axis=0)
+
+
+if NUMBA_AVAILABLE:
+    _combine = njit(cache=True)(_combine_loops)
+else:
+    _combine = _combine_numpy
+
+
+def stack_signals(signals: dict[str, list[float]]) -> np.ndarray:
+    """Stack signal series into a (n_signals, max_len) float64 matrix.
+
+    Shorter series are zero-padded, so they contribute nothing past their
+    end (same as combine_signals skipping missing indices).
+
+    Args:
+        signals: Dictionary of signal_name -> signal_values
+
+    Returns:
+        Matrix with one row per signal, in dict order
+    """
+    max_len = max((len(v) for v in signals.values()), default=0)
+    sig_mat = np.zeros((len(signals), max_len), dtype=np.float64)
+    for row, values in enumerate(signals.values()):
+        sig_mat[row, : len(values)] = values
+    return sig_mat
+
+
+def combine_signal_matrix(sig_mat: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted sum of signal rows.
+
+    Args:
+        sig_mat: Signal matrix of shape (n_signals, length)
+        weights: Weight per signal row, shape (n_signals,)
+
+    Returns:
+        Combined signal of shape (length,)
+    """
+    return _combine(
+        np.ascontiguousarray(sig_mat, dtype=np.float64),
+        np.ascontiguousarray(weights, dtype=np.float64),
+    )
+
+
+def combine_signal_grid(
+    sig_mat: np.ndarray,
+    weight_grid: np.ndarray,
+    dtype=np.float64,
+) -> np.ndarray:
+    """Weighted sums of signal rows for many weight vectors at once.
+
+    Args:
+        sig_mat: Signal matrix of shape (n_signals, length)
+        weight_grid: Weight vectors of shape (n_combinations, n_signals)
+        dtype: Arithmetic dtype; np.float32 halves the bytes moved
+
+    Returns:
+        Combined signals of shape (n_combinations, length); with float64,
+        row c equals combine_signal_matrix(sig_mat, weight_grid[c]) bit
+        for bit
+    """
+    sig_mat = np.asarray(sig_mat, dtype=dtype)
+    weight_grid = np.asarray(weight_grid, dtype=dtype)
+    out = np.zeros((weight_grid.shape[0], sig_mat.shape[1]), dtype=dtype)
+
+    # Accumulate signal by signal, in the same order as _combine_loops
+    for i in range(sig_mat.shape[0]):
+        out += weight_grid[:, i, None] * sig_mat[i]
+    return out
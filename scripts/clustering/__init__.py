@@ -6,17 +6,22 @@ privacy-enhancing transactions (CoinJoins).
 Public API:
 - UnionFind: Disjoint set data structure for clustering
 - cluster_addresses: Multi-input heuristic clustering
+- get_input_addresses: Input addresses of a transaction, for clustering
 - get_cluster_stats: Get clustering statistics
 - detect_coinjoin: CoinJoin pattern detection
 - filter_coinjoins: Filter CoinJoin transactions from list
+- iter_non_coinjoins: Lazy (generator) form of filter_coinjoins
 - detect_change_outputs: Identify likely change outputs
 """
 
+from collections.abc import Iterable, Iterator
+
 from scripts.clustering.union_find import UnionFind
 from scripts.clustering.address_clustering import (
     AddressCluster,
     cluster_addresses,
     get_cluster_stats,
+    get_input_addresses,
     get_cluster_for_address,
     save_cluster,
 )
@@ -33,6 +38,29 @@ from scripts.clustering.change_detector import (
 )
 
 
+def iter_non_coinjoins(
+    transactions: Iterable[dict],
+    threshold: float = 0.7,
+) -> Iterator[dict]:
+    """Yield the transactions that are not CoinJoins, lazily.
+
+    Same filtering as filter_coinjoins, without building the result list;
+    use it when streaming a block's transactions into the next stage.
+
+    Args:
+        transactions: Iterable of transaction dictionaries
+        threshold: Minimum confidence to filter (default: 0.7)
+
+    Yields:
+        Transactions not identified as CoinJoins, in input order
+    """
+    for tx in transactions:
+        # is_coinjoin rejects small transactions before any analysis and
+        # never builds a CoinJoinResult
+        if not is_coinjoin(tx, threshold):
+            yield tx
+
+
 def filter_coinjoins(
     transactions: list[dict],
     threshold: float = 0.7,
@@ -53,14 +81,7 @@ def filter_coinjoins(
         >>> clean_txs = filter_coinjoins(transactions)
         >>> print(f"Filtered {len(transactions) - len(clean_txs)} CoinJoins")
     """
-    filtered = []
-
-    for tx in transactions:
-        result = detect_coinjoin(tx)
-        if not (result.is_coinjoin and result.confidence >= threshold):
-            filtered.append(tx)
-
-    return filtered
+    return list(iter_non_coinjoins(transactions, threshold))
 
 
 # Public API exports
@@ -70,6 +91,7 @@ __all__ = [
     # Address Clustering
     "AddressCluster",
     "cluster_addresses",
+    "get_input_addresses",
     "get_cluster_stats",
     "get_cluster_for_address",
     "save_cluster",
@@ -78,6 +100,7 @@ __all__ = [
     "detect_coinjoin",
     "is_coinjoin",
     "filter_coinjoins",
+    "iter_non_coinjoins",
     "save_coinjoin_result",
     # Change Detection
     "ChangeDetectionResult",
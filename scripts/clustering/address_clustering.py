@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from scripts.clustering.union_find import UnionFind
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressCluster:
     """Represents a cluster of addresses belonging to the same entity.
 
@@ -44,6 +44,26 @@ class AddressCluster:
     label: str | None = None
 
 
+def get_input_addresses(tx: dict) -> list[str]:
+    """Get the input (spent prevout) addresses of a transaction.
+
+    Inputs without an address are skipped: coinbase inputs (no or null
+    prevout) and non-standard scripts.
+
+    Args:
+        tx: Transaction dictionary in electrs format ('vin' with 'prevout')
+
+    Returns:
+        Input addresses in input order, ready for cluster_addresses
+    """
+    return [
+        addr
+        for vin in tx.get("vin", ())
+        if (prevout := vin.get("prevout"))
+        and (addr := prevout.get("scriptpubkey_address"))
+    ]
+
+
 def cluster_addresses(uf: UnionFind, input_addresses: list[str]) -> None:
     """Cluster addresses that appear together in a transaction's inputs.
 
@@ -69,9 +89,7 @@ def cluster_addresses(uf: UnionFind, input_addresses: list[str]) -> None:
         return
 
     # Union all input addresses together
-    first_addr = input_addresses[0]
-    for addr in input_addresses[1:]:
-        uf.union(first_addr, addr)
+    uf.union_many(input_addresses)
 
 
 def get_cluster_stats(uf: UnionFind) -> dict:
@@ -124,7 +142,6 @@ def save_cluster(
         Number of addresses saved
     """
     import duckdb
-    from datetime import datetime
 
     clusters = uf.get_clusters()
     if not clusters:
@@ -168,17 +185,11 @@ def get_cluster_for_address(uf: UnionFind, address: str) -> AddressCluster | Non
     Returns:
         AddressCluster if address is tracked, None otherwise
     """
-    if address not in uf._parent:
+    cluster_id = uf.find_existing(address)
+    if cluster_id is None:
         return None
 
-    cluster_id = uf.find(address)
-    clusters = uf.get_clusters()
-
-    for cluster_set in clusters:
-        if address in cluster_set:
-            return AddressCluster(
-                cluster_id=cluster_id,
-                addresses=cluster_set,
-            )
-
-    return None
+    return AddressCluster(
+        cluster_id=cluster_id,
+        addresses=uf.members(cluster_id),
+    )
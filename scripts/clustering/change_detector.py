@@ -24,8 +24,12 @@ SIZE_THRESHOLD = 0.10  # 10%
 # Threshold to detect if value is in satoshis vs BTC
 SATOSHI_THRESHOLD = 1000
 
+# Smallest round unit (0.00001 BTC); every larger round amount up to 1 BTC
+# is a multiple of it, so one modulus test covers them all
+ROUND_AMOUNT_SATS = 1_000
 
-@dataclass
+
+@dataclass(slots=True)
 class ChangeDetectionResult:
     """Result of change output detection.
 
@@ -53,29 +57,25 @@ def _is_round_amount(value: float) -> bool:
     Returns:
         True if amount has few decimal places (likely intentional)
     """
-    import math
-
-    # Handle edge cases: negative, zero, infinity, NaN
-    if value <= 0 or math.isinf(value) or math.isnan(value):
+    # NaN fails every comparison, so this also catches it with zero and
+    # negative values
+    if not value > 0:
         return True
 
     # Detect if value is in satoshis or BTC
     if value > SATOSHI_THRESHOLD:
         # Value is in satoshis - check directly as integer
-        satoshis = int(value)
-        # Check if it's a multiple of common round amounts
-        for divisor in [100_000_000, 10_000_000, 1_000_000, 100_000, 10_000, 1_000]:
-            if satoshis % divisor == 0:
-                return True
-        return False
+        try:
+            return int(value) % ROUND_AMOUNT_SATS == 0
+        except OverflowError:
+            # Infinity
+            return True
     else:
         # Value is in BTC - convert to satoshis safely
         # Use round() to avoid floating point errors
         satoshis = round(value * 1e8)
-        # Check if it's a multiple of common round amounts
-        for divisor in [100_000_000, 10_000_000, 1_000_000, 100_000, 10_000, 1_000]:
-            if satoshis % divisor == 0:
-                return True
+        if satoshis % ROUND_AMOUNT_SATS == 0:
+            return True
 
         # Fallback: Check decimal string representation for BTC values
         str_value = f"{value:.8f}".rstrip("0")
@@ -115,13 +115,16 @@ def detect_change_outputs(tx: dict) -> ChangeDetectionResult:
             result.likely_payment_outputs = [0]
         return result
 
-    # Extract values
+    # Extract values and classify each one once, shared by every heuristic
     values = [out.get("value", 0) for out in vouts]
+    round_flags = [_is_round_amount(value) for value in values]
     max_value = max(values) if values else 0
+    # Outputs equal to an odd value are odd too, so any round output is
+    # one with a different value
+    has_round_output = any(round_flags)
 
     # Apply heuristics to each output
-    for idx, value in enumerate(values):
-        is_round = _is_round_amount(value)
+    for idx, (value, is_round) in enumerate(zip(values, round_flags)):
         is_small = max_value > 0 and value < (max_value * SIZE_THRESHOLD)
 
         # Determine classification
@@ -131,7 +134,6 @@ def detect_change_outputs(tx: dict) -> ChangeDetectionResult:
         elif not is_round:
             # Odd amount with no other indicators is likely change
             # But only if there's a round amount to compare
-            has_round_output = any(_is_round_amount(v) for v in values if v != value)
             if has_round_output:
                 result.likely_change_outputs.append(idx)
             else:
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import dataclass, field
+from datetime import datetime
 
 
 # Whirlpool fixed denominations in SATOSHIS (for electrs API compatibility)
@@ -40,21 +41,23 @@ def _normalize_to_satoshis(value: float) -> int:
     Returns:
         Amount in satoshis (integer), or 0 for invalid values
     """
-    import math
-
-    # Handle edge cases: negative, zero, infinity, NaN
-    if value <= 0 or math.isinf(value) or math.isnan(value):
+    # NaN fails every comparison, so this also rejects it with zero and
+    # negative values
+    if not value > 0:
         return 0
 
     if value > SATOSHI_THRESHOLD:
-        # Already in satoshis
-        return int(value)
-    else:
-        # In BTC, convert to satoshis
-        return int(value * 100_000_000)
+        # Already in satoshis; int() raises OverflowError only for infinity
+        try:
+            return int(value)
+        except OverflowError:
+            return 0
 
+    # In BTC, convert to satoshis
+    return int(value * 100_000_000)
 
-@dataclass
+
+@dataclass(slots=True)
 class CoinJoinResult:
     """Result of CoinJoin detection analysis.
 
@@ -92,82 +95,80 @@ def _check_equal_outputs(vouts: list[dict]) -> tuple[int, float | None]:
         return 0, None
 
     values = [out.get("value", 0) for out in vouts]
-    value_counts = Counter(values)
 
-    if not value_counts:
-        return 0, None
+    # Most multi-output transactions (batched payouts) repeat no value at
+    # all; a set build settles that faster than counting
+    if len(set(values)) == len(values):
+        return 1, None
+
+    # One C-level counting pass; vouts is non-empty, so value_counts is too
+    value_counts = Counter(values)
 
     most_common_value, count = value_counts.most_common(1)[0]
     return count, most_common_value if count > 1 else None
 
 
-def _check_known_patterns(
-    vouts: list[dict],
+def _match_known_pattern(
     equal_count: int,
     equal_value: float | None,
     total_inputs: int,
-) -> tuple[str | None, float, list[str]]:
-    """Check for known CoinJoin protocol patterns.
+) -> tuple[str | None, float]:
+    """Match the equal-output statistics against known CoinJoin patterns.
 
     Args:
-        vouts: Transaction outputs
         equal_count: Number of equal outputs
         equal_value: The equal output value (in original units - BTC or sats)
         total_inputs: Number of inputs
 
     Returns:
-        Tuple of (coinjoin_type, confidence, reasons)
+        Tuple of (coinjoin_type, confidence); (None, 0.0) if nothing matches
     """
-    reasons = []
-    coinjoin_type = None
-    confidence = 0.0
-
     # Check for Wasabi pattern (100+ equal outputs)
     if equal_count >= 100:
-        coinjoin_type = "wasabi"
-        confidence = 0.95
-        reasons.append(f"Wasabi pattern: {equal_count} equal outputs")
-        return coinjoin_type, confidence, reasons
+        return "wasabi", 0.95
 
     # Check for Whirlpool pattern (fixed denominations)
-    # Handle both BTC and satoshi values
-    if equal_value is not None:
-        equal_value_sats = _normalize_to_satoshis(equal_value)
-        is_whirlpool_denom = (
-            equal_value_sats in WHIRLPOOL_DENOMINATIONS_SATS
-            or equal_value in WHIRLPOOL_DENOMINATIONS_BTC
-        )
-        if is_whirlpool_denom and equal_count >= 5:
-            coinjoin_type = "whirlpool"
-            confidence = 0.85
-            # Display value in BTC for readability
-            display_value = (
-                equal_value
-                if equal_value < SATOSHI_THRESHOLD
-                else equal_value / 100_000_000
-            )
-            reasons.append(
-                f"Whirlpool pattern: {equal_count} outputs at {display_value} BTC"
-            )
-            return coinjoin_type, confidence, reasons
+    # Handle both BTC and satoshi values; the count check runs first so
+    # most transactions skip normalization entirely
+    if equal_value is not None and equal_count >= 5:
+        if (
+            equal_value in WHIRLPOOL_DENOMINATIONS_BTC
+            or _normalize_to_satoshis(equal_value) in WHIRLPOOL_DENOMINATIONS_SATS
+        ):
+            return "whirlpool", 0.85
 
     # Check for JoinMarket pattern (maker/taker, 3-10 equal outputs)
     if 3 <= equal_count <= 20 and total_inputs >= 3:
         # JoinMarket typically has taker + makers
-        coinjoin_type = "joinmarket"
-        confidence = 0.7
-        reasons.append(
-            f"JoinMarket pattern: {equal_count} equal outputs, {total_inputs} inputs"
-        )
-        return coinjoin_type, confidence, reasons
+        return "joinmarket", 0.7
 
     # Generic CoinJoin
     if equal_count >= MIN_EQUAL_OUTPUTS_GENERIC and total_inputs >= MIN_INPUTS_GENERIC:
-        coinjoin_type = "generic"
-        confidence = 0.7 + min(0.2, equal_count / 50)  # Scale up to 0.9
-        reasons.append(f"Generic CoinJoin: {equal_count} equal outputs")
+        return "generic", 0.7 + min(0.2, equal_count / 50)  # Scale up to 0.9
 
-    return coinjoin_type, confidence, reasons
+    return None, 0.0
+
+
+def _pattern_reason(
+    coinjoin_type: str,
+    equal_count: int,
+    equal_value: float | None,
+    total_inputs: int,
+) -> str:
+    """Describe why a transaction matched coinjoin_type."""
+    if coinjoin_type == "wasabi":
+        return f"Wasabi pattern: {equal_count} equal outputs"
+    if coinjoin_type == "whirlpool":
+        # Display value in BTC for readability
+        display_value = (
+            equal_value
+            if equal_value < SATOSHI_THRESHOLD
+            else equal_value / 100_000_000
+        )
+        return f"Whirlpool pattern: {equal_count} outputs at {display_value} BTC"
+    if coinjoin_type == "joinmarket":
+        return f"JoinMarket pattern: {equal_count} equal outputs, {total_inputs} inputs"
+    return f"Generic CoinJoin: {equal_count} equal outputs"
 
 
 def detect_coinjoin(tx: dict) -> CoinJoinResult:
@@ -215,15 +216,17 @@ def detect_coinjoin(tx: dict) -> CoinJoinResult:
     result.equal_output_count = equal_count
 
     # Check known patterns
-    coinjoin_type, confidence, reasons = _check_known_patterns(
-        vouts, equal_count, equal_value, total_inputs
+    coinjoin_type, confidence = _match_known_pattern(
+        equal_count, equal_value, total_inputs
     )
 
     if coinjoin_type:
         result.is_coinjoin = True
         result.coinjoin_type = coinjoin_type
         result.confidence = confidence
-        result.detection_reasons.extend(reasons)
+        result.detection_reasons.append(
+            _pattern_reason(coinjoin_type, equal_count, equal_value, total_inputs)
+        )
     else:
         result.detection_reasons.append("No CoinJoin pattern detected")
 
@@ -244,7 +247,6 @@ def save_coinjoin_result(
         True if saved successfully, False otherwise
     """
     import duckdb
-    from datetime import datetime
 
     try:
         conn = duckdb.connect(db_path)
@@ -288,5 +290,14 @@ def is_coinjoin(tx: dict, threshold: float = 0.7) -> bool:
     Returns:
         True if likely CoinJoin, False otherwise
     """
-    result = detect_coinjoin(tx)
-    return result.is_coinjoin and result.confidence >= threshold
+    # Same checks as detect_coinjoin, without building a CoinJoinResult
+    # or its detection_reasons strings
+    vouts = tx.get("vout", [])
+    if len(vouts) < MIN_EQUAL_OUTPUTS_GENERIC:
+        return False
+
+    equal_count, equal_value = _check_equal_outputs(vouts)
+    coinjoin_type, confidence = _match_known_pattern(
+        equal_count, equal_value, len(tx.get("vin", []))
+    )
+    return coinjoin_type is not None and confidence >= threshold
@@ -10,6 +10,7 @@ Reference: Cormen et al., "Introduction to Algorithms" (Chapter 21)
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterable
 
 
 class UnionFind:
@@ -32,6 +33,9 @@ class UnionFind:
         """Initialize empty Union-Find structure."""
         self._parent: dict[str, str] = {}
         self._rank: dict[str, int] = defaultdict(int)
+        # Members of each set, keyed by its current root; kept up to date by
+        # find() and union() so clusters never need a full regrouping pass
+        self._members: dict[str, list[str]] = {}
 
     def find(self, x: str) -> str:
         """Find root of element with path compression.
@@ -42,14 +46,35 @@ class UnionFind:
         Returns:
             Root representative of the set containing x
         """
-        if x not in self._parent:
-            self._parent[x] = x
+        parent = self._parent
+        root = parent.get(x)
+        if root is None:
+            parent[x] = x
+            self._members[x] = [x]
             return x
 
-        # Path compression: make every node point directly to root
-        if self._parent[x] != x:
-            self._parent[x] = self.find(self._parent[x])
-        return self._parent[x]
+        # Walk up to the root iteratively (no recursion depth limit)
+        while (up := parent[root]) != root:
+            root = up
+
+        # Path compression: make every node on the path point directly to root
+        while x != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def find_existing(self, x: str) -> str | None:
+        """Find root of an element without adding it.
+
+        Args:
+            x: Element to find root for
+
+        Returns:
+            Root representative of the set containing x, or None if x is
+            not tracked
+        """
+        if x not in self._parent:
+            return None
+        return self.find(x)
 
     def union(self, x: str, y: str) -> None:
         """Union sets containing x and y using union by rank.
@@ -64,14 +89,47 @@ class UnionFind:
         if root_x == root_y:
             return  # Already in same set
 
+        self._link(root_x, root_y)
+
+    def union_many(self, xs: Iterable[str]) -> None:
+        """Union the sets containing all of xs into one.
+
+        Same result as calling union(first, x) for every other x, but the
+        root of the merged set is carried through the loop instead of
+        being looked up again for each element.
+
+        Args:
+            xs: Elements to merge (empty input is a no-op)
+        """
+        it = iter(xs)
+        first = next(it, None)
+        if first is None:
+            return
+
+        root = self.find(first)
+        for x in it:
+            other = self.find(x)
+            if other != root:
+                root = self._link(root, other)
+
+    def _link(self, root_x: str, root_y: str) -> str:
+        """Merge two distinct roots by rank and return the new root."""
         # Union by rank: attach smaller tree under larger tree
-        if self._rank[root_x] < self._rank[root_y]:
-            self._parent[root_x] = root_y
-        elif self._rank[root_x] > self._rank[root_y]:
-            self._parent[root_y] = root_x
-        else:
-            self._parent[root_y] = root_x
-            self._rank[root_x] += 1
+        rank = self._rank
+        if rank[root_x] < rank[root_y]:
+            root_x, root_y = root_y, root_x
+        elif rank[root_x] == rank[root_y]:
+            rank[root_x] += 1
+        self._parent[root_y] = root_x
+
+        # Move the shorter member list into the longer one
+        members = self._members
+        kept, moved = members[root_x], members.pop(root_y)
+        if len(kept) < len(moved):
+            kept, moved = moved, kept
+            members[root_x] = kept
+        kept.extend(moved)
+        return root_x
 
     def connected(self, x: str, y: str) -> bool:
         """Check if two elements are in the same set.
@@ -84,9 +142,8 @@ class UnionFind:
             True if x and y are in the same set, False otherwise
         """
         # Elements not yet added are not connected
-        if x not in self._parent or y not in self._parent:
-            return False
-        return self.find(x) == self.find(y)
+        root_x = self.find_existing(x)
+        return root_x is not None and root_x == self.find_existing(y)
 
     def get_clusters(self) -> list[set[str]]:
         """Get all disjoint sets as list of sets.
@@ -94,13 +151,27 @@ class UnionFind:
         Returns:
             List of sets, each containing elements in the same cluster
         """
-        clusters: dict[str, set[str]] = defaultdict(set)
+        return [set(members) for members in self._members.values()]
+
+    def members(self, root: str) -> set[str]:
+        """Get the elements of one set.
 
-        for element in self._parent:
-            root = self.find(element)
-            clusters[root].add(element)
+        Args:
+            root: Root representative, as returned by find()
+
+        Returns:
+            Copy of the elements in the set rooted at root
+
+        Raises:
+            KeyError: If root is not the root of a tracked set
+        """
+        return set(self._members[root])
 
-        return list(clusters.values())
+    def reset(self) -> None:
+        """Remove all elements, keeping the instance for reuse."""
+        self._parent.clear()
+        self._rank.clear()
+        self._members.clear()
 
     def __len__(self) -> int:
         """Return number of elements tracked."""
@@ -108,4 +179,4 @@ class UnionFind:
 
     def cluster_count(self) -> int:
         """Return number of distinct clusters."""
-        return len(self.get_clusters())
+        return len(self._members)
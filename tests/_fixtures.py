@@ -0,0 +1,155 @@
+"""Shared PricePoint builders for backtest tests.
+
+Bar attributes are computed as NumPy arrays and converted to Python
+scalars in one tolist() call per column, instead of per-bar datetime and
+float arithmetic in a Python loop.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from scripts.backtest import PricePoint, PriceSeries
+
+START = np.datetime64("2025-01-01T00:00", "us")
+
+# Daily datetimes from 2025-01-01, built once and indexed by day number
+DATES_2025 = tuple((START + np.arange(400).astype("timedelta64[D]")).tolist())
+
+
+def _pattern_signals(n: int, signal_pattern: Optional[str]) -> np.ndarray:
+    """Signal column for a named make_linear_prices signal_pattern."""
+    if signal_pattern is None:
+        return np.zeros(n)
+    if signal_pattern == "alternating":
+        return np.where(np.arange(n) % 2 == 0, 0.5, -0.5)
+    if signal_pattern == "buy":
+        return np.full(n, 0.5)
+    raise ValueError(f"Unknown signal_pattern: {signal_pattern!r}")
+
+
+def make_linear_prices(
+    n: int,
+    base: float = 50000.0,
+    slope: float = 100.0,
+    signal_pattern: Optional[str] = None,
+    confidence=0.9,
+) -> list[PricePoint]:
+    """Daily bars from 2025-01-01 on a linear price ramp.
+
+    Args:
+        n: Number of daily bars
+        base: Price on the first day
+        slope: Price change per day
+        signal_pattern: None for a neutral 0.0 signal, "alternating"
+            for +0.5 on even days and -0.5 on odd days, or "buy" for a
+            constant +0.5
+        confidence: Confidence per bar (scalar or array of length n)
+
+    Returns:
+        List of PricePoint with exchange_price equal to utxoracle_price
+    """
+    prices = base + np.arange(n) * slope
+    return prices_from_arrays(prices, _pattern_signals(n, signal_pattern), confidence)
+
+
+def prices_from_arrays(prices, signals, confidence=0.9) -> list[PricePoint]:
+    """Daily bars from 2025-01-01 built from price and signal arrays.
+
+    Args:
+        prices: Price per day (used for utxoracle and exchange price)
+        signals: Signal value per day
+        confidence: Confidence per bar (scalar or array of the same length)
+
+    Returns:
+        List of PricePoint, one per array element
+    """
+    price_list = np.asarray(prices, dtype=np.float64).tolist()
+    n = len(price_list)
+    timestamps = START + np.arange(n).astype("timedelta64[D]")
+    confidences = np.broadcast_to(np.asarray(confidence, dtype=np.float64), (n,))
+
+    return list(
+        map(
+            PricePoint,
+            timestamps.tolist(),
+            price_list,
+            price_list,
+            confidences.tolist(),
+            np.asarray(signals, dtype=np.float64).tolist(),
+        )
+    )
+
+
+def make_linear_series(
+    n: int,
+    base: float = 50000.0,
+    slope: float = 100.0,
+    signal_pattern: Optional[str] = None,
+) -> PriceSeries:
+    """Same bars as make_linear_prices, built directly as a PriceSeries."""
+    prices = base + np.arange(n) * slope
+    return series_from_arrays(prices, _pattern_signals(n, signal_pattern))
+
+
+def series_from_arrays(
+    prices,
+    signals,
+    confidence=0.9,
+    step: np.timedelta64 = np.timedelta64(1, "D"),
+) -> PriceSeries:
+    """PriceSeries counterpart of prices_from_arrays, with no per-bar objects.
+
+    Args:
+        prices: Price per bar (used for utxoracle and exchange price)
+        signals: Signal value per bar
+        confidence: Confidence per bar (scalar or array of the same length)
+        step: Spacing between bars, starting at 2025-01-01
+
+    Returns:
+        PriceSeries with one row per array element
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    n = len(prices)
+    timestamps = np.empty(n, dtype=object)
+    timestamps[:] = (START + np.arange(n) * step).tolist()
+
+    return PriceSeries(
+        timestamps=timestamps,
+        utxoracle_price=prices,
+        exchange_price=prices.copy(),
+        confidence=np.broadcast_to(
+            np.asarray(confidence, dtype=np.float64), (n,)
+        ).copy(),
+        signal_value=np.asarray(signals, dtype=np.float64),
+    )
+
+
+def random_walk_prices(
+    n: int,
+    seed: int = 42,
+    base: float = 50000.0,
+    sigma: float = 500.0,
+) -> PriceSeries:
+    """Seeded geometric random walk with uniform random signals, as a PriceSeries.
+
+    Daily bars from 2025-01-01. Log returns are drawn as
+    normal(0, sigma / base), so sigma is roughly the daily price move near
+    base. Signals are uniform in [-1, 1) and carry no information about
+    the next move.
+
+    Args:
+        n: Number of daily bars
+        seed: Seed for numpy.random.default_rng (same seed, same series)
+        base: Starting price level
+        sigma: Approximate daily price move, in price units
+
+    Returns:
+        PriceSeries with exchange_price equal to utxoracle_price
+    """
+    rng = np.random.default_rng(seed)
+    log_returns = rng.normal(0.0, sigma / base, size=n)
+    prices = base * np.exp(np.cumsum(log_returns))
+    signals = rng.uniform(-1.0, 1.0, size=n)
+
+    return series_from_arrays(prices, signals)
@@ -4,8 +4,11 @@ Pytest configuration and shared fixtures
 Add global fixtures here that are used across multiple test modules.
 """
 
+import functools
+import sys
+from datetime import datetime
+
 import pytest
-from fastapi.testclient import TestClient
 
 
 @pytest.fixture
@@ -19,7 +22,58 @@ def client():
     Yields:
         TestClient: Configured FastAPI test client
     """
+    from fastapi.testclient import TestClient
+
     from api.main import app
 
     with TestClient(app) as test_client:
         yield test_client
+
+
+@pytest.fixture(scope="session")
+def linear_prices_factory():
+    """
+    Memoized builder for the shared linear-ramp price series.
+
+    Returns a function (n, base=50000.0, slope=100.0, signal_pattern=None)
+    -> tuple of PricePoint, built once per distinct argument set for the
+    whole session. The tuple and its frozen PricePoints are read-only, so
+    tests can share them safely.
+
+    Returns:
+        Callable: Cached wrapper around tests._fixtures.make_linear_prices
+    """
+    from tests._fixtures import make_linear_prices
+
+    @functools.lru_cache(maxsize=32)
+    def _build(n, base=50000.0, slope=100.0, signal_pattern=None):
+        return tuple(make_linear_prices(n, base, slope, signal_pattern))
+
+    return _build
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_numba_kernels():
+    """
+    Compile the backtest numba kernels before the first test runs.
+
+    Otherwise the JIT compile (or on-disk cache load) is billed to
+    whichever backtest test happens to run first. No-op when the collected
+    tests never imported the backtest engine, or numba is not installed.
+    """
+    engine = sys.modules.get("scripts.backtest.engine")
+    if engine is None or not engine.NUMBA_AVAILABLE:
+        return
+
+    from scripts.backtest.data_loader import PricePoint
+    from scripts.backtest.optimizer import combine_signals
+
+    start = datetime(2025, 1, 1)
+    engine.run_backtest(
+        engine.BacktestConfig(start, start, signal_source="warmup"),
+        prices=[
+            PricePoint(start, 100.0, signal_value=0.5),
+            PricePoint(start, 101.0, signal_value=-0.5),
+        ],
+    )
+    combine_signals({"warmup": [0.0]}, {"warmup": 1.0})
@@ -19,6 +19,7 @@ from scripts.backtest import (
     calculate_all_metrics,
     PricePoint,
 )
+from tests._fixtures import DATES_2025
 
 
 class TestDataFlowIntegration:
@@ -65,18 +66,9 @@ class TestDataFlowIntegration:
         assert isinstance(result, BacktestResult)
         assert result.config == config
 
-    def test_compare_signals_empty_signals_dict(self):
+    def test_compare_signals_empty_signals_dict(self, linear_prices_factory):
         """Empty signals dict should return valid ComparisonResult."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(10)
-        ]
+        prices = linear_prices_factory(10)
 
         comparison = compare_signals(
             signals={},
@@ -89,18 +81,9 @@ class TestDataFlowIntegration:
         assert len(comparison.results) == 0
         assert comparison.best_signal == ""
 
-    def test_optimize_weights_single_signal(self):
+    def test_optimize_weights_single_signal(self, linear_prices_factory):
         """Single signal optimization should give weight 1.0."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(20)
-        ]
+        prices = linear_prices_factory(20)
 
         signals = {"only_signal": [0.5] * 20}
 
@@ -180,18 +163,9 @@ class TestMetricsPipelineIntegration:
 class TestWalkForwardIntegration:
     """Test walk-forward validation pipeline."""
 
-    def test_walk_forward_basic(self):
+    def test_walk_forward_basic(self, linear_prices_factory):
         """Basic walk-forward should split data correctly."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(100)
-        ]
+        prices = linear_prices_factory(100)
 
         signals = {
             "trend": [0.5] * 100,
@@ -238,7 +212,7 @@ class TestSignalEdgeCases:
 
         prices = [
             PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
+                timestamp=DATES_2025[i],
                 utxoracle_price=50000 + i * 100,
                 exchange_price=50000 + i * 100,
                 confidence=0.9,
@@ -267,7 +241,7 @@ class TestSignalEdgeCases:
             signal = 0.5 if i % 2 == 0 else -0.5
             prices.append(
                 PricePoint(
-                    timestamp=datetime(2025, 1, 1) + timedelta(days=i),
+                    timestamp=DATES_2025[i],
                     utxoracle_price=50000 + (i % 5) * 100,
                     exchange_price=50000 + (i % 5) * 100,
                     confidence=0.9,
@@ -313,7 +287,7 @@ class TestComparisonRanking:
         """Signals should be ranked by Sharpe ratio (descending)."""
         prices = [
             PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
+                timestamp=DATES_2025[i],
                 utxoracle_price=50000 + i * 100,  # Uptrending price
                 exchange_price=50000 + i * 100,
                 confidence=0.9,
@@ -354,7 +328,7 @@ class TestTransactionCostImpact:
         """High transaction costs should significantly reduce profits."""
         prices = [
             PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
+                timestamp=DATES_2025[i],
                 utxoracle_price=50000 + i * 200,  # Strong uptrend
                 exchange_price=50000 + i * 200,
                 confidence=0.9,
@@ -410,7 +384,7 @@ class TestPricePointDataIntegrity:
 
         prices = [
             PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
+                timestamp=DATES_2025[i],
                 utxoracle_price=50000 + i * 100,
                 exchange_price=50000 + i * 100,
                 confidence=0.0,  # Zero confidence
@@ -3,7 +3,8 @@
 Tests the full backtest workflow from data loading to result analysis.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from tests._fixtures import DATES_2025
 
 
 class TestBacktestPipeline:
@@ -27,7 +28,7 @@ class TestBacktestPipeline:
             signal = 0.4 if i % 5 < 3 else -0.4
             prices.append(
                 PricePoint(
-                    timestamp=datetime(2025, 1, 1) + timedelta(days=i),
+                    timestamp=DATES_2025[i],
                     utxoracle_price=price,
                     exchange_price=price,
                     confidence=0.9,
@@ -58,25 +59,15 @@ class TestBacktestPipeline:
             assert "win_rate" in metrics
             assert "max_drawdown" in metrics
 
-    def test_compare_and_optimize_pipeline(self):
+    def test_compare_and_optimize_pipeline(self, linear_prices_factory):
         """Test signal comparison and optimization workflow."""
         from scripts.backtest import (
             compare_signals,
             optimize_weights,
-            PricePoint,
         )
 
         # Create price data
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(50)
-        ]
+        prices = linear_prices_factory(50)
 
         # Define signals
         signals = {
@@ -11,6 +11,7 @@ from scripts.backtest.engine import (
     BacktestResult,
     ComparisonResult,
 )
+from tests._fixtures import DATES_2025, random_walk_prices
 
 
 class TestDataclasses:
@@ -129,33 +130,13 @@ class TestSingleSignalBacktest:
         - Have near-zero total return (accounting for costs)
         """
         from scripts.backtest.engine import run_backtest
-        from scripts.backtest.data_loader import PricePoint
-        import random
-
-        random.seed(42)  # Reproducible randomness
 
-        # Create price data with random walk
-        prices = []
-        price = 50000.0
-        for i in range(100):
-            # Random signal between -1 and 1
-            signal = random.uniform(-1, 1)
-            # Random price change
-            price += random.uniform(-500, 500)
-            prices.append(
-                PricePoint(
-                    timestamp=datetime(2025, 1, 1)
-                    + __import__("datetime").timedelta(hours=i),
-                    utxoracle_price=price,
-                    exchange_price=price,
-                    confidence=0.5,
-                    signal_value=signal,
-                )
-            )
+        # Seeded random walk with uniform random signals in [-1, 1)
+        prices = random_walk_prices(100, seed=42)
 
         config = BacktestConfig(
             start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 5),
+            end_date=datetime(2025, 4, 10),
             signal_source="test",
             buy_threshold=0.3,
             sell_threshold=-0.3,
@@ -398,8 +379,7 @@ class TestWeightOptimization:
             price = 50000 + 1000 * (i % 10)
             prices.append(
                 PricePoint(
-                    timestamp=datetime(2025, 1, 1)
-                    + __import__("datetime").timedelta(days=i),
+                    timestamp=DATES_2025[i],
                     utxoracle_price=price,
                     exchange_price=price,
                     confidence=0.9,
@@ -425,22 +405,11 @@ class TestWeightOptimization:
         assert result.best_weights is not None
         assert len(result.best_weights) == 2
 
-    def test_weights_sum_to_one(self):
+    def test_weights_sum_to_one(self, linear_prices_factory):
         """T033: Optimized weights should sum to 1.0."""
         from scripts.backtest.optimizer import optimize_weights
-        from scripts.backtest.data_loader import PricePoint
-        from datetime import timedelta
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(50)
-        ]
+        prices = linear_prices_factory(50)
 
         signals = {
             "signal_a": [0.5] * 50,
@@ -459,22 +428,11 @@ class TestWeightOptimization:
         total = sum(result.best_weights.values())
         assert abs(total - 1.0) < 0.01, f"Weights should sum to 1.0, got {total}"
 
-    def test_walk_forward_validation(self):
+    def test_walk_forward_validation(self, linear_prices_factory):
         """T034: Walk-forward validation should prevent overfitting."""
         from scripts.backtest.optimizer import walk_forward_validate
-        from scripts.backtest.data_loader import PricePoint
-        from datetime import timedelta
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(100)
-        ]
+        prices = linear_prices_factory(100)
 
         signals = {
             "whale": [0.5 if i < 50 else -0.5 for i in range(100)],
@@ -3,6 +3,7 @@
 Verifies public API matches documentation and spec requirements.
 """
 
+import dataclasses
 from datetime import datetime, timedelta
 import pytest
 
@@ -24,6 +25,7 @@ from scripts.backtest import (
     calculate_returns,
     # Data exports
     PricePoint,
+    PriceSeries,
     HistoricalData,
     load_historical_data,
     load_from_duckdb,
@@ -35,6 +37,7 @@ from scripts.backtest import (
     optimize_weights,
     walk_forward_validate,
 )
+from tests._fixtures import make_linear_prices, make_linear_series
 
 
 class TestPublicAPIExports:
@@ -62,6 +65,7 @@ class TestPublicAPIExports:
     def test_data_exports(self):
         """Data module exports all documented symbols."""
         assert PricePoint is not None
+        assert PriceSeries is not None
         assert HistoricalData is not None
         assert callable(load_historical_data)
         assert callable(load_from_duckdb)
@@ -104,6 +108,19 @@ class TestBacktestConfigContract:
         assert config.transaction_cost == 0.001
         assert config.initial_capital == 10000.0
 
+    def test_config_is_immutable(self):
+        """BacktestConfig is frozen and slotted, like PricePoint and Trade."""
+        config = BacktestConfig(
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 11, 30),
+            signal_source="test",
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.buy_threshold = 0.5
+        assert not hasattr(config, "__dict__")
+        assert dataclasses.replace(config, buy_threshold=0.5).buy_threshold == 0.5
+
     def test_all_fields_configurable(self):
         """All documented fields can be customized."""
         config = BacktestConfig(
@@ -126,7 +143,7 @@ class TestBacktestConfigContract:
 class TestBacktestResultContract:
     """Verify BacktestResult matches documented interface."""
 
-    def test_result_has_documented_fields(self):
+    def test_result_has_documented_fields(self, linear_prices_factory):
         """BacktestResult has all documented fields from quickstart."""
         config = BacktestConfig(
             start_date=datetime(2025, 1, 1),
@@ -134,16 +151,7 @@ class TestBacktestResultContract:
             signal_source="test",
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,
-            )
-            for i in range(10)
-        ]
+        prices = linear_prices_factory(10, signal_pattern="alternating")
 
         result = run_backtest(config, prices=prices)
 
@@ -165,18 +173,9 @@ class TestBacktestResultContract:
 class TestComparisonResultContract:
     """Verify ComparisonResult matches documented interface."""
 
-    def test_comparison_has_ranking(self):
+    def test_comparison_has_ranking(self, linear_prices_factory):
         """ComparisonResult has ranking list."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(20)
-        ]
+        prices = linear_prices_factory(20)
 
         signals = {
             "whale": [0.5] * 20,
@@ -206,18 +205,9 @@ class TestComparisonResultContract:
 class TestOptimizationResultContract:
     """Verify OptimizationResult matches documented interface."""
 
-    def test_optimization_has_documented_fields(self):
+    def test_optimization_has_documented_fields(self, linear_prices_factory):
         """OptimizationResult has best_weights, best_sharpe, improvement."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(30)
-        ]
+        prices = linear_prices_factory(30)
 
         signals = {
             "trend": [0.5] * 30,
@@ -273,6 +263,98 @@ class TestPricePointContract:
         assert pp.confidence == 0.0
         assert pp.signal_value is None
 
+    def test_pricepoint_is_immutable(self):
+        """PricePoint is frozen and slotted, so shared fixtures cannot be mutated."""
+        pp = PricePoint(timestamp=datetime(2025, 1, 1), utxoracle_price=50000.0)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pp.signal_value = 0.5
+        assert not hasattr(pp, "__dict__")
+        assert hash(pp) == hash(
+            PricePoint(timestamp=datetime(2025, 1, 1), utxoracle_price=50000.0)
+        )
+
+
+class TestPriceSeriesContract:
+    """Verify PriceSeries is interchangeable with list[PricePoint]."""
+
+    def test_roundtrip_pricepoints(self):
+        """Indexing a converted series gives back the original PricePoints."""
+        prices = [
+            PricePoint(datetime(2025, 1, 1), 50000.0, 50100.0, 0.9, 0.5),
+            PricePoint(datetime(2025, 1, 2), 50200.0),
+        ]
+        series = PriceSeries.from_pricepoints(prices)
+
+        assert len(series) == 2
+        assert list(series) == prices
+        assert series[-1].exchange_price is None
+        assert series[-1].signal_value is None
+        assert list(series[1:]) == prices[1:]
+
+    def test_linear_series_matches_pricepoints(self):
+        """make_linear_series builds the same bars as make_linear_prices."""
+        assert list(make_linear_series(10, signal_pattern="alternating")) == (
+            make_linear_prices(10, signal_pattern="alternating")
+        )
+
+    def test_backtest_accepts_series(self):
+        """run_backtest gives identical results for a list or a PriceSeries."""
+        config = BacktestConfig(
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 1, 30),
+            signal_source="test",
+        )
+        from_list = run_backtest(
+            config, prices=make_linear_prices(30, signal_pattern="alternating")
+        )
+        from_series = run_backtest(
+            config, prices=make_linear_series(30, signal_pattern="alternating")
+        )
+
+        assert from_series.trades == from_list.trades
+        assert from_series.equity_curve == from_list.equity_curve
+        assert from_series.timestamps == from_list.timestamps
+
+    def test_float32_series_backtest(self):
+        """A float32 series backtests like float64 (equity stays float64)."""
+        import numpy as np
+
+        prices = make_linear_prices(30, signal_pattern="alternating")
+        config = BacktestConfig(
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 1, 30),
+            signal_source="test",
+            initial_capital=1_000_000_000.0,
+        )
+        fp32 = PriceSeries.from_pricepoints(prices, dtype=np.float32)
+
+        assert fp32.utxoracle_price.dtype == np.float32
+        result = run_backtest(config, prices=fp32)
+        expected = run_backtest(config, prices=prices)
+
+        assert result.num_trades == expected.num_trades
+        assert result.equity_curve == pytest.approx(expected.equity_curve, rel=1e-6)
+
+    def test_comparison_and_optimizer_accept_series(self):
+        """compare_signals and optimize_weights accept a PriceSeries."""
+        signals = {"a": [0.5] * 20, "b": [-0.5] * 20}
+        kwargs = dict(
+            signals=signals,
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 1, 20),
+        )
+
+        comparison = compare_signals(prices=make_linear_series(20), **kwargs)
+        optimization = optimize_weights(
+            prices=make_linear_series(20), step=0.5, **kwargs
+        )
+
+        expected = compare_signals(prices=make_linear_prices(20), **kwargs)
+        assert comparison.ranking == expected.ranking
+        assert comparison.best_sharpe == expected.best_sharpe
+        assert sum(optimization.best_weights.values()) == pytest.approx(1.0)
+
 
 class TestTradeContract:
     """Verify Trade data class interface."""
@@ -300,6 +382,15 @@ class TestTradeContract:
         assert trade.pnl_pct == 0.1
         assert trade.signal_value == 0.5
 
+    def test_trade_is_immutable(self):
+        """Trade is frozen and slotted (no per-instance __dict__)."""
+        now = datetime.now()
+        trade = Trade(now, now, 100.0, 110.0, "LONG", 10.0, 0.1, 0.5)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            trade.pnl = 0.0
+        assert not hasattr(trade, "__dict__")
+
 
 class TestMetricsFunctionContracts:
     """Verify metrics function signatures and behavior."""
@@ -18,6 +18,7 @@ from scripts.backtest import (
 )
 from scripts.backtest.optimizer import generate_weight_grid, combine_signals
 from scripts.backtest.engine import get_signal_action, execute_trade
+from tests._fixtures import DATES_2025, random_walk_prices
 
 
 class TestThresholdBoundaries:
@@ -362,7 +363,7 @@ class TestSignalValueBoundaries:
 
         prices = [
             PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
+                timestamp=DATES_2025[i],
                 utxoracle_price=50000 + i * 100,
                 exchange_price=50000 + i * 100,
                 confidence=0.9,
@@ -391,7 +392,7 @@ class TestSignalValueBoundaries:
             signal = 0.29 if i % 2 == 0 else 0.31
             prices.append(
                 PricePoint(
-                    timestamp=datetime(2025, 1, 1) + timedelta(days=i),
+                    timestamp=DATES_2025[i],
                     utxoracle_price=50000,
                     exchange_price=50000,
                     confidence=0.9,
@@ -438,6 +439,115 @@ class TestCombineSignalsBoundaries:
         combined = combine_signals(signals, weights)
         assert all(c == -1.0 for c in combined)
 
+    def test_ragged_signal_lengths(self):
+        """Shorter signals contribute nothing past their end."""
+        signals = {"a": [1.0, 1.0, 1.0], "b": [2.0]}
+        weights = {"a": 0.5, "b": 0.5}
+
+        combined = combine_signals(signals, weights)
+        assert combined == [1.5, 0.5, 0.5]
+
+    def test_numpy_fallback_matches_loop_kernel(self):
+        """NumPy fallback (no numba) gives bit-identical sums to the loop kernel."""
+        import numpy as np
+        from scripts.backtest.optimizer_fast import _combine_loops, _combine_numpy
+
+        rng = np.random.default_rng(7)
+        sig_mat = rng.uniform(-1, 1, (5, 30))
+        weights = rng.dirichlet(np.ones(5))
+
+        assert np.array_equal(
+            _combine_loops(sig_mat, weights), _combine_numpy(sig_mat, weights)
+        )
+
+    def test_grid_combination_matches_per_candidate(self):
+        """combine_signal_grid rows are bit-identical to combine_signals."""
+        from scripts.backtest.optimizer import generate_weight_grid_arr
+        from scripts.backtest.optimizer_fast import combine_signal_grid, stack_signals
+
+        signals = {
+            "a": [0.1 * i for i in range(12)],
+            "b": [(-1) ** i * 0.3 for i in range(12)],
+            "c": [0.7] * 8,  # Shorter series is zero-padded
+        }
+        grid = generate_weight_grid_arr(len(signals), step=0.1)
+
+        combined = combine_signal_grid(stack_signals(signals), grid)
+
+        for row, weights in zip(combined.tolist(), grid.tolist()):
+            assert row == combine_signals(signals, dict(zip(signals, weights)))
+
+
+class TestBacktestKernelBoundaries:
+    """Test the compiled run_backtest loop against its pure-Python fallback."""
+
+    def test_python_fallback_matches_kernel(self, monkeypatch):
+        """Pure-Python loop on lists gives identical trades and equity."""
+        import numpy as np
+        from scripts.backtest import engine
+
+        series = random_walk_prices(60, seed=11)
+        # Every 7th bar has no signal (HOLD)
+        signals = np.where(np.arange(60) % 7 == 0, np.nan, series.signal_value)
+        prices = series.with_signal(signals)
+        config = BacktestConfig(
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 3, 1),
+            signal_source="test",
+        )
+
+        compiled = run_backtest(config, prices=prices)
+        monkeypatch.setattr(engine, "NUMBA_AVAILABLE", False)
+        monkeypatch.setattr(engine, "_backtest_kernel", engine._backtest_loop)
+        fallback = run_backtest(config, prices=prices)
+
+        assert compiled.trades == fallback.trades
+        assert compiled.equity_curve == fallback.equity_curve
+
+    def test_inert_signals_skip_simulation(self, monkeypatch):
+        """Signals that never reach a threshold return an empty result early."""
+        from scripts.backtest import engine
+
+        def fail(*args):
+            raise AssertionError("bar loop should be skipped")
+
+        monkeypatch.setattr(engine, "_simulate", fail)
+        prices = [
+            PricePoint(
+                timestamp=DATES_2025[i],
+                utxoracle_price=50000.0 + i,
+                signal_value=None if i % 3 == 0 else 0.29,
+            )
+            for i in range(10)
+        ]
+        config = BacktestConfig(
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 1, 10),
+            signal_source="test",
+        )
+
+        result = run_backtest(config, prices=prices)
+
+        assert result.trades == []
+        assert result.equity_curve == [config.initial_capital]
+        assert result.timestamps == list(DATES_2025[:10])
+        assert result.total_return == 0.0
+
+    @pytest.mark.parametrize("signal", [0.3, -0.3])
+    def test_signal_at_threshold_is_not_inert(self, signal):
+        """A signal exactly at a threshold still trades."""
+        import numpy as np
+        from scripts.backtest.engine import _is_inert
+
+        config = BacktestConfig(
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 1, 2),
+            signal_source="test",
+        )
+
+        assert not _is_inert(np.array([0.0, signal, np.nan]), config)
+        assert _is_inert(np.array([np.nan, np.nan]), config)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
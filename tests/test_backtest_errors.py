@@ -20,6 +20,11 @@ from scripts.backtest import (
     calculate_returns,
     PricePoint,
 )
+from scripts.backtest.metrics_vec import (
+    max_drawdown_arr,
+    sharpe_ratio_arr,
+    sortino_ratio_arr,
+)
 from scripts.backtest.optimizer import generate_weight_grid
 from scripts.backtest.engine import get_signal_action, execute_trade
 
@@ -54,18 +59,9 @@ class TestGracefulDegradation:
         assert result.num_trades == 0
         assert result.total_return == 0.0
 
-    def test_empty_signals_graceful(self):
+    def test_empty_signals_graceful(self, linear_prices_factory):
         """Empty signals dict should return valid result, not crash."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(10)
-        ]
+        prices = linear_prices_factory(10)
 
         comparison = compare_signals(
             signals={},
@@ -107,6 +103,26 @@ class TestNaNHandling:
         # Should handle NaN somehow (may be NaN or skip it)
         assert isinstance(result, float)
 
+    @pytest.mark.parametrize(
+        "metric, values, expected",
+        [
+            (sharpe_ratio, [0.01, float("nan"), 0.02], 0.0),
+            (sharpe_ratio_arr, [0.01, float("nan"), 0.02], 0.0),
+            (sortino_ratio, [0.01, float("nan"), 0.02], 0.0),
+            (sortino_ratio_arr, [0.01, float("nan"), 0.02], 0.0),
+            (max_drawdown, [100, float("nan"), 80], 0.2),
+            (max_drawdown_arr, [100, float("nan"), 80], 0.2),
+        ],
+    )
+    def test_nan_behaviour_shared_by_list_and_array_metrics(
+        self, metric, values, expected
+    ):
+        """List and array metrics agree on NaN input.
+
+        NaN mean/variance gives 0.0; NaN equity is skipped for drawdown.
+        """
+        assert metric(values) == pytest.approx(expected)
+
     def test_calculate_returns_with_nan(self):
         """NaN in equity should produce NaN returns."""
         equity = [100, float("nan"), 120]
@@ -240,18 +256,9 @@ class TestSignalActionEdgeCases:
 class TestOptimizationErrors:
     """Test optimization error handling."""
 
-    def test_optimize_with_zero_step(self):
+    def test_optimize_with_zero_step(self, linear_prices_factory):
         """Zero step should return empty grid, not crash."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(10)
-        ]
+        prices = linear_prices_factory(10)
 
         signals = {"a": [0.5] * 10}
 
@@ -267,6 +274,28 @@ class TestOptimizationErrors:
         # Should return result, even if empty
         assert hasattr(result, "best_weights")
 
+    def test_optimize_with_unknown_method(self):
+        """Unknown optimization method should raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown optimization method"):
+            optimize_weights(
+                signals={"a": [0.5] * 10},
+                prices=[],
+                start_date=datetime(2025, 1, 1),
+                end_date=datetime(2025, 1, 10),
+                method="annealing",
+            )
+
+    def test_optimize_with_unknown_precision(self):
+        """Unknown precision should raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown precision"):
+            optimize_weights(
+                signals={"a": [0.5] * 10},
+                prices=[],
+                start_date=datetime(2025, 1, 1),
+                end_date=datetime(2025, 1, 10),
+                precision="fp16",
+            )
+
 
 class TestBacktestEdgeErrors:
     """Test backtest edge case error handling."""
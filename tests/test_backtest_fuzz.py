@@ -1,12 +1,24 @@
 """Round 6 (Pass 2): Fuzz testing with random inputs.
 
-Uses property-based testing with random data to find edge cases.
+Uses property-based testing (Hypothesis) to find edge cases.
+
+Example counts are controlled by Hypothesis profiles: "dev" (default) keeps
+local runs fast, "ci" explores more inputs. Select with HYPOTHESIS_PROFILE=ci.
+
+Tests share no mutable state, so the module runs in parallel with
+pytest-xdist:
+
+    pytest -n auto --dist loadgroup tests/test_backtest_fuzz.py
 """
 
 import math
+import os
 import random
 from datetime import datetime, timedelta
+import numpy as np
 import pytest
+from hypothesis import assume, example, given, settings, strategies as st
+from hypothesis.extra.numpy import arrays
 
 from scripts.backtest import (
     BacktestConfig,
@@ -21,69 +33,148 @@ from scripts.backtest import (
     calculate_returns,
     PricePoint,
 )
-from scripts.backtest.optimizer import generate_weight_grid, combine_signals
+from scripts.backtest.metrics_vec import (
+    sharpe_ratio_arr,
+    sortino_ratio_arr,
+    max_drawdown_arr,
+    win_rate_arr,
+    profit_factor_arr,
+    calculate_returns_arr,
+)
+from scripts.backtest.optimizer import generate_weight_grid_arr, combine_signals
 from scripts.backtest.engine import get_signal_action, execute_trade
+from scripts.backtest.engine_vec import compare_signals_arr, run_backtest_batch
+from tests._fixtures import DATES_2025
+
+
+settings.register_profile("dev", max_examples=20, deadline=None)
+settings.register_profile("ci", max_examples=200, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
+# Fixed trade timestamps: tests only check invariants, not wall-clock time
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+ONE_HOUR = timedelta(hours=1)
+EXIT_TIMES = [NOW + h * ONE_HOUR for h in range(1, 101)]  # 1h..100h after NOW
+
+# Bar timestamps: index i is i hours after 2025-01-01 (covers n <= 60);
+# daily bars use the shared DATES_2025 table
+HOURS_2025 = [datetime(2025, 1, 1) + timedelta(hours=i) for i in range(61)]
+
+
+def _floats(min_value, max_value):
+    """Finite floats in [min_value, max_value]."""
+    return st.floats(min_value, max_value, allow_nan=False, allow_infinity=False)
+
+
+returns_lists = st.lists(_floats(-0.5, 0.5), min_size=5, max_size=100)
+
+pnl_arrays = arrays(np.float64, st.integers(1, 50), elements=_floats(-1000, 1000))
+
+trades_strategy = st.builds(
+    Trade,
+    entry_time=st.just(NOW),
+    exit_time=st.just(EXIT_TIMES[0]),
+    entry_price=_floats(10000, 100000),
+    exit_price=_floats(10000, 100000),
+    direction=st.sampled_from(["LONG", "SHORT"]),
+    pnl=_floats(-1000, 1000),
+    pnl_pct=_floats(-0.1, 0.1),
+    signal_value=_floats(-1, 1),
+)
+
+
+@st.composite
+def random_walk_bars(draw):
+    """Random-walk price and signal arrays (10-50 days)."""
+    n = draw(st.integers(10, 50))
+    base_price = draw(_floats(10000, 100000))
+    steps = draw(arrays(np.float64, n, elements=_floats(-0.02, 0.02)))
+    signal_values = draw(arrays(np.float64, n, elements=_floats(-1, 1)))
+
+    prices = base_price * (1 + steps * np.arange(n))
+    return prices, signal_values
 
 
-# Seed for reproducibility
-random.seed(42)
+def _config_arrays(size):
+    """Per-config backtest parameters for run_backtest_batch."""
+    return st.fixed_dictionaries(
+        {
+            "buy_thresholds": arrays(np.float64, size, elements=_floats(0.1, 0.5)),
+            "sell_thresholds": arrays(np.float64, size, elements=_floats(-0.5, -0.1)),
+            "position_size": arrays(np.float64, size, elements=_floats(0.1, 1.0)),
+            "transaction_cost": arrays(np.float64, size, elements=_floats(0.0, 0.01)),
+            "initial_capital": arrays(np.float64, size, elements=_floats(1000, 1e5)),
+        }
+    )
+
+
+@st.composite
+def named_signals(draw, prefix, min_signals, max_signals, length):
+    """Dict of prefix{i} -> signal values in [-1, 1], all of one length."""
+    n_signals = draw(st.integers(min_signals, max_signals))
+    values = st.lists(_floats(-1, 1), min_size=length, max_size=length)
+    return {f"{prefix}{i}": draw(values) for i in range(n_signals)}
+
+
+# Mean is ~-1.6e-18 while both ratios come out ~+1e-16: the sign of a
+# near-zero mean is rounding noise
+_NEAR_ZERO_MEAN_RETURNS = [-0.4, 0.0, 0.0, 0.1, 0.1, 0.1, -0.1, -0.5, 0.2]
+_NEAR_ZERO_MEAN_RETURNS += [0.4, 0.0, 0.1, -0.5, 0.3, -0.1, 0.4, -0.1]
 
 
 class TestRandomizedInputs:
     """Test with randomized inputs."""
 
-    @pytest.mark.parametrize("iteration", range(20))
-    def test_random_returns_sharpe(self, iteration):
+    @given(returns=returns_lists)
+    @example(returns=_NEAR_ZERO_MEAN_RETURNS)
+    def test_random_returns_sharpe(self, returns):
         """Sharpe ratio should handle any random returns."""
-        n = random.randint(5, 100)
-        returns = [random.uniform(-0.5, 0.5) for _ in range(n)]
-
         result = sharpe_ratio(returns)
 
-        # Should always return a float (possibly NaN or Inf)
+        # Should always return a float, never NaN for finite input
         assert isinstance(result, float)
-        # If finite, should be reasonable range
-        if math.isfinite(result):
-            assert -100 < result < 100
-
-    @pytest.mark.parametrize("iteration", range(20))
-    def test_random_returns_sortino(self, iteration):
+        assert not math.isnan(result)
+        # Sign follows a clearly nonzero mean return (rf = 0); zero-variance
+        # curves give 0.0
+        mean_return = sum(returns) / len(returns)
+        if abs(mean_return) > 1e-12:
+            assert result == 0.0 or (result > 0) == (mean_return > 0)
+
+    @given(returns=returns_lists)
+    @example(returns=_NEAR_ZERO_MEAN_RETURNS)
+    def test_random_returns_sortino(self, returns):
         """Sortino ratio should handle any random returns."""
-        n = random.randint(5, 100)
-        returns = [random.uniform(-0.5, 0.5) for _ in range(n)]
-
         result = sortino_ratio(returns)
 
         assert isinstance(result, float)
-        if math.isfinite(result):
-            assert -100 < result < 100
-
-    @pytest.mark.parametrize("iteration", range(20))
-    def test_random_equity_max_drawdown(self, iteration):
+        assert not math.isnan(result)
+        if not any(r < 0 for r in returns):
+            # No downside: +inf for positive mean, otherwise 0.0
+            assert result in (float("inf"), 0.0)
+        else:
+            mean_return = sum(returns) / len(returns)
+            if abs(mean_return) > 1e-12:
+                assert result == 0.0 or (result > 0) == (mean_return > 0)
+
+    @given(changes=arrays(np.float64, st.integers(4, 99), elements=_floats(-0.1, 0.12)))
+    def test_random_equity_max_drawdown(self, changes):
         """Max drawdown should handle any random equity curve."""
-        n = random.randint(5, 100)
-        # Random walk equity curve
-        equity = [10000.0]
-        for _ in range(n - 1):
-            change = random.uniform(-0.1, 0.12)  # Slight upward bias
-            equity.append(equity[-1] * (1 + change))
+        # Random walk equity curve (slight upward bias)
+        equity = 10000.0 * np.concatenate([[1.0], np.cumprod(1 + changes)])
 
-        result = max_drawdown(equity)
+        result = max_drawdown_arr(equity)
 
         assert isinstance(result, float)
         # Drawdown is between 0 and 1 (0% to 100%)
         if math.isfinite(result):
             assert 0.0 <= result <= 1.0
 
-    @pytest.mark.parametrize("iteration", range(20))
-    def test_random_equity_returns(self, iteration):
+    @given(equity=st.lists(_floats(100, 10000), min_size=2, max_size=50))
+    def test_random_equity_returns(self, equity):
         """calculate_returns should handle any random equity curve."""
-        n = random.randint(2, 50)
-        equity = [random.uniform(100, 10000) for _ in range(n)]
-
         returns = calculate_returns(equity)
 
-        assert len(returns) == n - 1
+        assert len(returns) == len(equity) - 1
         for r in returns:
             assert isinstance(r, float)
 
@@ -91,150 +182,183 @@ class TestRandomizedInputs:
 class TestRandomizedTrades:
     """Test with randomized trade data."""
 
-    @pytest.mark.parametrize("iteration", range(20))
-    def test_random_trades_win_rate(self, iteration):
+    @given(pnl=pnl_arrays)
+    def test_random_trades_win_rate(self, pnl):
         """Win rate should handle random trades."""
-        now = datetime.now()
-        n = random.randint(1, 50)
-
-        trades = []
-        for _ in range(n):
-            pnl = random.uniform(-1000, 1000)
-            trades.append(
-                Trade(
-                    entry_time=now,
-                    exit_time=now + timedelta(hours=1),
-                    entry_price=random.uniform(10000, 100000),
-                    exit_price=random.uniform(10000, 100000),
-                    direction=random.choice(["LONG", "SHORT"]),
-                    pnl=pnl,
-                    pnl_pct=pnl / 10000,
-                    signal_value=random.uniform(-1, 1),
-                )
-            )
-
-        rate = win_rate(trades)
+        rate = win_rate_arr(pnl)
 
         assert 0.0 <= rate <= 1.0
 
-    @pytest.mark.parametrize("iteration", range(20))
-    def test_random_trades_profit_factor(self, iteration):
+    @given(pnl=pnl_arrays)
+    def test_random_trades_profit_factor(self, pnl):
         """Profit factor should handle random trades."""
-        now = datetime.now()
-        n = random.randint(1, 50)
-
-        trades = []
-        for _ in range(n):
-            pnl = random.uniform(-1000, 1000)
-            trades.append(
-                Trade(
-                    entry_time=now,
-                    exit_time=now + timedelta(hours=1),
-                    entry_price=random.uniform(10000, 100000),
-                    exit_price=random.uniform(10000, 100000),
-                    direction=random.choice(["LONG", "SHORT"]),
-                    pnl=pnl,
-                    pnl_pct=pnl / 10000,
-                    signal_value=random.uniform(-1, 1),
-                )
-            )
-
-        pf = profit_factor(trades)
+        pf = profit_factor_arr(pnl)
 
         assert isinstance(pf, float)
         assert pf >= 0.0
 
 
+class TestArrayMetricsAgreement:
+    """Array metrics should agree with the Trade/list-based metrics."""
+
+    @given(trades=st.lists(trades_strategy, max_size=50))
+    def test_win_rate_matches(self, trades):
+        """win_rate_arr equals win_rate on the same P&L."""
+        pnl = np.array([t.pnl for t in trades])
+        assert win_rate_arr(pnl) == win_rate(trades)
+
+    @given(trades=st.lists(trades_strategy, max_size=50))
+    def test_profit_factor_matches(self, trades):
+        """profit_factor_arr matches profit_factor on the same P&L."""
+        pnl = np.array([t.pnl for t in trades])
+        assert profit_factor_arr(pnl) == pytest.approx(profit_factor(trades))
+
+    @given(equity=st.lists(_floats(-100, -1) | _floats(1, 10000), max_size=50))
+    def test_max_drawdown_matches(self, equity):
+        """max_drawdown_arr equals max_drawdown, including non-positive peaks."""
+        assert max_drawdown_arr(np.array(equity)) == max_drawdown(equity)
+
+    @given(equity=st.lists(st.just(0.0) | _floats(1, 10000), max_size=50))
+    def test_returns_match(self, equity):
+        """calculate_returns_arr matches calculate_returns, including zero equity."""
+        np.testing.assert_allclose(
+            calculate_returns_arr(np.array(equity)), calculate_returns(equity)
+        )
+
+    @given(returns=returns_lists)
+    def test_sharpe_sortino_match(self, returns):
+        """Sharpe/Sortino array versions match the list versions."""
+        # Near-constant returns amplify summation-order rounding differences
+        assume(np.std(returns) > 1e-6)
+        arr = np.array(returns)
+        assert sharpe_ratio_arr(arr) == pytest.approx(sharpe_ratio(returns))
+        assert sortino_ratio_arr(arr) == pytest.approx(sortino_ratio(returns))
+
+
 class TestRandomizedBacktest:
     """Test backtest with randomized inputs."""
 
-    @pytest.mark.parametrize("iteration", range(10))
-    def test_random_prices_backtest(self, iteration):
-        """Backtest should handle random price data."""
-        n = random.randint(10, 50)
-        base_price = random.uniform(10000, 100000)
-
-        prices = []
-        for i in range(n):
-            # Random walk price
-            price = base_price * (1 + random.uniform(-0.02, 0.02) * i)
-            prices.append(
-                PricePoint(
-                    timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                    utxoracle_price=price,
-                    exchange_price=price,
-                    confidence=random.uniform(0.5, 1.0),
-                    signal_value=random.uniform(-1, 1),
-                )
+    @given(bars=random_walk_bars(), params=_config_arrays(10))
+    def test_random_prices_backtest(self, bars, params):
+        """Batched backtest should handle random price data and configs."""
+        prices, signal_values = bars
+
+        batch = run_backtest_batch(prices, signal_values, **params)
+
+        # Should always return valid per-config results
+        assert batch.num_trades.shape == (10,)
+        assert np.isfinite(batch.total_return).all()
+        assert ((batch.win_rate >= 0) & (batch.win_rate <= 1)).all()
+        assert batch.num_trades.sum() == batch.pnl.size
+        # Every trade exits strictly after it enters, within the series
+        assert (batch.exit_index > batch.entry_index).all()
+        assert (batch.exit_index < len(prices)).all()
+
+    @given(bars=random_walk_bars(), params=_config_arrays(3))
+    def test_batch_matches_run_backtest(self, bars, params):
+        """Each batch row should reproduce run_backtest for that config."""
+        prices, signal_values = bars
+        price_points = [
+            PricePoint(
+                timestamp=DATES_2025[i],
+                utxoracle_price=price,
+                exchange_price=price,
+                confidence=0.9,
+                signal_value=signal,
+            )
+            for i, (price, signal) in enumerate(
+                zip(prices.tolist(), signal_values.tolist())
             )
+        ]
 
-        config = BacktestConfig(
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 1) + timedelta(days=n),
-            signal_source="test",
-            buy_threshold=random.uniform(0.1, 0.5),
-            sell_threshold=random.uniform(-0.5, -0.1),
-            position_size=random.uniform(0.1, 1.0),
-            transaction_cost=random.uniform(0.0, 0.01),
-            initial_capital=random.uniform(1000, 100000),
-        )
+        batch = run_backtest_batch(prices, signal_values, **params)
 
-        result = run_backtest(config, prices=prices)
+        for row in range(3):
+            config = BacktestConfig(
+                start_date=DATES_2025[0],
+                end_date=DATES_2025[len(prices)],
+                signal_source="test",
+                buy_threshold=params["buy_thresholds"][row],
+                sell_threshold=params["sell_thresholds"][row],
+                position_size=params["position_size"][row],
+                transaction_cost=params["transaction_cost"][row],
+                initial_capital=params["initial_capital"][row],
+            )
+            result = run_backtest(config, prices=price_points)
+
+            assert batch.num_trades[row] == result.num_trades
+            assert batch.win_rate[row] == result.win_rate
+            assert batch.total_return[row] == pytest.approx(result.total_return)
+            np.testing.assert_allclose(
+                batch.pnl[batch.trade_config == row],
+                [t.pnl for t in result.trades],
+                rtol=1e-9,
+            )
 
-        # Should always return valid result
-        assert isinstance(result.num_trades, int)
-        assert isinstance(result.total_return, float)
-        assert isinstance(result.sharpe_ratio, float)
+    @given(data=st.data(), n=st.integers(20, 50))
+    def test_random_signals_comparison(self, data, n):
+        """Array-mode comparison should handle random signal data."""
+        prices = 50000 + np.asarray(
+            data.draw(st.lists(_floats(-1000, 1000), min_size=n, max_size=n))
+        )
+        signals = data.draw(named_signals("signal_", 2, 5, n))
+        sig_mat = np.array([signals[name] for name in sorted(signals)])
+
+        comparison = compare_signals_arr(sig_mat, prices)
 
-    @pytest.mark.parametrize("iteration", range(10))
-    def test_random_signals_comparison(self, iteration):
-        """Compare signals should handle random signal data."""
-        n = random.randint(20, 50)
+        assert comparison.sharpe_ratio.shape == (len(signals),)
+        assert sorted(comparison.ranking) == list(range(len(signals)))
+        ranked = comparison.sharpe_ratio[comparison.ranking]
+        assert (np.diff(ranked) <= 0).all()
 
+    @given(data=st.data(), n=st.integers(20, 50))
+    def test_comparison_arr_matches_compare_signals(self, data, n):
+        """compare_signals_arr should reproduce compare_signals per signal."""
+        offsets = data.draw(st.lists(_floats(-1000, 1000), min_size=n, max_size=n))
         prices = [
             PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + random.uniform(-1000, 1000),
-                exchange_price=50000 + random.uniform(-1000, 1000),
+                timestamp=DATES_2025[i],
+                utxoracle_price=50000 + offsets[i],
+                exchange_price=50000 + offsets[i],
                 confidence=0.9,
                 signal_value=0.0,
             )
             for i in range(n)
         ]
-
-        num_signals = random.randint(2, 5)
-        signals = {
-            f"signal_{i}": [random.uniform(-1, 1) for _ in range(n)]
-            for i in range(num_signals)
-        }
+        signals = data.draw(named_signals("signal_", 2, 5, n))
 
         comparison = compare_signals(
             signals=signals,
             prices=prices,
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 1) + timedelta(days=n),
+            start_date=DATES_2025[0],
+            end_date=DATES_2025[n],
+        )
+        batch = compare_signals_arr(
+            np.array(list(signals.values())),
+            np.array([p.utxoracle_price for p in prices]),
         )
 
-        assert len(comparison.results) == num_signals
-        assert comparison.best_signal in signals
+        for row, name in enumerate(signals):
+            result = comparison.results[name]
+            assert batch.num_trades[row] == result.num_trades
+            assert batch.sharpe_ratio[row] == pytest.approx(
+                result.sharpe_ratio, rel=1e-6, abs=1e-9
+            )
 
 
 class TestRandomizedWeights:
     """Test weight operations with random data."""
 
-    @pytest.mark.parametrize("iteration", range(20))
-    def test_random_weights_combine(self, iteration):
+    @given(data=st.data(), length=st.integers(5, 30))
+    def test_random_weights_combine(self, data, length):
         """Combine signals should work with any random weights."""
-        n_signals = random.randint(2, 5)
-        length = random.randint(5, 30)
-
-        signals = {
-            f"s{i}": [random.uniform(-1, 1) for _ in range(length)]
-            for i in range(n_signals)
-        }
+        signals = data.draw(named_signals("s", 2, 5, length))
 
         # Random weights that sum to 1
-        raw_weights = [random.random() for _ in range(n_signals)]
+        n_signals = len(signals)
+        raw_weights = data.draw(
+            st.lists(_floats(0.01, 1.0), min_size=n_signals, max_size=n_signals)
+        )
         total = sum(raw_weights)
         weights = {f"s{i}": w / total for i, w in enumerate(raw_weights)}
 
@@ -249,13 +373,10 @@ class TestRandomizedWeights:
     @pytest.mark.parametrize("n_signals", [2, 3, 4])
     def test_weight_grid_coverage(self, n_signals):
         """Weight grid should cover all valid combinations."""
-        signals = [f"s{i}" for i in range(n_signals)]
-        grid = generate_weight_grid(signals, step=0.5)
+        grid = generate_weight_grid_arr(n_signals, step=0.5)
 
         # All weights should sum to 1
-        for weights in grid:
-            total = sum(weights.values())
-            assert total == pytest.approx(1.0, abs=1e-10)
+        np.testing.assert_allclose(grid.sum(axis=1), 1.0, rtol=0, atol=1e-10)
 
         # Should have enough combinations
         # With step=0.5: 3 values (0, 0.5, 1) per signal
@@ -266,13 +387,13 @@ class TestRandomizedWeights:
 class TestRandomizedSignalActions:
     """Test signal action determination with random inputs."""
 
-    @pytest.mark.parametrize("iteration", range(50))
-    def test_random_signal_action(self, iteration):
+    @given(
+        signal=_floats(-2, 2),
+        buy_threshold=_floats(-0.5, 0.5),
+        sell_threshold=_floats(-0.5, 0.5),
+    )
+    def test_random_signal_action(self, signal, buy_threshold, sell_threshold):
         """get_signal_action should handle any signal values."""
-        signal = random.uniform(-2, 2)
-        buy_threshold = random.uniform(-0.5, 0.5)
-        sell_threshold = random.uniform(-0.5, 0.5)
-
         action = get_signal_action(signal, buy_threshold, sell_threshold)
 
         # Should always return valid action
@@ -282,23 +403,32 @@ class TestRandomizedSignalActions:
 class TestRandomizedTradeExecution:
     """Test trade execution with random inputs."""
 
-    @pytest.mark.parametrize("iteration", range(30))
-    def test_random_trade_execution(self, iteration):
+    @given(
+        entry_price=_floats(100, 100000),
+        exit_price=_floats(100, 100000),
+        direction=st.sampled_from(["LONG", "SHORT"]),
+        position_size=_floats(0.1, 2.0),
+        transaction_cost=_floats(0, 0.01),
+        capital=_floats(1000, 1000000),
+        signal_value=_floats(-1, 1),
+        hold_hours=st.integers(1, 100),
+    )
+    def test_random_trade_execution(
+        self,
+        entry_price,
+        exit_price,
+        direction,
+        position_size,
+        transaction_cost,
+        capital,
+        signal_value,
+        hold_hours,
+    ):
         """execute_trade should handle random inputs."""
-        now = datetime.now()
-
-        entry_price = random.uniform(100, 100000)
-        exit_price = random.uniform(100, 100000)
-        direction = random.choice(["LONG", "SHORT"])
-        position_size = random.uniform(0.1, 2.0)
-        transaction_cost = random.uniform(0, 0.01)
-        capital = random.uniform(1000, 1000000)
-        signal_value = random.uniform(-1, 1)
-
         trade = execute_trade(
-            entry_time=now,
+            entry_time=NOW,
             entry_price=entry_price,
-            exit_time=now + timedelta(hours=random.randint(1, 100)),
+            exit_time=EXIT_TIMES[hold_hours - 1],
             exit_price=exit_price,
             direction=direction,
             position_size=position_size,
@@ -315,17 +445,14 @@ class TestRandomizedTradeExecution:
 class TestEdgeCaseFuzzing:
     """Fuzz test known edge cases."""
 
-    @pytest.mark.parametrize("iteration", range(20))
-    def test_near_zero_prices(self, iteration):
+    @given(small_price=_floats(0.001, 1.0), move=_floats(0.9, 1.1))
+    def test_near_zero_prices(self, small_price, move):
         """Test with prices near zero."""
-        now = datetime.now()
-        small_price = random.uniform(0.001, 1.0)
-
         trade = execute_trade(
-            entry_time=now,
+            entry_time=NOW,
             entry_price=small_price,
-            exit_time=now + timedelta(hours=1),
-            exit_price=small_price * random.uniform(0.9, 1.1),
+            exit_time=EXIT_TIMES[0],
+            exit_price=small_price * move,
             direction="LONG",
             position_size=1.0,
             transaction_cost=0.001,
@@ -335,17 +462,14 @@ class TestEdgeCaseFuzzing:
 
         assert isinstance(trade.pnl, float)
 
-    @pytest.mark.parametrize("iteration", range(20))
-    def test_very_large_prices(self, iteration):
+    @given(large_price=_floats(1e10, 1e15), move=_floats(0.99, 1.01))
+    def test_very_large_prices(self, large_price, move):
         """Test with very large prices."""
-        now = datetime.now()
-        large_price = random.uniform(1e10, 1e15)
-
         trade = execute_trade(
-            entry_time=now,
+            entry_time=NOW,
             entry_price=large_price,
-            exit_time=now + timedelta(hours=1),
-            exit_price=large_price * random.uniform(0.99, 1.01),
+            exit_time=EXIT_TIMES[0],
+            exit_price=large_price * move,
             direction="LONG",
             position_size=1.0,
             transaction_cost=0.001,
@@ -355,16 +479,17 @@ class TestEdgeCaseFuzzing:
 
         assert isinstance(trade.pnl, float)
 
-    @pytest.mark.parametrize("iteration", range(20))
-    def test_oscillating_signals(self, iteration):
+    @given(data=st.data(), n=st.integers(20, 50))
+    def test_oscillating_signals(self, data, n):
         """Test rapidly oscillating signals."""
-        n = random.randint(20, 50)
-
+        offsets = data.draw(
+            st.lists(_floats(-100, 100), min_size=2 * n, max_size=2 * n)
+        )
         prices = [
             PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(hours=i),
-                utxoracle_price=50000 + random.uniform(-100, 100),
-                exchange_price=50000 + random.uniform(-100, 100),
+                timestamp=HOURS_2025[i],
+                utxoracle_price=50000 + offsets[2 * i],
+                exchange_price=50000 + offsets[2 * i + 1],
                 confidence=0.9,
                 # Rapidly oscillating signal
                 signal_value=1.0 if i % 2 == 0 else -1.0,
@@ -373,8 +498,8 @@ class TestEdgeCaseFuzzing:
         ]
 
         config = BacktestConfig(
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 1) + timedelta(hours=n),
+            start_date=HOURS_2025[0],
+            end_date=HOURS_2025[n],
             signal_source="test",
             buy_threshold=0.5,
             sell_threshold=-0.5,
@@ -386,6 +511,7 @@ class TestEdgeCaseFuzzing:
         assert isinstance(result.num_trades, int)
 
 
+@pytest.mark.xdist_group("determinism")
 class TestDeterminism:
     """Verify deterministic behavior with same seed."""
 
@@ -394,22 +520,23 @@ class TestDeterminism:
         results = []
 
         for _ in range(3):
-            random.seed(12345)
+            # Local generator: immune to RNG state left by other tests/workers
+            rng = random.Random(12345)
 
             prices = [
                 PricePoint(
-                    timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                    utxoracle_price=50000 + random.uniform(-1000, 1000),
-                    exchange_price=50000 + random.uniform(-1000, 1000),
+                    timestamp=DATES_2025[i],
+                    utxoracle_price=50000 + rng.uniform(-1000, 1000),
+                    exchange_price=50000 + rng.uniform(-1000, 1000),
                     confidence=0.9,
-                    signal_value=random.uniform(-1, 1),
+                    signal_value=rng.uniform(-1, 1),
                 )
                 for i in range(30)
             ]
 
             config = BacktestConfig(
-                start_date=datetime(2025, 1, 1),
-                end_date=datetime(2025, 1, 30),
+                start_date=DATES_2025[0],
+                end_date=DATES_2025[29],
                 signal_source="test",
             )
 
@@ -4,6 +4,7 @@ Tests mathematical invariants and data consistency guarantees.
 """
 
 from datetime import datetime, timedelta
+import numpy as np
 import pytest
 
 from scripts.backtest import (
@@ -16,9 +17,65 @@ from scripts.backtest import (
     win_rate,
     profit_factor,
     calculate_returns,
-    PricePoint,
 )
-from scripts.backtest.optimizer import generate_weight_grid, combine_signals
+from scripts.backtest.optimizer import (
+    generate_weight_grid,
+    generate_weight_grid_arr,
+    combine_signals,
+)
+
+
+@pytest.fixture(scope="module")
+def alternating_prices_10(linear_prices_factory):
+    """10-day linear price ramp with a +0.5/-0.5 alternating signal."""
+    return linear_prices_factory(10, signal_pattern="alternating")
+
+
+@pytest.fixture(scope="module")
+def linear_prices_20(linear_prices_factory):
+    """20-day linear price ramp, shared read-only across the module."""
+    return linear_prices_factory(20)
+
+
+@pytest.fixture(scope="module")
+def linear_prices_30(linear_prices_factory):
+    """30-day linear price ramp, shared read-only across the module."""
+    return linear_prices_factory(30)
+
+
+@pytest.fixture(scope="module")
+def alternating_backtest(alternating_prices_10):
+    """run_backtest on the alternating-signal ramp (50k initial capital)."""
+    config = BacktestConfig(
+        start_date=datetime(2025, 1, 1),
+        end_date=datetime(2025, 1, 10),
+        signal_source="test",
+        initial_capital=50000.0,
+    )
+    return run_backtest(config, prices=alternating_prices_10)
+
+
+@pytest.fixture(scope="module")
+def comparison_ab_20(linear_prices_20):
+    """compare_signals for a constant buy vs. constant sell signal."""
+    return compare_signals(
+        signals={"a": [0.5] * 20, "b": [-0.5] * 20},
+        prices=linear_prices_20,
+        start_date=datetime(2025, 1, 1),
+        end_date=datetime(2025, 1, 20),
+    )
+
+
+@pytest.fixture(scope="module")
+def optimize_result_ab(linear_prices_30):
+    """optimize_weights over two constant signals on the 30-day ramp."""
+    return optimize_weights(
+        signals={"a": [0.5] * 30, "b": [0.3] * 30},
+        prices=linear_prices_30,
+        start_date=datetime(2025, 1, 1),
+        end_date=datetime(2025, 1, 30),
+        step=0.5,
+    )
 
 
 class TestWeightInvariants:
@@ -27,32 +84,29 @@ class TestWeightInvariants:
     @pytest.mark.parametrize("n_signals", [2, 3, 4, 5])
     def test_weights_sum_to_one(self, n_signals):
         """All weight combinations should sum to exactly 1.0."""
-        signals = [f"s{i}" for i in range(n_signals)]
-        grid = generate_weight_grid(signals, step=0.2)
+        grid = generate_weight_grid_arr(n_signals, step=0.2)
 
-        for weights in grid:
-            total = sum(weights.values())
-            assert total == pytest.approx(1.0, abs=1e-10), (
-                f"Weights sum to {total}, not 1.0"
-            )
+        np.testing.assert_allclose(grid.sum(axis=1), 1.0, rtol=0, atol=1e-10)
 
     def test_weights_non_negative(self):
         """Generated weights should be non-negative."""
-        signals = ["a", "b", "c"]
-        grid = generate_weight_grid(signals, step=0.2)
+        grid = generate_weight_grid_arr(3, step=0.2)
 
-        for weights in grid:
-            for name, weight in weights.items():
-                assert weight >= 0.0, f"Negative weight {weight} for {name}"
+        assert (grid >= 0.0).all(), f"Negative weights in {grid[grid < 0]}"
 
     def test_weights_at_most_one(self):
         """No single weight should exceed 1.0."""
+        grid = generate_weight_grid_arr(3, step=0.2)
+
+        assert (grid <= 1.0).all(), f"Weights > 1.0: {grid[grid > 1.0]}"
+
+    def test_dict_grid_matches_array_grid(self):
+        """generate_weight_grid dicts are the rows of the array grid."""
         signals = ["a", "b", "c"]
         grid = generate_weight_grid(signals, step=0.2)
+        grid_arr = generate_weight_grid_arr(len(signals), step=0.2)
 
-        for weights in grid:
-            for name, weight in weights.items():
-                assert weight <= 1.0, f"Weight {weight} > 1.0 for {name}"
+        assert [list(w.values()) for w in grid] == grid_arr.tolist()
 
 
 class TestMetricBounds:
@@ -114,52 +168,16 @@ class TestMetricBounds:
 class TestEquityCurveConsistency:
     """Test equity curve consistency with trades."""
 
-    def test_equity_curve_starts_at_initial_capital(self):
+    def test_equity_curve_starts_at_initial_capital(self, alternating_backtest):
         """Equity curve should start at initial capital."""
-        config = BacktestConfig(
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 10),
-            signal_source="test",
-            initial_capital=50000.0,
-        )
-
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,
-            )
-            for i in range(10)
-        ]
-
-        result = run_backtest(config, prices=prices)
+        result = alternating_backtest
 
         if result.equity_curve:
             assert result.equity_curve[0] == 50000.0
 
-    def test_equity_changes_match_trade_pnl(self):
+    def test_equity_changes_match_trade_pnl(self, alternating_backtest):
         """Changes in equity should match trade P&L."""
-        config = BacktestConfig(
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 10),
-            signal_source="test",
-            initial_capital=10000.0,
-        )
-
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,
-            )
-            for i in range(10)
-        ]
-
-        result = run_backtest(config, prices=prices)
+        result = alternating_backtest
 
         if result.trades and len(result.equity_curve) > 1:
             total_pnl = sum(t.pnl for t in result.trades)
@@ -170,48 +188,39 @@ class TestEquityCurveConsistency:
 class TestReturnsConsistency:
     """Test returns calculation consistency."""
 
-    def test_returns_length(self):
-        """Returns should have length n-1 for equity curve of length n."""
-        test_curves = [
+    @pytest.mark.parametrize(
+        "curve",
+        [
             [100, 110],
             [100, 110, 120],
             [100, 110, 120, 130, 140],
-        ]
+        ],
+    )
+    def test_returns_length(self, curve):
+        """Returns should have length n-1 for equity curve of length n."""
+        returns = calculate_returns(curve)
 
-        for curve in test_curves:
-            returns = calculate_returns(curve)
-            assert len(returns) == len(curve) - 1
+        assert len(returns) == len(curve) - 1
+        equity = np.asarray(curve, dtype=float)
+        np.testing.assert_allclose(returns, np.diff(equity) / equity[:-1])
 
     def test_returns_reconstruct_equity(self):
         """Returns should reconstruct equity curve."""
         equity = [100.0, 110.0, 99.0, 120.0]
         returns = calculate_returns(equity)
 
-        # Reconstruct from returns
-        reconstructed = [equity[0]]
-        for r in returns:
-            reconstructed.append(reconstructed[-1] * (1 + r))
+        # Reconstruct from returns: equity[0] * cumulative product of (1 + r)
+        growth = np.cumprod(1 + np.asarray(returns))
+        reconstructed = equity[0] * np.concatenate([[1.0], growth])
 
-        for e1, e2 in zip(equity, reconstructed):
-            assert e1 == pytest.approx(e2, rel=1e-10)
+        np.testing.assert_allclose(equity, reconstructed, rtol=1e-10)
 
 
 class TestComparisonRankingConsistency:
     """Test signal comparison ranking consistency."""
 
-    def test_ranking_matches_sharpe_order(self):
+    def test_ranking_matches_sharpe_order(self, linear_prices_30):
         """Ranking should be ordered by Sharpe ratio (descending)."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(30)
-        ]
-
         signals = {
             "strong_buy": [0.5] * 30,
             "weak_buy": [0.35] * 30,
@@ -220,7 +229,7 @@ class TestComparisonRankingConsistency:
 
         comparison = compare_signals(
             signals=signals,
-            prices=prices,
+            prices=linear_prices_30,
             start_date=datetime(2025, 1, 1),
             end_date=datetime(2025, 1, 30),
         )
@@ -230,52 +239,16 @@ class TestComparisonRankingConsistency:
         for i in range(len(sharpes) - 1):
             assert sharpes[i] >= sharpes[i + 1], "Ranking not sorted by Sharpe"
 
-    def test_best_signal_is_first_in_ranking(self):
+    def test_best_signal_is_first_in_ranking(self, comparison_ab_20):
         """best_signal should be the first in ranking."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(20)
-        ]
-
-        signals = {"a": [0.5] * 20, "b": [-0.5] * 20}
-
-        comparison = compare_signals(
-            signals=signals,
-            prices=prices,
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 20),
-        )
+        comparison = comparison_ab_20
 
         if comparison.ranking:
             assert comparison.best_signal == comparison.ranking[0]
 
-    def test_best_sharpe_matches_best_signal(self):
+    def test_best_sharpe_matches_best_signal(self, comparison_ab_20):
         """best_sharpe should match Sharpe of best_signal."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(20)
-        ]
-
-        signals = {"a": [0.5] * 20, "b": [-0.5] * 20}
-
-        comparison = compare_signals(
-            signals=signals,
-            prices=prices,
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 20),
-        )
+        comparison = comparison_ab_20
 
         if comparison.best_signal:
             assert (
@@ -287,55 +260,17 @@ class TestComparisonRankingConsistency:
 class TestOptimizationConsistency:
     """Test optimization result consistency."""
 
-    def test_optimized_weights_sum_to_one(self):
+    def test_optimized_weights_sum_to_one(self, optimize_result_ab):
         """Optimized weights should sum to 1.0."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(30)
-        ]
-
-        signals = {"a": [0.5] * 30, "b": [-0.5] * 30}
-
-        result = optimize_weights(
-            signals=signals,
-            prices=prices,
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 30),
-            step=0.5,
-        )
+        result = optimize_result_ab
 
         if result.best_weights:
             total = sum(result.best_weights.values())
             assert total == pytest.approx(1.0, abs=1e-10)
 
-    def test_improvement_matches_sharpe_difference(self):
+    def test_improvement_matches_sharpe_difference(self, optimize_result_ab):
         """Improvement should match (best - baseline) / |baseline|."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(30)
-        ]
-
-        signals = {"a": [0.5] * 30, "b": [0.3] * 30}
-
-        result = optimize_weights(
-            signals=signals,
-            prices=prices,
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 30),
-            step=0.5,
-        )
+        result = optimize_result_ab
 
         if result.baseline_sharpe != 0:
             expected_improvement = (result.best_sharpe - result.baseline_sharpe) / abs(
@@ -354,9 +289,8 @@ class TestCombineSignalsConsistency:
 
         combined = combine_signals(signals, weights)
 
-        for i in range(3):
-            expected = 0.3 * signals["a"][i] + 0.7 * signals["b"][i]
-            assert combined[i] == pytest.approx(expected)
+        expected = 0.3 * np.array(signals["a"]) + 0.7 * np.array(signals["b"])
+        np.testing.assert_allclose(combined, expected, rtol=1e-9)
 
     def test_equal_weights_is_average(self):
         """Equal weights should give simple average."""
@@ -365,8 +299,7 @@ class TestCombineSignalsConsistency:
 
         combined = combine_signals(signals, weights)
 
-        for c in combined:
-            assert c == pytest.approx(15.0)  # (10 + 20) / 2
+        np.testing.assert_allclose(combined, 15.0)  # (10 + 20) / 2
 
 
 class TestTradeConsistency:
@@ -5,6 +5,7 @@ Tests for scalability, memory usage, and computation time.
 
 import time
 from datetime import datetime, timedelta
+import numpy as np
 import pytest
 
 from scripts.backtest import (
@@ -15,9 +16,9 @@ from scripts.backtest import (
     sharpe_ratio,
     calculate_returns,
     calculate_all_metrics,
-    PricePoint,
 )
 from scripts.backtest.optimizer import generate_weight_grid, combine_signals
+from tests._fixtures import make_linear_series, series_from_arrays
 
 
 class TestScalability:
@@ -32,16 +33,13 @@ class TestScalability:
             signal_source="test",
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(hours=i),
-                utxoracle_price=50000 + (i % 100) * 10,
-                exchange_price=50000 + (i % 100) * 10,
-                confidence=0.9,
-                signal_value=0.5 if i % 10 < 5 else -0.5,
-            )
-            for i in range(n_prices)
-        ]
+        # Hourly bars: sawtooth price, signal flips every 5 hours
+        i = np.arange(n_prices)
+        prices = series_from_arrays(
+            50000 + (i % 100) * 10,
+            np.where(i % 10 < 5, 0.5, -0.5),
+            step=np.timedelta64(1, "h"),
+        )
 
         start = time.time()
         result = run_backtest(config, prices=prices)
@@ -60,16 +58,7 @@ class TestScalability:
     @pytest.mark.parametrize("n_signals", [2, 3, 4, 5])
     def test_compare_signals_scales_with_signal_count(self, n_signals):
         """Signal comparison should scale with number of signals."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(100)
-        ]
+        prices = make_linear_series(100)
 
         signals = {
             f"signal_{i}": [0.5 if j % 2 == 0 else -0.5 for j in range(100)]
@@ -220,16 +209,7 @@ class TestOptimizationPerformance:
 
     def test_optimization_with_coarse_grid(self):
         """Optimization with coarse grid should be fast."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(50)
-        ]
+        prices = make_linear_series(50)
 
         signals = {
             "trend": [0.5] * 50,
@@ -263,16 +243,12 @@ class TestMemoryEfficiency:
             signal_source="test",
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(hours=i),
-                utxoracle_price=50000 + i * 10,
-                exchange_price=50000 + i * 10,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,
-            )
-            for i in range(100)
-        ]
+        i = np.arange(100)
+        prices = series_from_arrays(
+            50000 + i * 10,
+            np.where(i % 2 == 0, 0.5, -0.5),
+            step=np.timedelta64(1, "h"),
+        )
 
         # Run multiple times
         for _ in range(10):
@@ -1,9 +1,19 @@
 """Round 5 (Pass 2): Regression tests with complex scenarios.
 
 Tests complex real-world scenarios combining multiple features.
+
+Tests share only read-only session fixtures, so the module runs in
+parallel with pytest-xdist. --dist loadfile keeps it on one worker so the
+cached price series are built once:
+
+    pytest -n auto --dist loadfile tests/test_backtest_regression.py
+
+Optimizer scenarios are marked slow; skip them with -m "not slow".
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
+import math
+import numpy as np
 import pytest
 
 from scripts.backtest import (
@@ -21,191 +31,116 @@ from scripts.backtest import (
     PricePoint,
 )
 from scripts.backtest.optimizer import combine_signals
+from tests._fixtures import make_linear_prices, prices_from_arrays
+
+try:
+    import scipy  # noqa: F401
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Grid search plus the SLSQP solver (skipped when scipy is not installed)
+OPTIMIZE_METHODS = [
+    "grid",
+    pytest.param(
+        "scipy",
+        marks=pytest.mark.skipif(not SCIPY_AVAILABLE, reason="scipy not installed"),
+    ),
+]
+
+
+def _bull_pullback_prices() -> list[PricePoint]:
+    """90-day up trend with a 10% pullback every 30 days."""
+    i = np.arange(90)
+    trend = 50000 * (1 + i * 0.01)
+    price = np.where(i % 30 == 25, trend * 0.9, trend)
+    # Bullish signals except during pullbacks
+    signal = np.where(i % 30 >= 25, -0.5, 0.5)
+    return prices_from_arrays(price, signal)
+
+
+def _bear_rally_prices() -> list[PricePoint]:
+    """90-day down trend with a 10% rally every 30 days."""
+    i = np.arange(90)
+    trend = 50000 * (1 - i * 0.005)
+    price = np.where(i % 30 == 25, trend * 1.1, trend)
+    # Bearish signals except during rallies
+    signal = np.where(i % 30 >= 25, 0.5, -0.5)
+    return prices_from_arrays(price, signal)
+
+
+def _sideways_prices() -> list[PricePoint]:
+    """30 days oscillating around 50000 with 5% swings (choppy)."""
+    even_day = np.arange(30) % 2 == 0
+    price = np.where(even_day, 52500, 47500)
+    signal = np.where(even_day, 0.5, -0.5)
+    return prices_from_arrays(price, signal)
+
+
+def _flash_crash_prices() -> list[PricePoint]:
+    """20 days with a 50% crash on day 5 and recovery by day 15."""
+    i = np.arange(20)
+    crash = i == 5
+    recovery = (i > 5) & (i < 15)
+    price = np.select(
+        [crash, recovery],
+        [25000, 25000 + (i - 5) * 2500],
+        default=50000,
+    )
+    # Bearish at crash, bullish during recovery
+    signal = np.select([crash, recovery], [-0.8, 0.5], default=0.0)
+    return prices_from_arrays(price, signal)
+
+
+REGIMES = {
+    "bull_pullback": _bull_pullback_prices,
+    "bear_rally": _bear_rally_prices,
+    "sideways": _sideways_prices,
+    "flash_crash": _flash_crash_prices,
+}
+
+# Regime-specific checks on top of the shared validity assertions
+REGIME_INVARIANTS = {
+    # Even in a bull market, going SHORT during pullbacks can lose money if
+    # the recovery is faster than expected, so only trading is asserted
+    "bull_pullback": lambda r: r.num_trades > 0,
+    "bear_rally": lambda r: r.num_trades >= 0,
+    # Choppy market may have many trades; costs may eat into profits
+    "sideways": lambda r: r.num_trades >= 0,
+    # Max drawdown should reflect the 50% crash
+    "flash_crash": lambda r: max_drawdown(r.equity_curve) >= 0.0,
+}
 
 
 class TestComplexTradingScenarios:
     """Test complex trading scenarios."""
 
-    def test_bull_market_with_pullbacks(self):
-        """Bull market with periodic 10% pullbacks."""
+    @pytest.mark.parametrize("regime", list(REGIMES))
+    def test_market_regime(self, regime):
+        """Backtest completes with valid results in each market regime."""
+        prices = REGIMES[regime]()
         config = BacktestConfig(
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 3, 31),
+            start_date=prices[0].timestamp,
+            end_date=prices[-1].timestamp,
             signal_source="test",
             buy_threshold=0.3,
             sell_threshold=-0.3,
         )
 
-        # Bull market: up trend with periodic pullbacks
-        prices = []
-        base = 50000
-        for i in range(90):
-            # 10% pullback every 30 days
-            if i % 30 == 25:
-                price = base * (1 + i * 0.01) * 0.9
-            else:
-                price = base * (1 + i * 0.01)
-
-            # Bullish signals except during pullbacks
-            signal = -0.5 if i % 30 >= 25 else 0.5
-
-            prices.append(
-                PricePoint(
-                    timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                    utxoracle_price=price,
-                    exchange_price=price,
-                    confidence=0.9,
-                    signal_value=signal,
-                )
-            )
-
         result = run_backtest(config, prices=prices)
 
-        # Note: Even in bull market, going SHORT during pullbacks can lose money
-        # if the recovery is faster than expected. The key invariant is that
-        # the backtest completes and produces valid results.
         assert isinstance(result.total_return, float)
-        # Should have some trades
-        assert result.num_trades > 0
-
-    def test_bear_market_with_rallies(self):
-        """Bear market with periodic 10% rallies."""
-        config = BacktestConfig(
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 3, 31),
-            signal_source="test",
-            buy_threshold=0.3,
-            sell_threshold=-0.3,
-        )
-
-        # Bear market: down trend with periodic rallies
-        prices = []
-        base = 50000
-        for i in range(90):
-            # 10% rally every 30 days
-            if i % 30 == 25:
-                price = base * (1 - i * 0.005) * 1.1
-            else:
-                price = base * (1 - i * 0.005)
-
-            # Bearish signals except during rallies
-            signal = 0.5 if i % 30 >= 25 else -0.5
-
-            prices.append(
-                PricePoint(
-                    timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                    utxoracle_price=price,
-                    exchange_price=price,
-                    confidence=0.9,
-                    signal_value=signal,
-                )
-            )
-
-        result = run_backtest(config, prices=prices)
-
-        # Should complete without error
         assert isinstance(result.num_trades, int)
-
-    def test_sideways_market_high_volatility(self):
-        """Sideways market with high volatility (choppy)."""
-        config = BacktestConfig(
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 30),
-            signal_source="test",
-            buy_threshold=0.3,
-            sell_threshold=-0.3,
-        )
-
-        # Sideways: oscillate around 50000 with 5% swings
-        prices = []
-        for i in range(30):
-            # High frequency oscillation
-            swing = 2500 if i % 2 == 0 else -2500
-            price = 50000 + swing
-
-            # Alternating signals
-            signal = 0.5 if i % 2 == 0 else -0.5
-
-            prices.append(
-                PricePoint(
-                    timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                    utxoracle_price=price,
-                    exchange_price=price,
-                    confidence=0.9,
-                    signal_value=signal,
-                )
-            )
-
-        result = run_backtest(config, prices=prices)
-
-        # Choppy market may have many trades
-        assert result.num_trades >= 0
-        # Transaction costs may eat into profits
-        assert isinstance(result.total_return, float)
-
-    def test_flash_crash_recovery(self):
-        """Flash crash (50% drop) followed by recovery."""
-        config = BacktestConfig(
-            start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 20),
-            signal_source="test",
-            buy_threshold=0.3,
-            sell_threshold=-0.3,
-        )
-
-        # Flash crash on day 5, recovery by day 15
-        prices = []
-        for i in range(20):
-            if i < 5:
-                price = 50000
-            elif i == 5:
-                price = 25000  # 50% crash
-            elif i < 15:
-                price = 25000 + (i - 5) * 2500  # Recovery
-            else:
-                price = 50000  # Recovered
-
-            # Bearish at crash, bullish during recovery
-            if i == 5:
-                signal = -0.8
-            elif 5 < i < 15:
-                signal = 0.5
-            else:
-                signal = 0.0
-
-            prices.append(
-                PricePoint(
-                    timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                    utxoracle_price=price,
-                    exchange_price=price,
-                    confidence=0.9,
-                    signal_value=signal,
-                )
-            )
-
-        result = run_backtest(config, prices=prices)
-
-        # Max drawdown should reflect the 50% crash
-        if result.equity_curve and len(result.equity_curve) > 1:
-            dd = max_drawdown(result.equity_curve)
-            assert dd >= 0.0  # Some drawdown expected
+        assert REGIME_INVARIANTS[regime](result)
 
 
 class TestMultiSignalComparison:
     """Test complex multi-signal comparison scenarios."""
 
-    def test_compare_correlated_signals(self):
+    def test_compare_correlated_signals(self, linear_prices_factory):
         """Compare signals that are highly correlated."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(50)
-        ]
+        prices = linear_prices_factory(50)
 
         # Two signals that are 90% correlated
         signal_a = [0.5 if i % 3 != 2 else -0.5 for i in range(50)]
@@ -228,18 +163,9 @@ class TestMultiSignalComparison:
         assert comparison.results["signal_a"] is not None
         assert comparison.results["signal_b"] is not None
 
-    def test_compare_anti_correlated_signals(self):
+    def test_compare_anti_correlated_signals(self, linear_prices_factory):
         """Compare signals that are anti-correlated (opposite)."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(50)
-        ]
+        prices = linear_prices_factory(50)
 
         # Two signals that are perfectly opposite
         signal_bull = [0.5] * 50
@@ -261,23 +187,10 @@ class TestMultiSignalComparison:
 
     def test_compare_with_mixed_confidence(self):
         """Compare signals where prices have varying confidence."""
-        prices = []
-        for i in range(50):
-            # Confidence drops in middle period
-            if 20 <= i < 30:
-                confidence = 0.3  # Low confidence period
-            else:
-                confidence = 0.9
-
-            prices.append(
-                PricePoint(
-                    timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                    utxoracle_price=50000 + i * 100,
-                    exchange_price=50000 + i * 100,
-                    confidence=confidence,
-                    signal_value=0.0,
-                )
-            )
+        # Confidence drops in middle period (days 20-29)
+        confidence = np.full(50, 0.9)
+        confidence[20:30] = 0.3  # Low confidence period
+        prices = make_linear_prices(50, confidence=confidence)
 
         signals = {"constant": [0.5] * 50}
 
@@ -295,18 +208,10 @@ class TestMultiSignalComparison:
 class TestOptimizationEdgeCases:
     """Test optimization edge cases."""
 
-    def test_optimize_identical_signals(self):
+    @pytest.mark.slow
+    def test_optimize_identical_signals(self, linear_prices_factory):
         """Optimize weights when all signals are identical."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(30)
-        ]
+        prices = linear_prices_factory(30)
 
         # All signals identical
         signals = {
@@ -325,20 +230,13 @@ class TestOptimizationEdgeCases:
 
         # All weight combinations should give same result
         # Improvement should be 0 or near-zero
-        assert result.improvement == pytest.approx(0.0, abs=0.01)
+        assert math.isclose(result.improvement, 0.0, abs_tol=0.01)
 
-    def test_optimize_many_signals(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("method", OPTIMIZE_METHODS)
+    def test_optimize_many_signals(self, linear_prices_factory, method):
         """Optimize weights with many signals (grid explosion)."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(30)
-        ]
+        prices = linear_prices_factory(30)
 
         # 5 signals with large step to keep grid manageable
         signals = {
@@ -352,24 +250,37 @@ class TestOptimizationEdgeCases:
             start_date=datetime(2025, 1, 1),
             end_date=datetime(2025, 1, 30),
             step=0.5,  # Large step to limit grid size
+            method=method,
         )
 
         # Should complete and have valid weights
         assert result.best_weights is not None
-        assert sum(result.best_weights.values()) == pytest.approx(1.0, abs=1e-10)
+        assert math.isclose(sum(result.best_weights.values()), 1.0, abs_tol=1e-10)
 
-    def test_optimize_single_signal(self):
+    def test_optimize_fp32_matches_fp64(self, linear_prices_factory):
+        """fp32 signal combination picks the same weights as fp64."""
+        prices = linear_prices_factory(30)
+        signals = {
+            f"s{i}": [0.5 if j % (i + 2) == 0 else -0.5 for j in range(30)]
+            for i in range(3)
+        }
+        kwargs = dict(
+            signals=signals,
+            prices=prices,
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 1, 30),
+            step=0.5,
+        )
+
+        fp64 = optimize_weights(**kwargs)
+        fp32 = optimize_weights(precision="fp32", **kwargs)
+
+        assert fp32.best_weights == fp64.best_weights
+        assert fp32.best_sharpe == pytest.approx(fp64.best_sharpe, rel=1e-6)
+
+    def test_optimize_single_signal(self, linear_prices_factory):
         """Optimize weights with only one signal (trivial case)."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(30)
-        ]
+        prices = linear_prices_factory(30)
 
         signals = {"only_signal": [0.5] * 30}
 
@@ -382,7 +293,7 @@ class TestOptimizationEdgeCases:
         )
 
         # With one signal, weight must be 1.0
-        assert result.best_weights["only_signal"] == pytest.approx(1.0)
+        assert math.isclose(result.best_weights["only_signal"], 1.0, rel_tol=1e-6)
 
 
 class TestMetricEdgeCases:
@@ -426,7 +337,7 @@ class TestMetricEdgeCases:
         pf = profit_factor(trades)
 
         # 100 * 0.1 = 10 gross profit, 10 gross loss
-        assert pf == pytest.approx(1.0)
+        assert math.isclose(pf, 1.0, rel_tol=1e-6)
 
     def test_win_rate_exactly_50_percent(self):
         """Win rate with exactly 50% wins."""
@@ -440,25 +351,16 @@ class TestMetricEdgeCases:
         ]
 
         rate = win_rate(trades)
-        assert rate == pytest.approx(0.5)
+        assert math.isclose(rate, 0.5, rel_tol=1e-6)
 
 
 class TestEndToEndWorkflows:
     """Test complete end-to-end workflows."""
 
-    def test_complete_workflow_single_signal(self):
+    def test_complete_workflow_single_signal(self, linear_prices_factory):
         """Complete workflow: load data, backtest, analyze."""
         # 1. Create test data
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,
-            )
-            for i in range(60)
-        ]
+        prices = linear_prices_factory(60, signal_pattern="alternating")
 
         # 2. Run backtest
         config = BacktestConfig(
@@ -478,19 +380,14 @@ class TestEndToEndWorkflows:
             returns = calculate_returns(result.equity_curve)
             assert len(returns) == len(result.equity_curve) - 1
 
-    def test_complete_workflow_comparison_and_optimization(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("method", OPTIMIZE_METHODS)
+    def test_complete_workflow_comparison_and_optimization(
+        self, linear_prices_factory, method
+    ):
         """Complete workflow: compare signals, then optimize."""
         # 1. Create test data
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(60)
-        ]
+        prices = linear_prices_factory(60)
 
         signals = {
             "signal_a": [0.5 if i % 3 == 0 else 0.0 for i in range(60)],
@@ -514,6 +411,7 @@ class TestEndToEndWorkflows:
             start_date=datetime(2025, 1, 1),
             end_date=datetime(2025, 3, 1),
             step=0.2,
+            method=method,
         )
 
         assert optimization.best_weights is not None
@@ -527,7 +425,7 @@ class TestEndToEndWorkflows:
 class TestConfigurationVariations:
     """Test various configuration combinations."""
 
-    def test_high_transaction_cost(self):
+    def test_high_transaction_cost(self, linear_prices_factory):
         """Test with very high transaction costs (5%)."""
         config = BacktestConfig(
             start_date=datetime(2025, 1, 1),
@@ -536,16 +434,7 @@ class TestConfigurationVariations:
             transaction_cost=0.05,  # 5% per trade
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,
-            )
-            for i in range(20)
-        ]
+        prices = linear_prices_factory(20, signal_pattern="alternating")
 
         result = run_backtest(config, prices=prices)
 
@@ -553,7 +442,7 @@ class TestConfigurationVariations:
         # Many trades in choppy market with 5% costs = likely loss
         assert isinstance(result.total_return, float)
 
-    def test_extreme_thresholds(self):
+    def test_extreme_thresholds(self, linear_prices_factory):
         """Test with extreme buy/sell thresholds (0.9/-0.9)."""
         config = BacktestConfig(
             start_date=datetime(2025, 1, 1),
@@ -563,23 +452,15 @@ class TestConfigurationVariations:
             sell_threshold=-0.9,
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,  # Never reaches threshold
-            )
-            for i in range(30)
-        ]
+        # Alternating +-0.5 signal never reaches the 0.9 threshold
+        prices = linear_prices_factory(30, signal_pattern="alternating")
 
         result = run_backtest(config, prices=prices)
 
         # Extreme thresholds = no trades
         assert result.num_trades == 0
 
-    def test_very_small_position_size(self):
+    def test_very_small_position_size(self, linear_prices_factory):
         """Test with very small position size (0.01)."""
         config = BacktestConfig(
             start_date=datetime(2025, 1, 1),
@@ -588,16 +469,7 @@ class TestConfigurationVariations:
             position_size=0.01,  # Only 1% of capital
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,
-            )
-            for i in range(20)
-        ]
+        prices = linear_prices_factory(20, signal_pattern="alternating")
 
         result = run_backtest(config, prices=prices)
 
@@ -606,7 +478,7 @@ class TestConfigurationVariations:
             for trade in result.trades:
                 assert abs(trade.pnl) < 100  # Limited by small position
 
-    def test_very_large_initial_capital(self):
+    def test_very_large_initial_capital(self, linear_prices_factory):
         """Test with very large initial capital (1B)."""
         config = BacktestConfig(
             start_date=datetime(2025, 1, 1),
@@ -615,16 +487,7 @@ class TestConfigurationVariations:
             initial_capital=1_000_000_000.0,  # 1 billion
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,
-            )
-            for i in range(10)
-        ]
+        prices = linear_prices_factory(10, signal_pattern="alternating")
 
         result = run_backtest(config, prices=prices)
 
@@ -24,6 +24,7 @@ from scripts.backtest.optimizer import (
     generate_weight_grid,
     combine_signals,
 )
+from tests._fixtures import DATES_2025
 
 
 class TestPathTraversal:
@@ -147,7 +148,7 @@ class TestMaliciousInput:
 
         prices = [
             PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
+                timestamp=DATES_2025[i],
                 utxoracle_price=50000 + i * 100,
                 exchange_price=50000 + i * 100,
                 confidence=0.9,
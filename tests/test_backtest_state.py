@@ -3,7 +3,6 @@
 Tests that functions don't unexpectedly mutate inputs or have side effects.
 """
 
-import copy
 from datetime import datetime, timedelta
 import pytest
 
@@ -16,7 +15,6 @@ from scripts.backtest import (
     sharpe_ratio,
     max_drawdown,
     calculate_returns,
-    PricePoint,
 )
 from scripts.backtest.optimizer import (
     generate_weight_grid,
@@ -24,10 +22,57 @@ from scripts.backtest.optimizer import (
 )
 
 
+# Constant buy ("a") vs. constant sell ("b") signals, one per series length
+BUY_SELL_5 = {"a": (0.5,) * 5, "b": (-0.5,) * 5}
+BUY_SELL_10 = {"a": (0.5,) * 10, "b": (-0.5,) * 10}
+BUY_SELL_20 = {"a": (0.5,) * 20, "b": (-0.5,) * 20}
+
+
+def signals_snapshot(signals: dict[str, list[float]]) -> tuple:
+    """Frozen (name, values) pairs, in dict order, for before/after checks."""
+    return tuple((name, tuple(values)) for name, values in signals.items())
+
+
+# Fixtures are the session-cached tuples themselves: a tuple of frozen
+# PricePoints cannot be changed by any test. The input-immutability tests
+# pass a list copy instead, since callers hand the API lists and a list is
+# what an in-place sort or append would hit.
+
+
+@pytest.fixture(scope="module")
+def prices5(linear_prices_factory):
+    """5-day ramp with a neutral signal, the smallest one optimize_weights scores."""
+    return linear_prices_factory(5)
+
+
+@pytest.fixture(scope="module")
+def prices10(linear_prices_factory):
+    """10-day ramp with a neutral signal."""
+    return linear_prices_factory(10)
+
+
+@pytest.fixture(scope="module")
+def prices10_alt(linear_prices_factory):
+    """10-day ramp with a +0.5/-0.5 alternating signal."""
+    return linear_prices_factory(10, signal_pattern="alternating")
+
+
+@pytest.fixture(scope="module")
+def prices10_buy(linear_prices_factory):
+    """10-day ramp with a constant +0.5 (buy) signal."""
+    return linear_prices_factory(10, signal_pattern="buy")
+
+
+@pytest.fixture(scope="module")
+def prices20(linear_prices_factory):
+    """20-day ramp with a neutral signal."""
+    return linear_prices_factory(20)
+
+
 class TestInputImmutability:
     """Test that functions don't mutate their inputs."""
 
-    def test_run_backtest_doesnt_mutate_prices(self):
+    def test_run_backtest_doesnt_mutate_prices(self, prices10_alt):
         """run_backtest should not modify the prices list."""
         config = BacktestConfig(
             start_date=datetime(2025, 1, 1),
@@ -35,127 +80,80 @@ class TestInputImmutability:
             signal_source="test",
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,
-            )
-            for i in range(10)
-        ]
-
-        original_len = len(prices)
-        original_first = prices[0].utxoracle_price
+        prices = list(prices10_alt)
 
         run_backtest(config, prices=prices)
 
         # List should not be modified
-        assert len(prices) == original_len
-        assert prices[0].utxoracle_price == original_first
+        assert tuple(prices) == prices10_alt
 
-    def test_compare_signals_doesnt_mutate_prices(self):
+    def test_compare_signals_doesnt_mutate_prices(self, prices10):
         """compare_signals should not modify the prices list."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(10)
-        ]
-
-        signals = {"a": [0.5] * 10, "b": [-0.5] * 10}
-
-        original_prices = copy.deepcopy(prices)
+        prices = list(prices10)
 
         compare_signals(
-            signals=signals,
+            signals=BUY_SELL_10,
             prices=prices,
             start_date=datetime(2025, 1, 1),
             end_date=datetime(2025, 1, 10),
         )
 
         # Prices should be unchanged
-        assert len(prices) == len(original_prices)
-        for p1, p2 in zip(prices, original_prices):
-            assert p1.utxoracle_price == p2.utxoracle_price
+        assert tuple(prices) == prices10
 
-    def test_compare_signals_doesnt_mutate_signals_dict(self):
+    def test_compare_signals_doesnt_mutate_signals_dict(self, prices10):
         """compare_signals should not modify the signals dict."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(10)
-        ]
-
-        signals = {"a": [0.5] * 10, "b": [-0.5] * 10}
-        original_signals = copy.deepcopy(signals)
+        # Fresh lists, so an in-place write would show up here
+        signals = {k: list(v) for k, v in BUY_SELL_10.items()}
+        original_signals = signals_snapshot(signals)
 
         compare_signals(
             signals=signals,
-            prices=prices,
+            prices=prices10,
             start_date=datetime(2025, 1, 1),
             end_date=datetime(2025, 1, 10),
         )
 
         # Signals dict should be unchanged
-        assert signals == original_signals
+        assert signals_snapshot(signals) == original_signals
 
-    def test_optimize_weights_doesnt_mutate_inputs(self):
+    def test_optimize_weights_doesnt_mutate_inputs(self, prices5):
         """optimize_weights should not modify its inputs."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(20)
-        ]
-
-        signals = {"a": [0.5] * 20, "b": [-0.5] * 20}
-
-        original_signals = copy.deepcopy(signals)
-        original_prices_len = len(prices)
+        # Immutability doesn't depend on grid density: step=1.0 still runs
+        # every candidate through the same combine-and-backtest path
+        signals = {k: list(v) for k, v in BUY_SELL_5.items()}
+
+        original_signals = signals_snapshot(signals)
+        prices = list(prices5)
 
         optimize_weights(
             signals=signals,
             prices=prices,
             start_date=datetime(2025, 1, 1),
-            end_date=datetime(2025, 1, 20),
-            step=0.5,
+            end_date=datetime(2025, 1, 5),
+            step=1.0,
         )
 
-        assert signals == original_signals
-        assert len(prices) == original_prices_len
+        assert signals_snapshot(signals) == original_signals
+        assert tuple(prices) == prices5
 
     def test_combine_signals_doesnt_mutate_inputs(self):
         """combine_signals should not modify its inputs."""
         signals = {"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]}
         weights = {"a": 0.5, "b": 0.5}
 
-        original_signals = copy.deepcopy(signals)
-        original_weights = copy.deepcopy(weights)
+        original_signals = signals_snapshot(signals)
+        original_weights = dict(weights)
 
         combine_signals(signals, weights)
 
-        assert signals == original_signals
+        assert signals_snapshot(signals) == original_signals
         assert weights == original_weights
 
     def test_sharpe_ratio_doesnt_mutate_returns(self):
         """sharpe_ratio should not modify the returns list."""
         returns = [0.01, 0.02, -0.01, 0.03]
-        original = copy.copy(returns)
+        original = returns[:]
 
         sharpe_ratio(returns)
 
@@ -164,7 +162,7 @@ class TestInputImmutability:
     def test_max_drawdown_doesnt_mutate_equity(self):
         """max_drawdown should not modify the equity curve."""
         equity = [100, 110, 105, 120, 115]
-        original = copy.copy(equity)
+        original = equity[:]
 
         max_drawdown(equity)
 
@@ -173,7 +171,7 @@ class TestInputImmutability:
     def test_calculate_returns_doesnt_mutate_equity(self):
         """calculate_returns should not modify the equity curve."""
         equity = [100, 110, 120, 130]
-        original = copy.copy(equity)
+        original = equity[:]
 
         calculate_returns(equity)
 
@@ -183,7 +181,7 @@ class TestInputImmutability:
 class TestResultIndependence:
     """Test that results are independent (no shared state)."""
 
-    def test_multiple_backtests_independent(self):
+    def test_multiple_backtests_independent(self, prices10_buy):
         """Multiple backtest runs should have independent results."""
         config1 = BacktestConfig(
             start_date=datetime(2025, 1, 1),
@@ -199,24 +197,16 @@ class TestResultIndependence:
             initial_capital=20000.0,
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5,
-            )
-            for i in range(10)
-        ]
+        result1 = run_backtest(config1, prices=prices10_buy)
+        result2 = run_backtest(config2, prices=prices10_buy)
 
-        result1 = run_backtest(config1, prices=prices)
-        result2 = run_backtest(config2, prices=prices)
-
-        # Results should be different objects
+        # Results should be different objects, with no shared containers
         assert result1 is not result2
         assert result1.config is not result2.config
         assert result1.config.initial_capital != result2.config.initial_capital
+        assert result1.trades is not result2.trades
+        assert result1.equity_curve is not result2.equity_curve
+        assert result1.equity_curve[0] != result2.equity_curve[0]
 
     def test_weight_grid_returns_independent_dicts(self):
         """Each weight dict in grid should be independent."""
@@ -228,24 +218,11 @@ class TestResultIndependence:
         # Should not affect other dicts
         assert all(w.get("a", 0) != 999.0 for w in grid[1:])
 
-    def test_comparison_results_independent(self):
+    def test_comparison_results_independent(self, prices20):
         """Each BacktestResult in comparison should be independent."""
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.0,
-            )
-            for i in range(20)
-        ]
-
-        signals = {"a": [0.5] * 20, "b": [-0.5] * 20}
-
         comparison = compare_signals(
-            signals=signals,
-            prices=prices,
+            signals=BUY_SELL_20,
+            prices=prices20,
             start_date=datetime(2025, 1, 1),
             end_date=datetime(2025, 1, 20),
         )
@@ -257,7 +234,7 @@ class TestResultIndependence:
 class TestNoGlobalState:
     """Test that no global state is polluted."""
 
-    def test_repeated_runs_same_result(self):
+    def test_repeated_runs_same_result(self, prices10_alt):
         """Same inputs should always produce same outputs."""
         config = BacktestConfig(
             start_date=datetime(2025, 1, 1),
@@ -265,45 +242,26 @@ class TestNoGlobalState:
             signal_source="test",
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5 if i % 2 == 0 else -0.5,
-            )
-            for i in range(10)
-        ]
-
-        result1 = run_backtest(config, prices=prices)
-        result2 = run_backtest(config, prices=prices)
-        result3 = run_backtest(config, prices=prices)
-
-        # All results should be identical
-        assert result1.total_return == result2.total_return == result3.total_return
-        assert result1.num_trades == result2.num_trades == result3.num_trades
+        result1 = run_backtest(config, prices=prices10_alt)
+        result2 = run_backtest(config, prices=prices10_alt)
+
+        # Both results should be identical
+        assert result1.total_return == result2.total_return
+        assert result1.num_trades == result2.num_trades
+        assert result1.equity_curve == result2.equity_curve
 
     def test_sharpe_ratio_deterministic(self):
         """sharpe_ratio should be deterministic."""
         returns = [0.01, 0.02, -0.01, 0.03, 0.02]
 
-        s1 = sharpe_ratio(returns)
-        s2 = sharpe_ratio(returns)
-        s3 = sharpe_ratio(returns)
-
-        assert s1 == s2 == s3
+        assert sharpe_ratio(returns) == sharpe_ratio(returns)
 
     def test_combine_signals_deterministic(self):
         """combine_signals should be deterministic."""
         signals = {"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]}
         weights = {"a": 0.5, "b": 0.5}
 
-        c1 = combine_signals(signals, weights)
-        c2 = combine_signals(signals, weights)
-        c3 = combine_signals(signals, weights)
-
-        assert c1 == c2 == c3
+        assert combine_signals(signals, weights) == combine_signals(signals, weights)
 
 
 class TestTradeObjectImmutability:
@@ -332,7 +290,7 @@ class TestTradeObjectImmutability:
 class TestConfigObjectImmutability:
     """Test that BacktestConfig is properly encapsulated."""
 
-    def test_config_values_preserved(self):
+    def test_config_values_preserved(self, prices10_buy):
         """Config values should be preserved in result."""
         config = BacktestConfig(
             start_date=datetime(2025, 1, 1),
@@ -343,18 +301,7 @@ class TestConfigObjectImmutability:
             initial_capital=50000.0,
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5,
-            )
-            for i in range(10)
-        ]
-
-        result = run_backtest(config, prices=prices)
+        result = run_backtest(config, prices=prices10_buy)
 
         # Config should be preserved in result
         assert result.config.signal_source == "my_signal"
@@ -366,7 +313,7 @@ class TestConfigObjectImmutability:
 class TestListReturnTypes:
     """Test that list return types are new lists, not views."""
 
-    def test_equity_curve_is_new_list(self):
+    def test_equity_curve_is_new_list(self, prices10_buy):
         """Result equity_curve should be a new list."""
         config = BacktestConfig(
             start_date=datetime(2025, 1, 1),
@@ -374,18 +321,7 @@ class TestListReturnTypes:
             signal_source="test",
         )
 
-        prices = [
-            PricePoint(
-                timestamp=datetime(2025, 1, 1) + timedelta(days=i),
-                utxoracle_price=50000 + i * 100,
-                exchange_price=50000 + i * 100,
-                confidence=0.9,
-                signal_value=0.5,
-            )
-            for i in range(10)
-        ]
-
-        result = run_backtest(config, prices=prices)
+        result = run_backtest(config, prices=prices10_buy)
 
         # Modifying the returned equity curve should not affect anything
         if result.equity_curve:
@@ -393,7 +329,7 @@ class TestListReturnTypes:
             result.equity_curve[0] = 999999
 
             # Re-running should give original value
-            result2 = run_backtest(config, prices=prices)
+            result2 = run_backtest(config, prices=prices10_buy)
             if result2.equity_curve:
                 assert result2.equity_curve[0] == original_first
 
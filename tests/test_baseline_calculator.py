@@ -7,8 +7,19 @@ Task: T097 - Implement calculate_baseline() algorithm
 """
 
 import time
+
+import numpy as np
+
 from live.backend.baseline_calculator import BaselineCalculator
 
+# Diverse transaction amounts simulating real spending
+# Wider range: $50-$10000 to ensure sufficient histogram coverage
+# Assuming BTC price ~$100k: $50=0.0005, $100=0.001, $1000=0.01, $10000=0.1
+USD_AMOUNTS = (50, 100, 150, 200, 300, 500, 1000, 1500, 2000, 3000, 5000, 10000)
+# Realistic frequency distribution ($100-$200 most common), normalized once
+USD_WEIGHTS = (8, 10, 6, 8, 5, 7, 6, 4, 5, 3, 2, 1)
+USD_PROBABILITIES = tuple(w / sum(USD_WEIGHTS) for w in USD_WEIGHTS)
+
 
 def test_calculate_baseline_with_sufficient_data():
     """
@@ -29,33 +40,23 @@ def test_calculate_baseline_with_sufficient_data():
 
     # Simulate 20 blocks with realistic Bitcoin transactions
     # Each block has diverse transactions simulating real spending patterns
-    import random
-
-    random.seed(42)  # Reproducible test data
-
-    for block_height in range(1000, 1020):
-        transactions = []
-        # Create diverse transaction amounts simulating real spending
-        # Wider range: $50-$10000 to ensure sufficient histogram coverage
-        # Assuming BTC price ~$100k: $50=0.0005, $100=0.001, $1000=0.01, $10000=0.1
-        usd_amounts = [50, 100, 150, 200, 300, 500, 1000, 1500, 2000, 3000, 5000, 10000]
-
-        for _ in range(100):  # 100 transactions per block for better coverage
-            # Pick random USD amount with realistic frequency distribution
-            # (smaller amounts more common than larger)
-            usd = random.choices(
-                usd_amounts,
-                weights=[8, 10, 6, 8, 5, 7, 6, 4, 5, 3, 2, 1],  # $100-$200 most common
-                k=1,
-            )[0]
-
-            # Add variance (±30%) to simulate non-round amounts
-            variance = random.uniform(0.7, 1.3)
-            amount_btc = (usd / 100000.0) * variance  # Assuming $100k BTC price
-            timestamp = time.time()
-            transactions.append((amount_btc, timestamp))
-
-        calc.add_block(transactions, height=block_height)
+    rng = np.random.default_rng(42)  # Reproducible test data
+    n_blocks, txs_per_block = 20, 100  # 100 transactions per block for coverage
+
+    # Draw every block's amounts at once, with ±30% variance so they are
+    # not round, assuming a $100k BTC price
+    usd = rng.choice(USD_AMOUNTS, size=n_blocks * txs_per_block, p=USD_PROBABILITIES)
+    variance = rng.uniform(0.7, 1.3, size=n_blocks * txs_per_block)
+    amounts_btc = ((usd / 100000.0) * variance).tolist()
+    timestamp = time.time()
+
+    transactions = [(amount, timestamp) for amount in amounts_btc]
+    calc.add_blocks(
+        [
+            (transactions[i * txs_per_block : (i + 1) * txs_per_block], 1000 + i)
+            for i in range(n_blocks)
+        ]
+    )
 
     # Act: Calculate baseline
     result = calc.calculate_baseline()
@@ -85,9 +86,13 @@ def test_baseline_result_includes_transactions():
     calc = BaselineCalculator(window_blocks=144)
 
     # Add 5 blocks with transactions
-    for i in range(5):
-        transactions = [(0.5 + j * 0.1, time.time() - i * 600 - j) for j in range(50)]
-        calc.add_block(transactions, height=900000 + i)
+    t0 = time.time()
+    calc.add_blocks(
+        [
+            ([(0.5 + j * 0.1, t0 - i * 600 - j) for j in range(50)], 900000 + i)
+            for i in range(5)
+        ]
+    )
 
     # Act
     result = calc.calculate_baseline()
@@ -8,6 +8,31 @@ Test coverage for:
 - Integration with whale tracking
 """
 
+import pytest
+
+from scripts.clustering import filter_coinjoins, iter_non_coinjoins
+from scripts.clustering.address_clustering import (
+    cluster_addresses,
+    get_cluster_stats,
+    get_input_addresses,
+)
+from scripts.clustering.change_detector import _is_round_amount, detect_change_outputs
+from scripts.clustering.coinjoin_detector import _normalize_to_satoshis, detect_coinjoin
+from scripts.clustering.union_find import UnionFind
+
+
+@pytest.fixture(scope="module")
+def _union_find():
+    """One UnionFind per module, recycled by the uf fixture."""
+    return UnionFind()
+
+
+@pytest.fixture
+def uf(_union_find):
+    """Empty UnionFind; reset() reuses the shared instance's dicts."""
+    _union_find.reset()
+    return _union_find
+
 
 # =============================================================================
 # Phase 2: Union-Find Tests
@@ -17,47 +42,53 @@ Test coverage for:
 class TestUnionFindBasic:
     """T004: Basic Union-Find operations."""
 
-    def test_find_returns_same_root_after_union(self):
-        """Elements in same set should have same root."""
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
-        uf.union("a", "b")
-
-        assert uf.find("a") == uf.find("b")
-
-    def test_find_returns_different_roots_without_union(self):
+    @pytest.mark.parametrize(
+        ("unions", "queries"),
+        [
+            pytest.param([("a", "b")], [("a", "b", True)], id="single_union"),
+            pytest.param([], [("addr1", "addr2", False)], id="no_union"),
+            pytest.param(
+                [("a", "b"), ("c", "d")],
+                [("a", "b", True), ("c", "d", True), ("a", "c", False)],
+                id="two_sets",
+            ),
+            # T005: transitivity
+            pytest.param([("a", "b"), ("b", "c")], [("a", "c", True)], id="chain"),
+            pytest.param(
+                [("a", "b"), ("b", "c"), ("c", "d"), ("d", "e")],
+                [("a", "e", True), ("b", "d", True)],
+                id="long_chain",
+            ),
+        ],
+    )
+    def test_connected_after_unions(self, unions, queries, uf):
+        """connected() and find() agree with the unions applied."""
+        for x, y in unions:
+            uf.union(x, y)
+
+        for x, y, expected in queries:
+            assert uf.connected(x, y) is expected
+            if expected:
+                assert uf.find(x) == uf.find(y)
+
+    def test_find_returns_different_roots_without_union(self, uf):
         """Elements not unioned should have different roots."""
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
         uf.find("a")  # Initialize
         uf.find("b")  # Initialize
 
         assert uf.find("a") != uf.find("b")
 
-    def test_connected_returns_true_after_union(self):
-        """connected() should return True for unioned elements."""
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
-        uf.union("addr1", "addr2")
-
-        assert uf.connected("addr1", "addr2") is True
-
-    def test_connected_returns_false_without_union(self):
-        """connected() should return False for non-unioned elements."""
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
+    def test_reset_empties_structure(self, uf):
+        """reset() forgets all elements and unions."""
+        uf.union("a", "b")
+        uf.reset()
 
-        assert uf.connected("addr1", "addr2") is False
+        assert len(uf) == 0
+        assert uf.connected("a", "b") is False
+        assert uf.get_clusters() == []
 
-    def test_get_clusters_returns_correct_groups(self):
+    def test_get_clusters_returns_correct_groups(self, uf):
         """get_clusters() should return all disjoint sets."""
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
         uf.union("a", "b")
         uf.union("c", "d")
 
@@ -67,38 +98,52 @@ class TestUnionFindBasic:
         assert {"a", "b"} in clusters
         assert {"c", "d"} in clusters
 
+    def test_find_existing_does_not_add(self, uf):
+        """find_existing() should not track unknown elements."""
+        uf.union("a", "b")
 
-class TestUnionFindTransitivity:
-    """T005: Union-Find transitivity property."""
+        assert uf.find_existing("b") == uf.find("a")
+        assert uf.find_existing("missing") is None
+        assert len(uf) == 2
 
-    def test_transitivity_through_chain(self):
-        """a-b, b-c implies a connected to c."""
-        from scripts.clustering.union_find import UnionFind
+    def test_union_many_merges_all(self, uf):
+        """union_many() should put every element in one set."""
+        uf.union("a", "b")
+        uf.union_many(["c", "b", "d", "c"])
+        uf.union_many([])
+
+        assert uf.connected("a", "d")
+        assert sorted(map(sorted, uf.get_clusters())) == [["a", "b", "c", "d"]]
 
-        uf = UnionFind()
+    def test_get_clusters_returns_copies(self, uf):
+        """Mutating a returned cluster must not change the structure."""
         uf.union("a", "b")
-        uf.union("b", "c")
+        uf.find("c")
 
-        assert uf.connected("a", "c") is True
+        uf.get_clusters()[0].add("z")
 
-    def test_transitivity_through_long_chain(self):
-        """a-b, b-c, c-d, d-e implies a connected to e."""
-        from scripts.clustering.union_find import UnionFind
+        assert sorted(map(sorted, uf.get_clusters())) == [["a", "b"], ["c"]]
+        assert uf.cluster_count() == 2
 
-        uf = UnionFind()
+    def test_members_returns_copy_of_one_set(self, uf):
+        """members() should list one set without exposing internal state."""
         uf.union("a", "b")
-        uf.union("b", "c")
-        uf.union("c", "d")
-        uf.union("d", "e")
+        uf.find("c")
+        root = uf.find("a")
 
-        assert uf.connected("a", "e") is True
-        assert uf.find("a") == uf.find("e")
+        uf.members(root).add("z")
 
-    def test_merging_two_clusters(self):
-        """Merging two existing clusters should connect all elements."""
-        from scripts.clustering.union_find import UnionFind
+        assert uf.members(root) == {"a", "b"}
+        assert uf.members(uf.find("c")) == {"c"}
+        with pytest.raises(KeyError):
+            uf.members("missing")
+
+
+class TestUnionFindTransitivity:
+    """T005: Union-Find transitivity property."""
 
-        uf = UnionFind()
+    def test_merging_two_clusters(self, uf):
+        """Merging two existing clusters should connect all elements."""
         # Create cluster 1: a-b-c
         uf.union("a", "b")
         uf.union("b", "c")
@@ -125,12 +170,8 @@ class TestUnionFindTransitivity:
 class TestClusterSingleTx:
     """T008: Cluster addresses from single transaction."""
 
-    def test_cluster_addresses_from_single_tx(self):
+    def test_cluster_addresses_from_single_tx(self, uf):
         """All input addresses in same tx should be clustered."""
-        from scripts.clustering.address_clustering import cluster_addresses
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
         tx_inputs = ["addr1", "addr2", "addr3"]
 
         cluster_addresses(uf, tx_inputs)
@@ -139,12 +180,8 @@ class TestClusterSingleTx:
         assert uf.connected("addr2", "addr3")
         assert uf.connected("addr1", "addr3")
 
-    def test_cluster_single_address_tx(self):
+    def test_cluster_single_address_tx(self, uf):
         """Single-input tx should create singleton cluster."""
-        from scripts.clustering.address_clustering import cluster_addresses
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
         tx_inputs = ["single_addr"]
 
         cluster_addresses(uf, tx_inputs)
@@ -153,17 +190,26 @@ class TestClusterSingleTx:
         assert len(clusters) == 1
         assert "single_addr" in clusters[0]
 
+    def test_get_input_addresses_skips_inputs_without_address(self):
+        """Coinbase (null prevout) and address-less inputs are skipped."""
+        tx = {
+            "vin": [
+                {"prevout": {"scriptpubkey_address": "addr1"}},
+                {"prevout": None},
+                {"prevout": {"scriptpubkey_type": "op_return"}},
+                {"txid": "in3", "vout": 0},
+                {"prevout": {"scriptpubkey_address": "addr2"}},
+            ]
+        }
+
+        assert get_input_addresses(tx) == ["addr1", "addr2"]
+
 
 class TestClusterMultipleTx:
     """T009: Cluster addresses from multiple transactions."""
 
-    def test_cluster_addresses_from_multiple_txs(self):
+    def test_cluster_addresses_from_multiple_txs(self, uf):
         """Multiple txs with overlapping addresses should merge clusters."""
-        from scripts.clustering.address_clustering import cluster_addresses
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
-
         # TX1: addr1, addr2
         cluster_addresses(uf, ["addr1", "addr2"])
         # TX2: addr3, addr4
@@ -175,13 +221,8 @@ class TestClusterMultipleTx:
         assert uf.connected("addr1", "addr4")
         assert len(uf.get_clusters()) == 1
 
-    def test_independent_clusters_stay_separate(self):
+    def test_independent_clusters_stay_separate(self, uf):
         """Txs with no overlap should create separate clusters."""
-        from scripts.clustering.address_clustering import cluster_addresses
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
-
         cluster_addresses(uf, ["a1", "a2"])
         cluster_addresses(uf, ["b1", "b2"])
 
@@ -192,13 +233,8 @@ class TestClusterMultipleTx:
 class TestClusterTransitivity:
     """T010: Verify transitivity in clustering."""
 
-    def test_transitivity_through_shared_addresses(self):
+    def test_transitivity_through_shared_addresses(self, uf):
         """Clustering should be transitive through shared addresses."""
-        from scripts.clustering.address_clustering import cluster_addresses
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
-
         # Chain: A shares with B, B shares with C, C shares with D
         cluster_addresses(uf, ["a1", "shared_ab"])
         cluster_addresses(uf, ["shared_ab", "b1", "shared_bc"])
@@ -208,16 +244,8 @@ class TestClusterTransitivity:
         # a1 should be connected to d1 through chain
         assert uf.connected("a1", "d1")
 
-    def test_get_cluster_stats(self):
+    def test_get_cluster_stats(self, uf):
         """get_cluster_stats should return correct statistics."""
-        from scripts.clustering.address_clustering import (
-            cluster_addresses,
-            get_cluster_stats,
-        )
-        from scripts.clustering.union_find import UnionFind
-
-        uf = UnionFind()
-
         # Create varying cluster sizes
         cluster_addresses(uf, ["a1", "a2", "a3"])  # 3 addresses
         cluster_addresses(uf, ["b1", "b2"])  # 2 addresses
@@ -241,8 +269,6 @@ class TestDetectGenericCoinJoin:
 
     def test_detect_generic_coinjoin_equal_outputs(self):
         """Transaction with many equal outputs should be flagged as CoinJoin."""
-        from scripts.clustering.coinjoin_detector import detect_coinjoin
-
         # 8 inputs, 8 equal outputs of 0.1 BTC
         tx = {
             "txid": "abc123",
@@ -260,8 +286,6 @@ class TestDetectGenericCoinJoin:
 
     def test_detect_coinjoin_minimum_threshold(self):
         """Need at least 5 equal outputs for generic CoinJoin."""
-        from scripts.clustering.coinjoin_detector import detect_coinjoin
-
         # Only 3 equal outputs - should NOT be CoinJoin
         tx = {
             "txid": "abc123",
@@ -281,8 +305,6 @@ class TestDetectWasabi:
 
     def test_detect_wasabi_coinjoin(self):
         """Wasabi CoinJoin with 100+ outputs should be detected."""
-        from scripts.clustering.coinjoin_detector import detect_coinjoin
-
         # Wasabi typically has 100+ equal outputs
         tx = {
             "txid": "wasabi123",
@@ -305,8 +327,6 @@ class TestDetectWhirlpool:
 
     def test_detect_whirlpool_fixed_denomination(self):
         """Whirlpool uses fixed denominations (0.001, 0.01, 0.05, 0.5 BTC)."""
-        from scripts.clustering.coinjoin_detector import detect_coinjoin
-
         # Whirlpool 0.01 BTC pool with 5 participants
         tx = {
             "txid": "whirlpool123",
@@ -325,8 +345,6 @@ class TestDetectWhirlpool:
 
     def test_detect_whirlpool_satoshi_values(self):
         """Whirlpool detection with satoshi values (electrs API format)."""
-        from scripts.clustering.coinjoin_detector import detect_coinjoin
-
         # Whirlpool 0.01 BTC = 1,000,000 satoshis
         tx = {
             "txid": "whirlpool_sats",
@@ -344,8 +362,6 @@ class TestDetectWhirlpool:
 
     def test_detect_whirlpool_all_denominations_satoshis(self):
         """All Whirlpool denominations work in satoshis."""
-        from scripts.clustering.coinjoin_detector import detect_coinjoin
-
         # 0.001, 0.01, 0.05, 0.5 BTC in satoshis
         for sats in [100_000, 1_000_000, 5_000_000, 50_000_000]:
             tx = {
@@ -365,8 +381,6 @@ class TestNormalTxNotCoinJoin:
 
     def test_normal_payment_not_coinjoin(self):
         """Standard payment transaction with different outputs."""
-        from scripts.clustering.coinjoin_detector import detect_coinjoin
-
         # Normal payment: 2 inputs, 2 outputs (payment + change)
         tx = {
             "txid": "normal123",
@@ -384,8 +398,6 @@ class TestNormalTxNotCoinJoin:
 
     def test_consolidation_tx_not_coinjoin(self):
         """Consolidation transaction (many inputs, one output)."""
-        from scripts.clustering.coinjoin_detector import detect_coinjoin
-
         # Consolidation: 10 inputs, 1 output
         tx = {
             "txid": "consolidate123",
@@ -399,8 +411,6 @@ class TestNormalTxNotCoinJoin:
 
     def test_batch_payment_not_coinjoin(self):
         """Batch payment with different amounts is not CoinJoin."""
-        from scripts.clustering.coinjoin_detector import detect_coinjoin
-
         # Batch payment: 1 input, multiple different outputs
         tx = {
             "txid": "batch123",
@@ -428,8 +438,6 @@ class TestDetectOddAmountChange:
 
     def test_detect_odd_amount_as_change(self):
         """Output with many decimals is likely change."""
-        from scripts.clustering.change_detector import detect_change_outputs
-
         tx = {
             "txid": "change123",
             "vout": [
@@ -451,8 +459,6 @@ class TestDetectOddAmountChange:
 
     def test_both_round_amounts_no_change_detected(self):
         """Two round amounts - can't determine change confidently."""
-        from scripts.clustering.change_detector import detect_change_outputs
-
         tx = {
             "txid": "round123",
             "vout": [
@@ -472,8 +478,6 @@ class TestDetectSmallOutputChange:
 
     def test_small_output_as_change(self):
         """Output < 10% of largest is likely change."""
-        from scripts.clustering.change_detector import detect_change_outputs
-
         tx = {
             "txid": "small123",
             "vout": [
@@ -491,8 +495,6 @@ class TestDetectSmallOutputChange:
 
     def test_similar_amounts_no_size_change(self):
         """Similar sized outputs - can't determine by size."""
-        from scripts.clustering.change_detector import detect_change_outputs
-
         tx = {
             "txid": "similar123",
             "vout": [
@@ -518,8 +520,6 @@ class TestWhaleDetectionWithClustering:
 
     def test_filter_coinjoins_removes_coinjoin_txs(self):
         """filter_coinjoins should remove CoinJoin transactions."""
-        from scripts.clustering import filter_coinjoins
-
         transactions = [
             # Normal transaction
             {
@@ -548,8 +548,6 @@ class TestWhaleDetectionWithClustering:
 
     def test_filter_coinjoins_with_threshold(self):
         """filter_coinjoins should respect confidence threshold."""
-        from scripts.clustering import filter_coinjoins
-
         transactions = [
             # Borderline CoinJoin (lower confidence)
             {
@@ -570,16 +568,26 @@ class TestWhaleDetectionWithClustering:
         filtered_low = filter_coinjoins(transactions, threshold=0.5)
         assert len(filtered_low) == 0
 
+    def test_iter_non_coinjoins_is_lazy(self):
+        """iter_non_coinjoins should yield kept txs on demand, in order."""
+        coinjoin = {
+            "txid": "coinjoin1",
+            "vin": [{"txid": f"in{i}", "vout": 0} for i in range(8)],
+            "vout": [{"value": 0.1} for _ in range(8)],
+        }
+        normal = {"txid": "normal1", "vin": [{}], "vout": [{"value": 1.0}]}
+
+        kept = iter_non_coinjoins(iter([coinjoin, normal, normal]))
+
+        assert next(kept) is normal
+        assert [tx["txid"] for tx in kept] == ["normal1"]
+
 
 class TestWhaleDetectionFiltersCoinJoin:
     """T030: Whale detection filters CoinJoin transactions."""
 
-    def test_cluster_addresses_from_whale_txs(self):
+    def test_cluster_addresses_from_whale_txs(self, uf):
         """Clustering should work with whale-style transactions."""
-        from scripts.clustering import filter_coinjoins
-        from scripts.clustering.address_clustering import cluster_addresses
-        from scripts.clustering.union_find import UnionFind
-
         # Simulate whale transactions
         transactions = [
             {
@@ -605,24 +613,15 @@ class TestWhaleDetectionFiltersCoinJoin:
         assert len(clean_txs) == 1
 
         # Cluster input addresses
-        uf = UnionFind()
         for tx in clean_txs:
-            input_addrs = [
-                vin.get("prevout", {}).get("scriptpubkey_address")
-                for vin in tx.get("vin", [])
-                if vin.get("prevout", {}).get("scriptpubkey_address")
-            ]
+            input_addrs = get_input_addresses(tx)
             cluster_addresses(uf, input_addrs)
 
         # Whale addresses should be clustered
         assert uf.connected("whale_addr1", "whale_addr2")
 
-    def test_coinjoin_not_clustered_after_filter(self):
+    def test_coinjoin_not_clustered_after_filter(self, uf):
         """CoinJoin inputs should not affect clustering after filtering."""
-        from scripts.clustering import filter_coinjoins
-        from scripts.clustering.address_clustering import cluster_addresses
-        from scripts.clustering.union_find import UnionFind
-
         transactions = [
             # Normal whale tx
             {
@@ -647,13 +646,8 @@ class TestWhaleDetectionFiltersCoinJoin:
         clean_txs = filter_coinjoins(transactions)
 
         # Build clusters only from clean txs
-        uf = UnionFind()
         for tx in clean_txs:
-            input_addrs = [
-                vin.get("prevout", {}).get("scriptpubkey_address")
-                for vin in tx.get("vin", [])
-                if vin.get("prevout", {}).get("scriptpubkey_address")
-            ]
+            input_addrs = get_input_addresses(tx)
             if input_addrs:
                 cluster_addresses(uf, input_addrs)
 
@@ -674,66 +668,48 @@ class TestEdgeCasesRegression:
 
     def test_is_round_amount_handles_infinity(self):
         """_is_round_amount should not crash on infinity."""
-        from scripts.clustering.change_detector import _is_round_amount
-
         # Should not raise exception
         result = _is_round_amount(float("inf"))
         assert result is True  # Infinity treated as "round" (safe default)
 
     def test_is_round_amount_handles_nan(self):
         """_is_round_amount should not crash on NaN."""
-        from scripts.clustering.change_detector import _is_round_amount
-
         result = _is_round_amount(float("nan"))
         assert result is True  # NaN treated as "round" (safe default)
 
     def test_is_round_amount_handles_negative(self):
         """_is_round_amount should handle negative values."""
-        from scripts.clustering.change_detector import _is_round_amount
-
         result = _is_round_amount(-100)
         assert result is True  # Negative treated as "round" (safe default)
 
     def test_normalize_to_satoshis_handles_infinity(self):
         """_normalize_to_satoshis should not crash on infinity."""
-        from scripts.clustering.coinjoin_detector import _normalize_to_satoshis
-
         result = _normalize_to_satoshis(float("inf"))
         assert result == 0  # Invalid values return 0
 
     def test_normalize_to_satoshis_handles_nan(self):
         """_normalize_to_satoshis should not crash on NaN."""
-        from scripts.clustering.coinjoin_detector import _normalize_to_satoshis
-
         result = _normalize_to_satoshis(float("nan"))
         assert result == 0  # Invalid values return 0
 
     def test_normalize_to_satoshis_handles_negative(self):
         """_normalize_to_satoshis should handle negative values."""
-        from scripts.clustering.coinjoin_detector import _normalize_to_satoshis
-
         result = _normalize_to_satoshis(-100)
         assert result == 0  # Invalid values return 0
 
     def test_detect_coinjoin_empty_tx(self):
         """detect_coinjoin should handle empty transactions gracefully."""
-        from scripts.clustering import detect_coinjoin
-
         result = detect_coinjoin({})
         assert result.is_coinjoin is False
         assert result.txid == "unknown"
 
     def test_detect_change_outputs_empty_tx(self):
         """detect_change_outputs should handle empty transactions gracefully."""
-        from scripts.clustering import detect_change_outputs
-
         result = detect_change_outputs({})
         assert result.likely_change_outputs == []
         assert result.likely_payment_outputs == []
 
     def test_filter_coinjoins_empty_list(self):
         """filter_coinjoins should handle empty list gracefully."""
-        from scripts.clustering import filter_coinjoins
-
         result = filter_coinjoins([])
         assert result == []
@@ -9,7 +9,7 @@ Coverage areas:
 """
 
 import pytest
-import uuid
+import re
 from unittest.mock import patch, MagicMock
 from starlette.requests import Request
 from starlette.responses import Response
@@ -63,12 +63,12 @@ def test_get_logger_returns_structlog_instance():
 
 
 @pytest.mark.asyncio
-async def test_correlation_id_middleware_generates_uuid():
+async def test_correlation_id_middleware_generates_id():
     """
-    Test that middleware generates a valid UUID when no header provided.
+    Test that middleware generates a random ID when no header provided.
 
     Expected:
-    - correlation_id is a valid UUID
+    - correlation_id is 128 bits as 32 lowercase hex characters
     - correlation_id is added to request.state
     """
     from api.logging_config import CorrelationIDMiddleware
@@ -92,13 +92,9 @@ async def test_correlation_id_middleware_generates_uuid():
     # Verify correlation_id was added to request.state
     assert hasattr(request.state, "correlation_id")
 
-    # Verify it's a valid UUID
+    # Verify it's 128 random bits, hex-encoded
     correlation_id = request.state.correlation_id
-    try:
-        uuid_obj = uuid.UUID(correlation_id)
-        assert str(uuid_obj) == correlation_id
-    except ValueError:
-        pytest.fail(f"Invalid UUID generated: {correlation_id}")
+    assert re.fullmatch(r"[0-9a-f]{32}", correlation_id), correlation_id
 
 
 @pytest.mark.asyncio
@@ -138,12 +134,15 @@ async def test_correlation_id_middleware_preserves_header():
 @pytest.mark.asyncio
 async def test_correlation_id_middleware_clears_context():
     """
-    Test that middleware clears structlog context after request.
+    Test that middleware clears its binding from structlog context after request.
 
     Expected:
-    - Context is cleared in finally block
+    - correlation_id is reset in finally block
     - No correlation_id leaks between requests
+    - Bindings made outside the middleware are preserved
     """
+    import structlog
+
     from api.logging_config import CorrelationIDMiddleware
 
     middleware = CorrelationIDMiddleware(app=MagicMock())
@@ -159,12 +158,16 @@ async def test_correlation_id_middleware_clears_context():
         response.headers = {}
         return response
 
-    # Execute middleware
-    with patch("structlog.contextvars.clear_contextvars") as mock_clear:
+    # Execute middleware with an outer binding already in place
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(user_id=42)
+    try:
         await middleware.dispatch(request, mock_call_next)
 
-        # Verify context was cleared
-        mock_clear.assert_called_once()
+        # Verify only the correlation_id binding was removed
+        assert structlog.contextvars.get_contextvars() == {"user_id": 42}
+    finally:
+        structlog.contextvars.clear_contextvars()
 
 
 @pytest.mark.asyncio
@@ -190,12 +193,12 @@ async def test_correlation_id_middleware_handles_exceptions():
         raise ValueError("Simulated error")
 
     # Execute middleware and expect exception
-    with patch("structlog.contextvars.clear_contextvars") as mock_clear:
+    with patch("structlog.contextvars.reset_contextvars") as mock_reset:
         with pytest.raises(ValueError, match="Simulated error"):
             await middleware.dispatch(request, mock_call_next_error)
 
-        # Verify context was still cleared despite exception
-        mock_clear.assert_called_once()
+        # Verify context was still reset despite exception
+        mock_reset.assert_called_once()
 
 
 # =============================================================================
@@ -224,6 +227,198 @@ def test_structlog_json_renderer():
     assert hasattr(logger, "warning")
 
 
+def test_orjson_serializer_matches_json():
+    """
+    Test that the orjson-backed serializer emits the same JSON document.
+
+    Expected:
+    - Output is str, parseable by json.loads
+    - Non-string keys and fallback objects serialize as with json.dumps
+    - Ints wider than 64 bits fall back to json.dumps
+    - NaN renders as null (json.dumps would emit the non-JSON token NaN)
+    """
+    pytest.importorskip("orjson")
+    import json
+
+    from api.logging_config import _orjson_dumps
+
+    event_dict = {"event": "request", "status": 200, 7: "port", "obj": object()}
+
+    rendered = _orjson_dumps(event_dict, default=repr)
+
+    assert isinstance(rendered, str)
+    assert json.loads(rendered) == json.loads(json.dumps(event_dict, default=repr))
+
+    big_int = {"event": "block", "sats": 2**70}
+    assert _orjson_dumps(big_int, default=repr) == json.dumps(big_int, default=repr)
+
+    assert json.loads(_orjson_dumps({"ratio": float("nan")})) == {"ratio": None}
+
+
+def test_events_below_log_level_are_dropped(caplog):
+    """
+    Test that the bound logger filters by the configured level before stdlib logging.
+
+    Expected:
+    - Events below the level never reach stdlib handlers
+    - Events at or above the level are emitted
+    """
+    from api.logging_config import configure_structured_logging, get_logger
+
+    caplog.set_level("DEBUG")
+    try:
+        configure_structured_logging("WARNING")
+        logger = get_logger("test_level_filter")
+
+        logger.info("dropped_event")
+        logger.warning("kept_event")
+    finally:
+        configure_structured_logging()
+
+    messages = " ".join(record.getMessage() for record in caplog.records)
+    assert "dropped_event" not in messages
+    assert "kept_event" in messages
+
+
+def test_log_level_from_dotenv_reaches_structlog(tmp_path):
+    """
+    Test that LOG_LEVEL loaded from .env by api.main also sets structlog's level.
+
+    Runs in a subprocess so importing api.main cannot disturb this session.
+
+    Expected:
+    - A structlog debug event is emitted when .env sets LOG_LEVEL=DEBUG
+    """
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    script = """
+import os, pathlib, dotenv
+
+exists = pathlib.Path.exists
+pathlib.Path.exists = lambda self, *a, **k: self.name == ".env" or exists(self, *a, **k)
+
+def load_dotenv(path, override=False):
+    os.environ["LOG_LEVEL"] = "DEBUG"
+    return True
+
+dotenv.load_dotenv = load_dotenv
+
+import api.main
+from api.logging_config import get_logger
+
+get_logger("dotenv_probe").debug("dotenv_debug_event")
+"""
+    env = {k: v for k, v in os.environ.items() if k != "LOG_LEVEL"}
+    env["DUCKDB_PATH"] = str(tmp_path / "cache.db")
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "dotenv_debug_event" in result.stderr
+
+
+def test_background_log_writer_relays_to_original_handlers():
+    """
+    Test that the background writer moves root handlers behind a queue.
+
+    Expected:
+    - Records reach the original handler once the listener drains
+    - A second call is a no-op
+    - A full queue drops its oldest record instead of blocking
+    """
+    import atexit
+    import io
+    import logging
+    import queue
+
+    from api.logging_config import (
+        _DropOldestQueueHandler,
+        start_background_log_writer,
+    )
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    stream = io.StringIO()
+    root.handlers = [logging.StreamHandler(stream)]
+    root.setLevel(logging.INFO)
+    try:
+        listener = start_background_log_writer()
+        assert listener is not None
+        assert start_background_log_writer() is None
+
+        logging.getLogger("test_module").info("queued_event")
+        atexit.unregister(listener.stop)
+        listener.stop()
+        assert "queued_event" in stream.getvalue()
+    finally:
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+
+    log_queue = queue.Queue(2)
+    handler = _DropOldestQueueHandler(log_queue)
+    for msg in ("first", "second", "third"):
+        handler.emit(logging.makeLogRecord({"msg": msg}))
+    assert [log_queue.get_nowait().msg for _ in range(2)] == ["second", "third"]
+
+
+def test_background_log_writer_stops_with_full_queue():
+    """
+    Test that stopping the writer with a full queue still drains it.
+
+    Expected:
+    - stop() does not raise queue.Full and joins the listener thread
+    - Buffered records reach the original handler; the oldest is evicted
+    """
+    import atexit
+    import logging
+    import threading
+
+    from api.logging_config import start_background_log_writer
+
+    entered, release = threading.Event(), threading.Event()
+    written = []
+
+    class BlockingHandler(logging.Handler):
+        def emit(self, record):
+            entered.set()
+            release.wait(5)
+            written.append(record.getMessage())
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    root.handlers = [BlockingHandler()]
+    root.setLevel(logging.INFO)
+    try:
+        listener = start_background_log_writer(maxsize=2)
+        atexit.unregister(listener.stop)
+
+        logger = logging.getLogger("test_module")
+        logger.info("first")
+        assert entered.wait(5)
+        for msg in ("second", "third"):
+            logger.info(msg)
+        assert listener.queue.full()
+
+        threading.Timer(0.2, release.set).start()
+        listener.stop()
+    finally:
+        release.set()
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+
+    assert listener._thread is None
+    assert written == ["first", "third"]
+
+
 def test_correlation_id_in_log_context():
     """
     Test that correlation_id is automatically included in log context.
@@ -257,6 +452,26 @@ def test_correlation_id_in_log_context():
 # =============================================================================
 
 
+def test_get_logger_is_cached_per_configuration():
+    """
+    Test that get_logger reuses one logger per name until reconfigured.
+
+    Expected:
+    - Same name returns the same logger object
+    - configure_structured_logging drops loggers from the old configuration
+    """
+    from api.logging_config import configure_structured_logging, get_logger
+
+    configure_structured_logging()
+    logger = get_logger("test_module")
+
+    assert get_logger("test_module") is logger
+    assert get_logger("other_module") is not logger
+
+    configure_structured_logging()
+    assert get_logger("test_module") is not logger
+
+
 def test_get_logger_with_empty_name():
     """
     Test get_logger with empty string as name.
@@ -23,6 +23,32 @@ from live.shared.models import (
 )
 
 
+# Valid model fields; validation tests override one field at a time
+VALID_PROCESSED_TX = {
+    "txid": "a" * 64,
+    "amounts": [0.001, 0.002],
+    "timestamp": 1678901234.567,
+    "input_count": 2,
+    "output_count": 2,
+}
+
+VALID_MEMPOOL_STATE = {
+    "price": 113600.50,
+    "confidence": 0.87,
+    "active_tx_count": 4309,
+    "total_received": 12543,
+    "total_filtered": 8234,
+    "uptime_seconds": 3600.5,
+}
+
+VALID_SYSTEM_STATS = {
+    "total_received": 12543,
+    "total_filtered": 8234,
+    "active_in_window": 4309,
+    "uptime_seconds": 3600.5,
+}
+
+
 # =============================================================================
 # RawTransaction Tests (T011)
 # =============================================================================
@@ -100,153 +126,55 @@ def test_processed_transaction_with_fee_rate():
     assert tx.fee_rate == 25.5
 
 
-def test_processed_transaction_invalid_txid_length():
-    """Test ProcessedTransaction rejects invalid txid length"""
-    with pytest.raises(ValueError, match="txid must be 64-character hex string"):
-        ProcessedTransaction(
-            txid="abc",  # Too short
-            amounts=[0.001, 0.002],
-            timestamp=1678901234.567,
-            input_count=2,
-            output_count=2,
-        )
-
-
-def test_processed_transaction_invalid_txid_chars():
-    """Test ProcessedTransaction rejects non-hex characters in txid"""
-    with pytest.raises(ValueError, match="txid must be valid hex string"):
-        ProcessedTransaction(
-            txid="g" * 64,  # 'g' is not hex
-            amounts=[0.001, 0.002],
-            timestamp=1678901234.567,
-            input_count=2,
-            output_count=2,
-        )
-
-
-def test_processed_transaction_empty_amounts():
-    """Test ProcessedTransaction rejects empty amounts list"""
-    with pytest.raises(ValueError, match="amounts must be non-empty list"):
-        ProcessedTransaction(
-            txid="a" * 64,
-            amounts=[],
-            timestamp=1678901234.567,
-            input_count=2,
-            output_count=2,
-        )
-
-
-def test_processed_transaction_amount_range_validation():
-    """Test ProcessedTransaction enforces amount range [1e-5, 1e5] BTC"""
-    # Valid range
-    tx = ProcessedTransaction(
-        txid="a" * 64,
-        amounts=[1e-5, 1e5],  # Min and max bounds
-        timestamp=1678901234.567,
-        input_count=2,
-        output_count=2,
-    )
-    assert tx.amounts == [1e-5, 1e5]
-
-    # Too small
-    with pytest.raises(ValueError, match="all amounts must be in range"):
-        ProcessedTransaction(
-            txid="a" * 64,
-            amounts=[1e-6],  # Below minimum
-            timestamp=1678901234.567,
-            input_count=1,
-            output_count=2,
-        )
-
-    # Too large
-    with pytest.raises(ValueError, match="all amounts must be in range"):
-        ProcessedTransaction(
-            txid="a" * 64,
-            amounts=[1e6],  # Above maximum
-            timestamp=1678901234.567,
-            input_count=1,
-            output_count=2,
-        )
-
-
-def test_processed_transaction_input_count_validation():
-    """Test ProcessedTransaction enforces input_count in [1, 5]"""
-    # Valid range
-    for count in [1, 2, 3, 4, 5]:
-        tx = ProcessedTransaction(
-            txid="a" * 64,
-            amounts=[0.001, 0.002],
-            timestamp=1678901234.567,
-            input_count=count,
-            output_count=2,
-        )
-        assert tx.input_count == count
-
-    # Invalid: 0 inputs
-    with pytest.raises(ValueError, match="input_count must be in range"):
-        ProcessedTransaction(
-            txid="a" * 64,
-            amounts=[0.001, 0.002],
-            timestamp=1678901234.567,
-            input_count=0,
-            output_count=2,
-        )
-
-    # Invalid: >5 inputs
-    with pytest.raises(ValueError, match="input_count must be in range"):
-        ProcessedTransaction(
-            txid="a" * 64,
-            amounts=[0.001, 0.002],
-            timestamp=1678901234.567,
-            input_count=6,
-            output_count=2,
-        )
-
-
-def test_processed_transaction_output_count_validation():
-    """Test ProcessedTransaction enforces exactly 2 outputs"""
-    # Valid: 2 outputs
-    tx = ProcessedTransaction(
-        txid="a" * 64,
-        amounts=[0.001, 0.002],
-        timestamp=1678901234.567,
-        input_count=2,
-        output_count=2,
-    )
-    assert tx.output_count == 2
-
-    # Invalid: 1 output
-    with pytest.raises(ValueError, match="output_count must be exactly 2"):
-        ProcessedTransaction(
-            txid="a" * 64,
-            amounts=[0.001],
-            timestamp=1678901234.567,
-            input_count=2,
-            output_count=1,
-        )
-
-    # Invalid: 3 outputs
-    with pytest.raises(ValueError, match="output_count must be exactly 2"):
-        ProcessedTransaction(
-            txid="a" * 64,
-            amounts=[0.001, 0.002, 0.003],
-            timestamp=1678901234.567,
-            input_count=2,
-            output_count=3,
-        )
-
-
-def test_processed_transaction_negative_fee_rate():
-    """Test ProcessedTransaction rejects negative fee_rate"""
-    with pytest.raises(ValueError, match="fee_rate must be positive"):
-        ProcessedTransaction(
-            txid="a" * 64,
-            amounts=[0.001, 0.002],
-            timestamp=1678901234.567,
-            fee_rate=-10.0,
-            input_count=2,
-            output_count=2,
-        )
+@pytest.mark.parametrize(
+    "override,match",
+    [
+        ({"txid": "abc"}, "txid must be 64-character hex string"),
+        ({"txid": "g" * 64}, "txid must be valid hex string"),
+        ({"amounts": []}, "amounts must be non-empty list"),
+        ({"amounts": [1e-6], "input_count": 1}, "all amounts must be in range"),
+        ({"amounts": [1e6], "input_count": 1}, "all amounts must be in range"),
+        ({"input_count": 0}, "input_count must be in range"),
+        ({"input_count": 6}, "input_count must be in range"),
+        ({"amounts": [0.001], "output_count": 1}, "output_count must be exactly 2"),
+        (
+            {"amounts": [0.001, 0.002, 0.003], "output_count": 3},
+            "output_count must be exactly 2",
+        ),
+        ({"fee_rate": -10.0}, "fee_rate must be positive"),
+    ],
+    ids=[
+        "txid_length",
+        "txid_chars",
+        "empty_amounts",
+        "amount_too_small",
+        "amount_too_large",
+        "zero_inputs",
+        "too_many_inputs",
+        "one_output",
+        "three_outputs",
+        "negative_fee_rate",
+    ],
+)
+def test_processed_transaction_rejects_invalid(override, match):
+    """Test ProcessedTransaction validation rejects each invalid field"""
+    with pytest.raises(ValueError, match=match):
+        ProcessedTransaction(**{**VALID_PROCESSED_TX, **override})
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"amounts": [1e-5, 1e5]},  # Min and max amount bounds
+        *({"input_count": count} for count in [1, 2, 3, 4, 5]),
+        {"output_count": 2},
+    ],
+)
+def test_processed_transaction_accepts_valid_bounds(override):
+    """Test ProcessedTransaction accepts amounts in [1e-5, 1e5], 1-5 inputs, 2 outputs"""
+    tx = ProcessedTransaction(**{**VALID_PROCESSED_TX, **override})
+    for field, value in override.items():
+        assert getattr(tx, field) == value
 
 
 # =============================================================================
@@ -256,144 +184,68 @@ def test_processed_transaction_negative_fee_rate():
 
 def test_mempool_state_creation():
     """Test MempoolState with valid data"""
-    state = MempoolState(
-        price=113600.50,
-        confidence=0.87,
-        active_tx_count=4309,
-        total_received=12543,
-        total_filtered=8234,
-        uptime_seconds=3600.5,
-    )
+    state = MempoolState(**VALID_MEMPOOL_STATE)
     assert state.price == 113600.50
     assert state.confidence == 0.87
     assert state.active_tx_count == 4309
-
-
-def test_mempool_state_invalid_price():
-    """Test MempoolState rejects non-positive price"""
-    with pytest.raises(ValueError, match="price must be positive"):
-        MempoolState(
-            price=0,
-            confidence=0.87,
-            active_tx_count=4309,
-            total_received=12543,
-            total_filtered=8234,
-            uptime_seconds=3600.5,
-        )
-
-    with pytest.raises(ValueError, match="price must be positive"):
-        MempoolState(
-            price=-100.0,
-            confidence=0.87,
-            active_tx_count=4309,
-            total_received=12543,
-            total_filtered=8234,
-            uptime_seconds=3600.5,
-        )
-
-
-def test_mempool_state_confidence_range():
-    """Test MempoolState enforces confidence in [0.0, 1.0]"""
-    # Valid bounds
-    state_min = MempoolState(
-        price=113600.50,
-        confidence=0.0,
-        active_tx_count=0,
-        total_received=0,
-        total_filtered=0,
-        uptime_seconds=1.0,
-    )
-    assert state_min.confidence == 0.0
-
-    state_max = MempoolState(
-        price=113600.50,
-        confidence=1.0,
-        active_tx_count=10000,
-        total_received=20000,
-        total_filtered=10000,
-        uptime_seconds=3600.5,
-    )
-    assert state_max.confidence == 1.0
-
-    # Below range
-    with pytest.raises(ValueError, match="confidence must be in range"):
-        MempoolState(
-            price=113600.50,
-            confidence=-0.1,
-            active_tx_count=4309,
-            total_received=12543,
-            total_filtered=8234,
-            uptime_seconds=3600.5,
-        )
-
-    # Above range
-    with pytest.raises(ValueError, match="confidence must be in range"):
-        MempoolState(
-            price=113600.50,
-            confidence=1.1,
-            active_tx_count=4309,
-            total_received=12543,
-            total_filtered=8234,
-            uptime_seconds=3600.5,
-        )
-
-
-def test_mempool_state_total_received_vs_filtered():
-    """Test MempoolState enforces total_received >= total_filtered"""
-    # Valid: received >= filtered
-    state = MempoolState(
-        price=113600.50,
-        confidence=0.87,
-        active_tx_count=4309,
-        total_received=12543,
-        total_filtered=8234,
-        uptime_seconds=3600.5,
-    )
     assert state.total_received >= state.total_filtered
 
-    # Invalid: filtered > received
-    with pytest.raises(ValueError, match="total_received must be >= total_filtered"):
-        MempoolState(
-            price=113600.50,
-            confidence=0.87,
-            active_tx_count=4309,
-            total_received=8234,
-            total_filtered=12543,
-            uptime_seconds=3600.5,
-        )
-
 
-def test_mempool_state_negative_counts():
-    """Test MempoolState rejects negative counts"""
-    with pytest.raises(ValueError, match="active_tx_count must be non-negative"):
-        MempoolState(
-            price=113600.50,
-            confidence=0.87,
-            active_tx_count=-1,
-            total_received=12543,
-            total_filtered=8234,
-            uptime_seconds=3600.5,
-        )
-
-    with pytest.raises(ValueError, match="total_received must be non-negative"):
-        MempoolState(
-            price=113600.50,
-            confidence=0.87,
-            active_tx_count=4309,
-            total_received=-1,
-            total_filtered=8234,
-            uptime_seconds=3600.5,
-        )
-
-    with pytest.raises(ValueError, match="total_filtered must be non-negative"):
-        MempoolState(
-            price=113600.50,
-            confidence=0.87,
-            active_tx_count=4309,
-            total_received=12543,
-            total_filtered=-1,
-            uptime_seconds=3600.5,
-        )
+@pytest.mark.parametrize(
+    "override",
+    [
+        {
+            "confidence": 0.0,
+            "active_tx_count": 0,
+            "total_received": 0,
+            "total_filtered": 0,
+            "uptime_seconds": 1.0,
+        },
+        {
+            "confidence": 1.0,
+            "active_tx_count": 10000,
+            "total_received": 20000,
+            "total_filtered": 10000,
+        },
+    ],
+    ids=["confidence_min", "confidence_max"],
+)
+def test_mempool_state_accepts_confidence_bounds(override):
+    """Test MempoolState accepts confidence at both ends of [0.0, 1.0]"""
+    state = MempoolState(**{**VALID_MEMPOOL_STATE, **override})
+    assert state.confidence == override["confidence"]
+
+
+@pytest.mark.parametrize(
+    "override,match",
+    [
+        ({"price": 0}, "price must be positive"),
+        ({"price": -100.0}, "price must be positive"),
+        ({"confidence": -0.1}, "confidence must be in range"),
+        ({"confidence": 1.1}, "confidence must be in range"),
+        (
+            {"total_received": 8234, "total_filtered": 12543},
+            "total_received must be >= total_filtered",
+        ),
+        ({"active_tx_count": -1}, "active_tx_count must be non-negative"),
+        ({"total_received": -1}, "total_received must be non-negative"),
+        ({"total_filtered": -1}, "total_filtered must be non-negative"),
+    ],
+    ids=[
+        "zero_price",
+        "negative_price",
+        "confidence_below_range",
+        "confidence_above_range",
+        "filtered_exceeds_received",
+        "negative_active_tx_count",
+        "negative_total_received",
+        "negative_total_filtered",
+    ],
+)
+def test_mempool_state_rejects_invalid(override, match):
+    """Test MempoolState validation rejects each invalid field"""
+    with pytest.raises(ValueError, match=match):
+        MempoolState(**{**VALID_MEMPOOL_STATE, **override})
 
 
 # =============================================================================
@@ -401,25 +253,25 @@ def test_mempool_state_negative_counts():
 # =============================================================================
 
 
-def test_confidence_score_low_range():
-    """Test confidence calculation for low transaction count (0-100)"""
-    assert calculate_confidence(0) == 0.0
-    assert 0.0 <= calculate_confidence(50) <= 0.3
-    assert calculate_confidence(100) == 0.3
-
-
-def test_confidence_score_medium_range():
-    """Test confidence calculation for medium transaction count (100-1000)"""
-    assert 0.3 <= calculate_confidence(500) <= 0.8
-    conf_at_1000 = calculate_confidence(1000)
-    assert 0.79 <= conf_at_1000 <= 0.81  # Should be close to 0.8
-
-
-def test_confidence_score_high_range():
-    """Test confidence calculation for high transaction count (1000+)"""
-    assert 0.8 <= calculate_confidence(2000) <= 1.0
-    assert 0.8 <= calculate_confidence(5000) <= 1.0
-    assert calculate_confidence(10000) <= 1.0  # Should cap at 1.0
+@pytest.mark.parametrize(
+    "count,lo,hi",
+    [
+        # Low range (0-100 tx)
+        (0, 0.0, 0.0),
+        (50, 0.0, 0.3),
+        (100, 0.3, 0.3),
+        # Medium range (100-1000 tx); close to 0.8 at 1000
+        (500, 0.3, 0.8),
+        (1000, 0.79, 0.81),
+        # High range (1000+ tx); capped at 1.0
+        (2000, 0.8, 1.0),
+        (5000, 0.8, 1.0),
+        (10000, 0.0, 1.0),
+    ],
+)
+def test_confidence_score_range(count, lo, hi):
+    """Test confidence calculation stays within the range for each tx count"""
+    assert lo <= calculate_confidence(count) <= hi
 
 
 def test_confidence_score_monotonic():
@@ -427,10 +279,7 @@ def test_confidence_score_monotonic():
     counts = [0, 50, 100, 500, 1000, 2000, 5000]
     confidences = [calculate_confidence(c) for c in counts]
 
-    for i in range(len(confidences) - 1):
-        assert confidences[i] <= confidences[i + 1], (
-            f"Non-monotonic at counts {counts[i]}, {counts[i + 1]}"
-        )
+    assert confidences == sorted(confidences)
 
 
 # =============================================================================
@@ -462,12 +311,7 @@ def test_transaction_point_validation():
 
 def test_system_stats_creation():
     """Test SystemStats Pydantic model"""
-    stats = SystemStats(
-        total_received=12543,
-        total_filtered=8234,
-        active_in_window=4309,
-        uptime_seconds=3600.5,
-    )
+    stats = SystemStats(**VALID_SYSTEM_STATS)
     assert stats.total_received == 12543
     assert stats.total_filtered == 8234
     assert stats.active_in_window == 4309
@@ -477,21 +321,13 @@ def test_system_stats_creation():
 def test_system_stats_filtered_validation():
     """Test SystemStats enforces total_filtered <= total_received"""
     # Valid
-    stats = SystemStats(
-        total_received=12543,
-        total_filtered=8234,
-        active_in_window=4309,
-        uptime_seconds=3600.5,
-    )
+    stats = SystemStats(**VALID_SYSTEM_STATS)
     assert stats.total_filtered <= stats.total_received
 
     # Invalid: filtered > received
     with pytest.raises(ValueError, match="total_filtered cannot exceed total_received"):
         SystemStats(
-            total_received=8234,
-            total_filtered=12543,
-            active_in_window=4309,
-            uptime_seconds=3600.5,
+            **{**VALID_SYSTEM_STATS, "total_received": 8234, "total_filtered": 12543}
         )
 
 
@@ -504,12 +340,7 @@ def test_mempool_update_data_creation():
             TransactionPoint(timestamp=1678901234.1, price=113500.0),
             TransactionPoint(timestamp=1678901234.2, price=113700.0),
         ],
-        stats=SystemStats(
-            total_received=12543,
-            total_filtered=8234,
-            active_in_window=4309,
-            uptime_seconds=3600.5,
-        ),
+        stats=SystemStats(**VALID_SYSTEM_STATS),
         timestamp=1678901234.567,
     )
     assert data.price == 113600.50
@@ -522,12 +353,7 @@ def test_mempool_update_data_empty_transactions():
         price=113600.50,
         confidence=0.87,
         transactions=[],
-        stats=SystemStats(
-            total_received=12543,
-            total_filtered=8234,
-            active_in_window=4309,
-            uptime_seconds=3600.5,
-        ),
+        stats=SystemStats(**VALID_SYSTEM_STATS),
         timestamp=1678901234.567,
     )
     assert data.transactions == []
@@ -540,12 +366,7 @@ def test_websocket_message_creation():
             price=113600.50,
             confidence=0.87,
             transactions=[],
-            stats=SystemStats(
-                total_received=12543,
-                total_filtered=8234,
-                active_in_window=4309,
-                uptime_seconds=3600.5,
-            ),
+            stats=SystemStats(**VALID_SYSTEM_STATS),
             timestamp=1678901234.567,
         )
     )
@@ -563,12 +384,7 @@ def test_websocket_message_serialization():
                 TransactionPoint(timestamp=1678901234.1, price=113500.0),
                 TransactionPoint(timestamp=1678901234.2, price=113700.0),
             ],
-            stats=SystemStats(
-                total_received=12543,
-                total_filtered=8234,
-                active_in_window=4309,
-                uptime_seconds=3600.5,
-            ),
+            stats=SystemStats(**VALID_SYSTEM_STATS),
             timestamp=1678901234.567,
         )
     )
@@ -599,12 +415,7 @@ def test_websocket_message_validation():
                 price=-100.0,  # Invalid
                 confidence=0.87,
                 transactions=[],
-                stats=SystemStats(
-                    total_received=12543,
-                    total_filtered=8234,
-                    active_in_window=4309,
-                    uptime_seconds=3600.5,
-                ),
+                stats=SystemStats(**VALID_SYSTEM_STATS),
                 timestamp=1678901234.567,
             )
         )
@@ -616,12 +427,7 @@ def test_websocket_message_validation():
                 price=113600.50,
                 confidence=1.5,  # Invalid
                 transactions=[],
-                stats=SystemStats(
-                    total_received=12543,
-                    total_filtered=8234,
-                    active_in_window=4309,
-                    uptime_seconds=3600.5,
-                ),
+                stats=SystemStats(**VALID_SYSTEM_STATS),
                 timestamp=1678901234.567,
             )
         )
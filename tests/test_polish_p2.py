@@ -8,20 +8,51 @@ Coverage areas:
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+import re
 
 # Import ServiceCheck for creating proper mock return values
 from api.main import ServiceCheck
 
 
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def health_mocks(monkeypatch):
+    """
+    Stub the database and service checks behind /health.
+
+    Defaults to every service healthy; tests adjust the returned mocks.
+    Without this, tests that only inspect headers would wait on real
+    connection retries whenever DuckDB or the backends are unavailable.
+    """
+    db_conn = MagicMock()
+    db_conn.execute.return_value.fetchone.return_value = (1,)
+    db_conn.execute.return_value.fetchall.return_value = []
+
+    mocks = SimpleNamespace(
+        electrs=AsyncMock(return_value=ServiceCheck(status="ok", latency_ms=15.2)),
+        mempool=AsyncMock(return_value=ServiceCheck(status="ok", latency_ms=22.5)),
+        db=MagicMock(return_value=db_conn),
+        db_conn=db_conn,
+    )
+    monkeypatch.setattr("api.main.check_electrs_connectivity", mocks.electrs)
+    monkeypatch.setattr("api.main.check_mempool_backend", mocks.mempool)
+    monkeypatch.setattr("api.main.get_db_connection", mocks.db)
+    return mocks
+
+
 # =============================================================================
 # Task 1: Enhanced /health Endpoint Tests
 # =============================================================================
 
 
 @pytest.mark.asyncio
-async def test_health_endpoint_all_services_healthy(client):
+async def test_health_endpoint_all_services_healthy(client, health_mocks):
     """
     Test /health endpoint when all services are healthy.
 
@@ -31,50 +62,41 @@ async def test_health_endpoint_all_services_healthy(client):
     - checks.electrs.status: "ok"
     - checks.mempool_backend.status: "ok"
     """
-    with (
-        patch("api.main.check_electrs_connectivity") as mock_electrs,
-        patch("api.main.check_mempool_backend") as mock_mempool,
-        patch("api.main.get_db_connection") as mock_db,
-    ):
-        # Mock all services as healthy - return ServiceCheck objects directly
-        mock_electrs.return_value = ServiceCheck(
-            status="ok", latency_ms=15.2, last_success="2025-11-18T10:00:00"
-        )
-        mock_mempool.return_value = ServiceCheck(
-            status="ok", latency_ms=22.5, last_success="2025-11-18T10:00:00"
-        )
-        mock_db_conn = MagicMock()
-        mock_db_conn.execute.return_value.fetchone.return_value = (1,)
-        mock_db_conn.execute.return_value.fetchall.return_value = []
-        mock_db.return_value = mock_db_conn
+    # Mock all services as healthy - return ServiceCheck objects directly
+    health_mocks.electrs.return_value = ServiceCheck(
+        status="ok", latency_ms=15.2, last_success="2025-11-18T10:00:00"
+    )
+    health_mocks.mempool.return_value = ServiceCheck(
+        status="ok", latency_ms=22.5, last_success="2025-11-18T10:00:00"
+    )
 
-        response = client.get("/health")
+    response = client.get("/health")
 
-        assert response.status_code == 200
-        data = response.json()
+    assert response.status_code == 200
+    data = response.json()
 
-        # Check overall status
-        assert data["status"] == "healthy"
+    # Check overall status
+    assert data["status"] == "healthy"
 
-        # Check service checks exist
-        assert "checks" in data
-        assert "database" in data["checks"]
-        assert "electrs" in data["checks"]
-        assert "mempool_backend" in data["checks"]
+    # Check service checks exist
+    assert "checks" in data
+    assert "database" in data["checks"]
+    assert "electrs" in data["checks"]
+    assert "mempool_backend" in data["checks"]
 
-        # Verify all services are OK
-        assert data["checks"]["database"]["status"] == "ok"
-        assert data["checks"]["electrs"]["status"] == "ok"
-        assert data["checks"]["mempool_backend"]["status"] == "ok"
+    # Verify all services are OK
+    assert data["checks"]["database"]["status"] == "ok"
+    assert data["checks"]["electrs"]["status"] == "ok"
+    assert data["checks"]["mempool_backend"]["status"] == "ok"
 
-        # Verify backward compatibility
-        assert "database" in data  # Legacy field
-        assert "uptime_seconds" in data
-        assert "timestamp" in data
+    # Verify backward compatibility
+    assert "database" in data  # Legacy field
+    assert "uptime_seconds" in data
+    assert "timestamp" in data
 
 
 @pytest.mark.asyncio
-async def test_health_endpoint_database_offline(client):
+async def test_health_endpoint_database_offline(client, health_mocks):
     """
     Test /health endpoint when database is offline (critical service).
 
@@ -82,31 +104,22 @@ async def test_health_endpoint_database_offline(client):
     - overall status: "unhealthy"
     - checks.database.status: "error"
     """
-    with (
-        patch("api.main.check_electrs_connectivity") as mock_electrs,
-        patch("api.main.check_mempool_backend") as mock_mempool,
-        patch("api.main.get_db_connection") as mock_db,
-    ):
-        # Mock healthy external services
-        mock_electrs.return_value = ServiceCheck(status="ok", latency_ms=15.2)
-        mock_mempool.return_value = ServiceCheck(status="ok", latency_ms=22.5)
-
-        # Mock database offline
-        mock_db.side_effect = Exception("Database connection failed")
+    # Mock database offline (external services stay healthy)
+    health_mocks.db.side_effect = Exception("Database connection failed")
 
-        response = client.get("/health")
+    response = client.get("/health")
 
-        assert response.status_code == 200
-        data = response.json()
+    assert response.status_code == 200
+    data = response.json()
 
-        # Database offline is critical
-        assert data["status"] == "unhealthy"
-        assert data["checks"]["database"]["status"] == "error"
-        assert "Database connection failed" in data["checks"]["database"]["error"]
+    # Database offline is critical
+    assert data["status"] == "unhealthy"
+    assert data["checks"]["database"]["status"] == "error"
+    assert "Database connection failed" in data["checks"]["database"]["error"]
 
 
 @pytest.mark.asyncio
-async def test_health_endpoint_electrs_timeout(client):
+async def test_health_endpoint_electrs_timeout(client, health_mocks):
     """
     Test /health endpoint when electrs is timing out (non-critical).
 
@@ -114,38 +127,24 @@ async def test_health_endpoint_electrs_timeout(client):
     - overall status: "degraded" (not unhealthy)
     - checks.electrs.status: "error" or "timeout"
     """
-    with (
-        patch("api.main.check_electrs_connectivity") as mock_electrs,
-        patch("api.main.check_mempool_backend") as mock_mempool,
-        patch("api.main.get_db_connection") as mock_db,
-    ):
-        # Mock database healthy
-        mock_db_conn = MagicMock()
-        mock_db_conn.execute.return_value.fetchone.return_value = (1,)
-        mock_db_conn.execute.return_value.fetchall.return_value = []
-        mock_db.return_value = mock_db_conn
-
-        # Mock mempool backend healthy
-        mock_mempool.return_value = ServiceCheck(status="ok", latency_ms=22.5)
-
-        # Mock electrs timing out
-        mock_electrs.return_value = ServiceCheck(
-            status="timeout", error="Request timeout (>2s)"
-        )
+    # Mock electrs timing out (database and mempool backend stay healthy)
+    health_mocks.electrs.return_value = ServiceCheck(
+        status="timeout", error="Request timeout (>2s)"
+    )
 
-        response = client.get("/health")
+    response = client.get("/health")
 
-        assert response.status_code == 200
-        data = response.json()
+    assert response.status_code == 200
+    data = response.json()
 
-        # Non-critical service down = degraded
-        assert data["status"] == "degraded"
-        assert data["checks"]["electrs"]["status"] in ["error", "timeout"]
-        assert data["checks"]["database"]["status"] == "ok"
+    # Non-critical service down = degraded
+    assert data["status"] == "degraded"
+    assert data["checks"]["electrs"]["status"] in ["error", "timeout"]
+    assert data["checks"]["database"]["status"] == "ok"
 
 
 @pytest.mark.asyncio
-async def test_health_endpoint_latency_tracking(client):
+async def test_health_endpoint_latency_tracking(client, health_mocks):
     """
     Test that health endpoint tracks service latency correctly.
 
@@ -153,33 +152,24 @@ async def test_health_endpoint_latency_tracking(client):
     - latency_ms present for successful checks
     - latency_ms is a positive float
     """
-    with (
-        patch("api.main.check_electrs_connectivity") as mock_electrs,
-        patch("api.main.check_mempool_backend") as mock_mempool,
-        patch("api.main.get_db_connection") as mock_db,
-    ):
-        # Mock all services with latency
-        mock_electrs.return_value = ServiceCheck(
-            status="ok", latency_ms=12.34, last_success="2025-11-18T10:00:00"
-        )
-        mock_mempool.return_value = ServiceCheck(
-            status="ok", latency_ms=45.67, last_success="2025-11-18T10:00:00"
-        )
-        mock_db_conn = MagicMock()
-        mock_db_conn.execute.return_value.fetchone.return_value = (1,)
-        mock_db_conn.execute.return_value.fetchall.return_value = []
-        mock_db.return_value = mock_db_conn
+    # Mock all services with latency
+    health_mocks.electrs.return_value = ServiceCheck(
+        status="ok", latency_ms=12.34, last_success="2025-11-18T10:00:00"
+    )
+    health_mocks.mempool.return_value = ServiceCheck(
+        status="ok", latency_ms=45.67, last_success="2025-11-18T10:00:00"
+    )
 
-        response = client.get("/health")
+    response = client.get("/health")
 
-        assert response.status_code == 200
-        data = response.json()
+    assert response.status_code == 200
+    data = response.json()
 
-        # Verify latency tracking
-        assert data["checks"]["electrs"]["latency_ms"] == 12.34
-        assert data["checks"]["mempool_backend"]["latency_ms"] == 45.67
-        assert data["checks"]["database"]["latency_ms"] is not None
-        assert data["checks"]["database"]["latency_ms"] > 0
+    # Verify latency tracking
+    assert data["checks"]["electrs"]["latency_ms"] == 12.34
+    assert data["checks"]["mempool_backend"]["latency_ms"] == 45.67
+    assert data["checks"]["database"]["latency_ms"] is not None
+    assert data["checks"]["database"]["latency_ms"] > 0
 
 
 # =============================================================================
@@ -193,20 +183,16 @@ def test_correlation_id_auto_generated(client):
 
     Expected:
     - X-Correlation-ID header in response
-    - Header value is a valid UUID
+    - Header value is 128 random bits as 32 lowercase hex characters
     """
     response = client.get("/health")
 
     assert response.status_code == 200
     assert "X-Correlation-ID" in response.headers
 
-    # Verify it's a valid UUID
+    # Verify it's 128 random bits, hex-encoded
     correlation_id = response.headers["X-Correlation-ID"]
-    try:
-        uuid_obj = uuid.UUID(correlation_id)
-        assert str(uuid_obj) == correlation_id  # Valid UUID format
-    except ValueError:
-        pytest.fail(f"Invalid UUID format: {correlation_id}")
+    assert re.fullmatch(r"[0-9a-f]{32}", correlation_id), correlation_id
 
 
 def test_correlation_id_preserved_from_request(client):
@@ -246,7 +232,7 @@ def test_correlation_id_different_across_requests(client):
 
 
 @pytest.mark.asyncio
-async def test_health_endpoint_handles_malformed_db_response(client):
+async def test_health_endpoint_handles_malformed_db_response(client, health_mocks):
     """
     Test /health endpoint handles malformed database responses gracefully.
 
@@ -254,29 +240,18 @@ async def test_health_endpoint_handles_malformed_db_response(client):
     - Does not crash
     - Returns error status for database
     """
-    with (
-        patch("api.main.check_electrs_connectivity") as mock_electrs,
-        patch("api.main.check_mempool_backend") as mock_mempool,
-        patch("api.main.get_db_connection") as mock_db,
-    ):
-        # Mock healthy external services
-        mock_electrs.return_value = ServiceCheck(status="ok", latency_ms=15.2)
-        mock_mempool.return_value = ServiceCheck(status="ok", latency_ms=22.5)
-
-        # Mock database returning unexpected data
-        mock_db_conn = MagicMock()
-        mock_db_conn.execute.return_value.fetchone.side_effect = TypeError(
-            "Unexpected type"
-        )
-        mock_db.return_value = mock_db_conn
+    # Mock database returning unexpected data (external services stay healthy)
+    health_mocks.db_conn.execute.return_value.fetchone.side_effect = TypeError(
+        "Unexpected type"
+    )
 
-        response = client.get("/health")
+    response = client.get("/health")
 
-        # Should not crash, but report error
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] in ["degraded", "unhealthy"]
-        assert data["checks"]["database"]["status"] == "error"
+    # Should not crash, but report error
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] in ["degraded", "unhealthy"]
+    assert data["checks"]["database"]["status"] == "error"
 
 
 def test_health_endpoint_concurrent_requests(client):